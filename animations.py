@@ -0,0 +1,154 @@
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt, QPointF
+from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QWidget
+
+DEFAULT_FPS = 30
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+class PixmapLayer(QWidget):
+    """Widget that only blits cached pixmaps, with an animatable opacity and offset
+
+    An optional outgoing pixmap is drawn underneath the current one so
+    cross-fades and slides never have to re-layout the real widgets.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._pixmap = None
+        self.opacity = 1.0
+        self.offset = QPointF(0, 0)
+        self.outgoing_pixmap = None
+        self.outgoing_opacity = 0.0
+        self.outgoing_offset = QPointF(0, 0)
+
+    def setPixmap(self, pixmap):
+        self._pixmap = pixmap
+        self.update()
+
+    def pixmap(self):
+        return self._pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.outgoing_pixmap is not None and self.outgoing_opacity > 0:
+            painter.setOpacity(self.outgoing_opacity)
+            painter.drawPixmap(self.outgoing_offset, self.outgoing_pixmap)
+        if self._pixmap is not None and self.opacity > 0:
+            painter.setOpacity(self.opacity)
+            painter.drawPixmap(self.offset, self._pixmap)
+        painter.end()
+
+
+class Animation:
+    def __init__(self, layer, duration_ms, step, on_finished, easing):
+        self.layer = layer
+        self.duration = max(duration_ms, 1) / 1000.0
+        self.step = step
+        self.on_finished = on_finished
+        self.easing = easing
+        self.start_time = time.monotonic()
+        self.frames_drawn = 0
+
+
+class AnimationEngine(QObject):
+    """Runs pixmap layer animations off a single fixed-rate frame timer
+
+    Progress comes from the wall clock rather than from counting ticks, so a
+    busy event loop makes animations skip frames instead of slowing down.
+    Each layer runs at most one animation; starting another on the same layer
+    cancels the first, which is what back-to-back singer changes need.
+    """
+
+    def __init__(self, parent=None, fps=DEFAULT_FPS):
+        super().__init__(parent)
+        self.frame_interval = 1.0 / fps
+        self._animations = {}
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(int(self.frame_interval * 1000))
+        self._timer.timeout.connect(self._tick)
+
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+    def animate(self, layer, duration_ms, step, on_finished=None, easing=ease_out_cubic):
+        """Call step(progress) every frame until progress reaches 1.0"""
+        self.cancel(layer)
+        animation = Animation(layer, duration_ms, step, on_finished, easing)
+        self._animations[id(layer)] = animation
+        step(0.0)
+        layer.update()
+        if not self._timer.isActive():
+            self._timer.start()
+        return animation
+
+    def fade(self, layer, start, end, duration_ms, on_finished=None):
+        def step(t):
+            layer.opacity = start + (end - start) * t
+        return self.animate(layer, duration_ms, step, on_finished)
+
+    def slide(self, layer, outgoing_pixmap, distance, duration_ms, on_finished=None):
+        """Move the current pixmap up into place while the outgoing one slides out above it"""
+        layer.outgoing_pixmap = outgoing_pixmap
+
+        def step(t):
+            layer.outgoing_offset = QPointF(0, -distance * t)
+            layer.outgoing_opacity = 1.0 - t
+            layer.offset = QPointF(0, distance * (1.0 - t))
+            layer.opacity = t
+
+        def finished():
+            layer.outgoing_pixmap = None
+            if on_finished:
+                on_finished()
+        return self.animate(layer, duration_ms, step, finished)
+
+    def is_animating(self, layer):
+        return id(layer) in self._animations
+
+    def cancel(self, layer, finish=False):
+        """Stop the layer's animation, optionally jumping to its final frame"""
+        animation = self._animations.pop(id(layer), None)
+        if animation is None:
+            return
+        if finish:
+            animation.step(1.0)
+            layer.update()
+            if animation.on_finished:
+                animation.on_finished()
+        if not self._animations:
+            self._timer.stop()
+
+    def cancel_all(self):
+        for animation in list(self._animations.values()):
+            self.cancel(animation.layer)
+
+    def _tick(self):
+        now = time.monotonic()
+        for key, animation in list(self._animations.items()):
+            elapsed = now - animation.start_time
+            progress = min(elapsed / animation.duration, 1.0)
+
+            # Frames the timer should have produced by now but didn't get to
+            frames_due = int(elapsed / self.frame_interval)
+            if frames_due > animation.frames_drawn + 1:
+                self.frames_skipped += frames_due - animation.frames_drawn - 1
+            animation.frames_drawn = max(frames_due, animation.frames_drawn + 1)
+            self.frames_drawn += 1
+
+            animation.step(animation.easing(progress))
+            animation.layer.update()
+
+            if progress >= 1.0 and self._animations.get(key) is animation:
+                del self._animations[key]
+                if animation.on_finished:
+                    animation.on_finished()
+
+        if not self._animations:
+            self._timer.stop()
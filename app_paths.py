@@ -0,0 +1,18 @@
+import os
+import platform
+from pathlib import Path
+
+
+def get_app_data_dir():
+    """Get the OS-specific application data directory"""
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        app_dir = Path.home() / "Library" / "Application Support" / "OpenKJ-Next-Singer-Display"
+    elif system == "Windows":
+        app_dir = Path(os.environ.get('APPDATA', Path.home())) / "OpenKJ-Next-Singer-Display"
+    else:  # Linux and others
+        app_dir = Path.home() / ".local" / "share" / "OpenKJ-Next-Singer-Display"
+    
+    # Create directory if it doesn't exist
+    app_dir.mkdir(parents=True, exist_ok=True)
+    return app_dir
@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+import subprocess
+from pathlib import Path
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from snapshot_bus import SnapshotSubscriber, bus_is_running
+from rotation_collector import EXIT_BUS_IN_USE
+
+HANG_TIMEOUT = 10.0  # Seconds of silence (no snapshot or heartbeat) before the collector is restarted
+ORPHAN_TIMEOUT = 2.0  # Seconds without any publisher on the bus before starting our own
+WATCHDOG_INTERVAL_MS = 1000
+MAX_RESTART_DELAY = 30.0
+
+
+class CollectorSupervisor(QObject):
+    """Subscribes the display to the snapshot bus, starting rotation_collector.py if nobody else has
+
+    Every display window and the web server on the machine can share one
+    collector: the first to need it spawns it, later ones just subscribe.
+    The subscriber thread emits messages as signals, which Qt delivers on
+    the GUI thread. latest_snapshot always holds the last good snapshot, so
+    the display keeps showing it while the collector is stalled, crashed or
+    being restarted. A watchdog restarts our own collector when it exits or
+    goes silent for hang_timeout seconds, backing off if it keeps failing,
+    and takes over the bus if another program's collector goes away.
+    """
+    snapshot_received = pyqtSignal(dict)
+    error_received = pyqtSignal(str)
+
+    def __init__(self, db_path, use_mirror=False, hang_timeout=HANG_TIMEOUT, parent=None):
+        super().__init__(parent)
+        self.db_path = os.path.abspath(db_path)
+        self.use_mirror = use_mirror
+        self.hang_timeout = hang_timeout
+
+        self.latest_snapshot = None
+        self.last_error = None
+        self.restarts = 0
+        self._process = None
+        self._last_message = 0.0
+        self._next_start = 0.0
+        self._failures = 0
+        self._subscriber = SnapshotSubscriber(self._on_bus_message)
+
+        self.snapshot_received.connect(self._on_snapshot)
+        self.error_received.connect(self._on_error)
+        self._watchdog = QTimer(self)
+        self._watchdog.timeout.connect(self._check)
+
+    def start(self):
+        self._last_message = time.monotonic()
+        if not bus_is_running():
+            self._spawn()
+        self._subscriber.start()
+        self._watchdog.start(WATCHDOG_INTERVAL_MS)
+
+    def stop(self):
+        self._subscriber.stop()
+        self._watchdog.stop()
+        self._kill()
+
+    def is_for(self, db_path, use_mirror):
+        return self.db_path == os.path.abspath(db_path) and self.use_mirror == use_mirror
+
+    def owns_collector(self):
+        return self._process is not None
+
+    def message_age(self):
+        return time.monotonic() - self._last_message
+
+    def _spawn(self):
+        command = [sys.executable, str(Path(__file__).with_name('rotation_collector.py')),
+                   '--db', self.db_path]
+        if self.use_mirror:
+            command.append('--mirror')
+        # Startup gets the same grace period as a hang
+        self._last_message = time.monotonic()
+        try:
+            self._process = subprocess.Popen(command)
+        except OSError as e:
+            print(f"Warning: Could not start the rotation collector: {e}")
+            self._back_off(self._last_message)
+            return False
+        return True
+
+    def _back_off(self, now):
+        # Back off if it keeps failing; a collector that ran fine for a while restarts at once
+        self._failures += 1
+        self._next_start = now + min(2 ** (self._failures - 1) - 1, MAX_RESTART_DELAY)
+
+    def _kill(self, force=False):
+        if self._process is None:
+            return
+        if self._process.poll() is None and force:
+            # A hung collector won't act on a polite terminate; don't stall the GUI thread waiting
+            self._process.kill()
+            self._process.wait()
+        elif self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        self._process = None
+
+    def _check(self):
+        now = time.monotonic()
+        if self._process is None:
+            # Another program's collector is serving us; take over only if it's gone or hung
+            orphaned = not self._subscriber.connected and self.message_age() > ORPHAN_TIMEOUT
+            if (orphaned or self.message_age() > self.hang_timeout) and now >= self._next_start:
+                if self._spawn():
+                    self.restarts += 1
+            return
+
+        exited = self._process.poll() is not None
+        if exited and self._process.returncode == EXIT_BUS_IN_USE:
+            # Another display spawned one at the same moment; subscribe to that one instead
+            self._process = None
+            self._last_message = now
+            self._next_start = now + self.hang_timeout
+            return
+        hung = self.message_age() > self.hang_timeout
+        if not exited and not hung:
+            return
+        reason = f"exited with code {self._process.returncode}" if exited else \
+            f"sent nothing for {self.message_age():.0f}s"
+        print(f"Warning: Rotation collector {reason}; restarting it.")
+        self._kill(force=True)
+        self._back_off(now)
+
+    def _on_bus_message(self, message):
+        """Runs on the subscriber thread"""
+        self._last_message = time.monotonic()
+        if message.get('db_path') != self.db_path:
+            self.error_received.emit(f"The snapshot bus is publishing {message.get('db_path')}, "
+                                     f"not {self.db_path}")
+        elif message['type'] == 'snapshot':
+            self.snapshot_received.emit(message)
+        elif message['type'] == 'error':
+            self.error_received.emit(message['message'])
+
+    def _on_snapshot(self, snapshot):
+        self.latest_snapshot = snapshot
+        self.last_error = None
+        self._failures = 0
+
+    def _on_error(self, message):
+        self.last_error = message
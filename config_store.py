@@ -0,0 +1,227 @@
+import os
+import json
+import copy
+import threading
+import atexit
+from pathlib import Path
+
+
+def merge_with_defaults(config, defaults):
+    """Merge a loaded config over the defaults, deep-merging nested dicts such as fonts"""
+    merged = copy.deepcopy(defaults)
+    for key, value in config.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class ConfigStore:
+    """Crash-safe JSON config persistence.
+
+    Writes go to a temporary file that is fsynced and then renamed over the
+    real file, so a crash mid-write never leaves a truncated config behind.
+    The previous good file is kept as a rolling backup (config.json.bak,
+    config.json.bak.1, ...) and is used when the primary file is unreadable.
+    Rapid saves are coalesced into a single write, and the file can be
+    watched so edits made by another instance or a deployment script are
+    picked up without a restart.
+    """
+
+    def __init__(self, path, defaults, debounce=0.5, backup_count=1, logger=None):
+        self.path = Path(path)
+        self.defaults = defaults
+        self.debounce = debounce
+        self.backup_count = max(0, backup_count)
+        self.logger = logger
+
+        self._lock = threading.RLock()
+        self._pending = None
+        self._save_timer = None
+        self._last_signature = None
+
+        self._watch_thread = None
+        self._watch_stop = threading.Event()
+        self._listeners = []
+
+        # Never lose a pending save on a normal interpreter exit
+        atexit.register(self.flush)
+
+    # Loading
+
+    def backup_path(self, index=0):
+        suffix = '.bak' if index == 0 else f'.bak.{index}'
+        return self.path.with_name(self.path.name + suffix)
+
+    def load(self):
+        """Return the current config merged over the defaults
+
+        A save that is still waiting to be written wins over the file on disk.
+        If the primary file is missing or corrupt, the backups are tried in
+        order before falling back to the defaults.
+        """
+        with self._lock:
+            if self._pending is not None:
+                return merge_with_defaults(self._pending, self.defaults)
+
+        candidates = [self.path] + [self.backup_path(i) for i in range(self.backup_count)]
+        for candidate in candidates:
+            config = self._read(candidate)
+            if config is not None:
+                if candidate != self.path:
+                    self._log('warning', f"Config file {self.path} unreadable, recovered from {candidate}")
+                return merge_with_defaults(config, self.defaults)
+        return copy.deepcopy(self.defaults)
+
+    def _read(self, path):
+        try:
+            with open(path, 'r') as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self._log('error', f"Error reading config {path}: {e}")
+            return None
+        if not isinstance(config, dict):
+            self._log('error', f"Error reading config {path}: not a JSON object")
+            return None
+        return config
+
+    # Saving
+
+    def save(self, config):
+        """Schedule config to be written; saves within the debounce window are coalesced"""
+        with self._lock:
+            self._pending = copy.deepcopy(config)
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            if self.debounce <= 0:
+                self._save_timer = None
+            else:
+                self._save_timer = threading.Timer(self.debounce, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        """Write any pending save to disk immediately"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            config = self._pending
+            if config is None:
+                return
+            try:
+                self._write_atomic(config)
+            except OSError as e:
+                # Keep the save pending so the next flush retries it
+                self._log('error', f"Error saving config: {e}")
+                return
+            self._pending = None
+
+    def _write_atomic(self, config):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(config, indent=4).encode('utf-8')
+
+        if self.path.exists() and self.backup_count:
+            self._rotate_backups()
+
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self._write_file(tmp_path, data)
+        os.replace(tmp_path, self.path)
+        self._fsync_dir()
+        self._last_signature = self._signature()
+        self._log('info', "Configuration saved successfully.")
+
+    def _rotate_backups(self):
+        for i in range(self.backup_count - 1, 0, -1):
+            older = self.backup_path(i - 1)
+            if older.exists():
+                os.replace(older, self.backup_path(i))
+        # Only keep a backup of a file that actually parses
+        if self._read(self.path) is not None:
+            tmp_path = self.path.with_name(f".{self.path.name}.bak.{os.getpid()}.tmp")
+            self._write_file(tmp_path, self.path.read_bytes())
+            os.replace(tmp_path, self.backup_path(0))
+
+    @staticmethod
+    def _write_file(path, data):
+        with open(path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _fsync_dir(self):
+        # Persist the rename itself; directories can't be opened on Windows
+        if os.name != 'posix':
+            return
+        try:
+            fd = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # Watching
+
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def watch(self, callback, interval=1.0):
+        """Call callback(config) whenever the file is changed by someone else
+
+        The callback runs on the watcher thread, so GUI code must marshal it
+        back to the GUI thread (e.g. through a Qt signal).
+        """
+        with self._lock:
+            self._listeners.append(callback)
+            if self._watch_thread is not None:
+                return
+            self._last_signature = self._signature()
+            self._watch_stop.clear()
+            self._watch_thread = threading.Thread(target=self._watch_loop, args=(interval,), daemon=True)
+            self._watch_thread.start()
+
+    def stop_watching(self):
+        self._watch_stop.set()
+        with self._lock:
+            self._listeners.clear()
+            self._watch_thread = None
+
+    def _watch_loop(self, interval):
+        while not self._watch_stop.wait(interval):
+            signature = self._signature()
+            with self._lock:
+                if signature == self._last_signature or signature is None:
+                    continue
+                self._last_signature = signature
+                # A local save in flight is newer than whatever is on disk
+                if self._pending is not None:
+                    continue
+                listeners = list(self._listeners)
+            config = self._read(self.path)
+            if config is None:
+                # Half-written by a non-atomic editor; pick it up on the next change
+                continue
+            self._log('info', f"Config file {self.path} changed externally, reloading.")
+            merged = merge_with_defaults(config, self.defaults)
+            for listener in listeners:
+                try:
+                    listener(copy.deepcopy(merged))
+                except Exception as e:
+                    self._log('error', f"Error in config change listener: {e}")
+
+    def _log(self, level, message):
+        if self.logger:
+            getattr(self.logger, level)(message)
+        elif level != 'info':
+            print(f"Warning: {message}")
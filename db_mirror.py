@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+
+# Only what the display and server read; everything else stays in OpenKJ's file
+MIRRORED_TABLES = ('rotationSingers', 'queueSongs', 'dbSongs')
+
+
+class RotationMirror:
+    """In-memory snapshot of the rotation-relevant parts of openkj.sqlite
+
+    OpenKJ writes to its database all night, and readers holding shared locks
+    at the wrong moment stall those writes. The mirror reads the source only
+    when PRAGMA data_version says something was committed, copies
+    rotationSingers, the unplayed queueSongs and just the dbSongs rows they
+    reference inside one short read transaction, and builds the snapshot
+    after the source lock is released. Queries then run against private
+    copies of the snapshot made with the SQLite backup API, so they never
+    touch the source file at all.
+    """
+
+    def __init__(self, source_path):
+        self.source_path = source_path
+        self._lock = threading.Lock()
+        self._source_conn = None
+        self._data_version = None
+        self._schema = None
+        self._snapshot = None
+        self._library_signature = None  # MAX(rowid) of the source's dbSongs at the last sync
+        self.syncs = 0
+
+    def sync(self):
+        """Refresh the snapshot if the source changed; returns True if it did"""
+        with self._lock:
+            try:
+                if self._source_conn is None:
+                    # Autocommit mode so we control exactly how long the read lock is held
+                    self._source_conn = sqlite3.connect(self.source_path, isolation_level=None,
+                                                        check_same_thread=False)
+                data_version = self._source_conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self._data_version and self._snapshot is not None:
+                    return False
+                tables, library_signature = self._read_source()
+            except sqlite3.Error:
+                self._close_source()
+                raise
+            previous, self._snapshot = self._snapshot, self._build_snapshot(tables)
+            if previous is not None:
+                # Free the old copy now rather than whenever the garbage collector gets to it
+                previous.close()
+            self._library_signature = library_signature
+            self._data_version = data_version
+            self.syncs += 1
+            return True
+
+    def _read_source(self):
+        conn = self._source_conn
+        if self._schema is None:
+            placeholders = ','.join('?' * len(MIRRORED_TABLES))
+            self._schema = conn.execute(
+                f"SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+                MIRRORED_TABLES
+            ).fetchall()
+
+        # One read transaction keeps the three tables consistent with each other
+        conn.execute("BEGIN")
+        try:
+            singers = conn.execute("SELECT * FROM rotationSingers").fetchall()
+            queue = conn.execute("SELECT * FROM queueSongs WHERE played = 0").fetchall()
+            songs = conn.execute("""
+                SELECT * FROM dbSongs
+                WHERE songid IN (SELECT song FROM queueSongs WHERE played = 0)
+            """).fetchall()
+            # An index seek, for the song cache to tell when songs were added
+            library_signature = conn.execute("SELECT MAX(rowid) FROM dbSongs").fetchone()[0]
+        finally:
+            conn.execute("COMMIT")
+        return {'rotationSingers': singers, 'queueSongs': queue, 'dbSongs': songs}, library_signature
+
+    def _build_snapshot(self, tables):
+        snapshot = sqlite3.connect(':memory:', check_same_thread=False)
+        for name, sql in self._schema:
+            snapshot.execute(sql)
+            rows = tables[name]
+            if rows:
+                placeholders = ','.join('?' * len(rows[0]))
+                snapshot.executemany(f"INSERT INTO {name} VALUES ({placeholders})", rows)
+        snapshot.execute("CREATE INDEX IF NOT EXISTS mirror_queue_singer ON queueSongs (singer, position)")
+        snapshot.commit()
+        return snapshot
+
+    def library_state(self, queued_songs_sql):
+        """(sync count, dbSongs signature, queued_songs_sql's rows) as of the last sync, from the snapshot"""
+        with self._lock:
+            if self._snapshot is None:
+                raise sqlite3.OperationalError("mirror hasn't synced yet")
+            return self.syncs, self._library_signature, self._snapshot.execute(queued_songs_sql).fetchall()
+
+    def connect(self):
+        """Return a new private connection holding a copy of the latest snapshot"""
+        conn = sqlite3.connect(':memory:', check_same_thread=False)
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot.backup(conn)
+        return conn
+
+    def _close_source(self):
+        if self._source_conn is not None:
+            self._source_conn.close()
+        self._source_conn = None
+        self._data_version = None
+        self._schema = None
+
+    def close(self):
+        with self._lock:
+            self._close_source()
+            if self._snapshot is not None:
+                self._snapshot.close()
+            self._snapshot = None
+
+
+_mirrors = {}
+_mirrors_lock = threading.Lock()
+
+
+def get_mirror(source_path):
+    """Return the shared mirror for a source database, creating it on first use"""
+    with _mirrors_lock:
+        mirror = _mirrors.get(source_path)
+        if mirror is None:
+            mirror = _mirrors[source_path] = RotationMirror(source_path)
+        return mirror
+
+
+def connect_rotation_db(db_path, use_mirror=False):
+    """Open a connection for rotation queries, via the mirror when enabled"""
+    if not use_mirror:
+        return sqlite3.connect(db_path)
+    mirror = get_mirror(db_path)
+    mirror.sync()
+    return mirror.connect()
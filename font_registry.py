@@ -0,0 +1,88 @@
+from pathlib import Path
+from PyQt6.QtGui import QFont, QFontDatabase
+
+FONT_SUFFIXES = ('.ttf', '.otf', '.ttc', '.otc')
+BUNDLED_FONT_DIR = Path(__file__).with_name('fonts')
+
+
+class FontRegistry:
+    """Font files loaded into Qt once, and one QFont per font config entry
+
+    Fonts dropped into the font directories (the bundled fonts/ folder and
+    media/fonts in the app data directory) are registered with
+    QFontDatabase at startup, so they look the same on every display PC.
+    font() resolves a config entry's family once and caches the QFont; a
+    family that isn't available falls back to the system font with a
+    single warning instead of Qt searching for it on every restyle. Font
+    files are loaded on first use, which must come after the QApplication
+    is created.
+    """
+
+    def __init__(self, font_dirs=()):
+        self.font_dirs = [Path(d) for d in font_dirs]
+        self._loaded = {}  # font file -> families it provides
+        self._fonts = {}  # (family, size, bold, italic) -> QFont
+        self._resolved = {}  # configured family -> family actually used
+        self._families = None  # Installed and loaded families, listed once
+        self._scanned = False
+
+    def add_font_dir(self, font_dir):
+        self.font_dirs.append(Path(font_dir))
+        self._scanned = False
+
+    def load_fonts(self):
+        """Register font files not loaded yet; returns the families they added"""
+        added = []
+        self._scanned = True
+        for font_dir in self.font_dirs:
+            if not font_dir.is_dir():
+                continue
+            for path in sorted(font_dir.iterdir()):
+                if path.suffix.lower() not in FONT_SUFFIXES or path in self._loaded:
+                    continue
+                font_id = QFontDatabase.addApplicationFont(str(path))
+                if font_id < 0:
+                    print(f"Warning: Could not load font file {path}")
+                    self._loaded[path] = []
+                    continue
+                self._loaded[path] = QFontDatabase.applicationFontFamilies(font_id)
+                added.extend(self._loaded[path])
+        if added:
+            # A family that fell back before may exist now
+            self._families = None
+            self._resolved.clear()
+            self._fonts.clear()
+        return added
+
+    def resolve_family(self, family):
+        if family not in self._resolved:
+            if self._families is None:
+                self._families = set(QFontDatabase.families())
+            if family in self._families:
+                self._resolved[family] = family
+            else:
+                fallback = QFontDatabase.systemFont(QFontDatabase.SystemFont.GeneralFont).family()
+                print(f"Warning: Font '{family}' is not installed; using '{fallback}' instead.")
+                self._resolved[family] = fallback
+        return self._resolved[family]
+
+    def font(self, font_config):
+        """The QFont for a font config entry (family, size in px, bold, italic)"""
+        if not self._scanned:
+            self.load_fonts()
+        key = (font_config.get('family', 'Arial'), font_config.get('size', 24),
+               font_config.get('bold', False), font_config.get('italic', False))
+        font = self._fonts.get(key)
+        if font is None:
+            family, size, bold, italic = key
+            font = QFont(self.resolve_family(family))
+            font.setPixelSize(size)
+            font.setBold(bold)
+            font.setItalic(italic)
+            self._fonts[key] = font
+        # A copy, so callers can't change the cached font
+        return QFont(font)
+
+
+# Shared by every window; main.py adds the media font directory
+font_registry = FontRegistry([BUNDLED_FONT_DIR])
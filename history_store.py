@@ -0,0 +1,216 @@
+import sys
+import json
+import time
+import queue
+import atexit
+import sqlite3
+import threading
+from app_paths import get_app_data_dir
+
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_BATCH_SIZE = 500
+MAX_PENDING_EVENTS = 10000
+CLOSE_TIMEOUT = 10  # Seconds close() waits for the writer before giving up on what's queued
+HISTORY_FILE_NAME = 'history.sqlite'  # In the app data directory
+# Gaps between a singer's turns longer than this span two different nights
+MAX_TURN_GAP_SECONDS = 6 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS singer_changes (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    singer_id INTEGER,
+    singer_name TEXT,
+    song TEXT,
+    previous_singer_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_singer_changes_ts ON singer_changes (ts);
+CREATE INDEX IF NOT EXISTS idx_singer_changes_singer ON singer_changes (singer_name, ts);
+
+CREATE TABLE IF NOT EXISTS rotation_snapshots (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    singer_count INTEGER NOT NULL,
+    rotation TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rotation_snapshots_ts ON rotation_snapshots (ts);
+"""
+
+
+class HistoryStore:
+    """Append-only log of rotation snapshots and singer changes
+
+    record_*() only put the event on a queue, so the display's refresh path
+    never waits on disk. A writer thread drains the queue every
+    flush_interval seconds (or sooner once batch_size events are waiting) and
+    writes the whole batch in one transaction to a WAL-mode database, so
+    analytics reads never block the writer either. Snapshots identical to the
+    previous one are skipped. If the writer falls far behind, new events are
+    dropped and counted rather than growing memory without bound.
+    """
+
+    def __init__(self, path, flush_interval=DEFAULT_FLUSH_INTERVAL, batch_size=DEFAULT_BATCH_SIZE, logger=None):
+        self.path = str(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.logger = logger
+        self._queue = queue.Queue(maxsize=MAX_PENDING_EVENTS)
+        self._last_rotation = None
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+
+        self._thread = threading.Thread(target=self._writer, name="history-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record_singer_change(self, singer_id, singer_name, song, previous_singer_id=None):
+        self._put(('change', time.time(), (singer_id, singer_name, song, previous_singer_id)))
+
+    def record_snapshot(self, rotation):
+        """Queue a rotation snapshot: a list of (singer_id, singer_name, song) tuples"""
+        self._put(('snapshot', time.time(), [list(entry) for entry in rotation]))
+
+    def _put(self, event):
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _writer(self):
+        conn = None
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+            except queue.Empty:
+                pass
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch and batch[-1] is None:
+                batch.pop()
+                stop = True
+
+            if batch:
+                try:
+                    if conn is None:
+                        conn = self._connect()
+                    self._write_batch(conn, batch)
+                except sqlite3.Error as e:
+                    self._log(f"Could not write rotation history: {e}")
+                    if conn is not None:
+                        conn.close()
+                        conn = None
+            if stop:
+                break
+        if conn is not None:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL is durable across application crashes, and fsyncs only at checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _write_batch(self, conn, batch):
+        changes = []
+        snapshots = []
+        for kind, ts, data in batch:
+            if kind == 'change':
+                changes.append((ts, *data))
+            elif data != self._last_rotation:
+                self._last_rotation = data
+                snapshots.append((ts, len(data), json.dumps(data)))
+
+        with conn:
+            conn.executemany(
+                "INSERT INTO singer_changes (ts, singer_id, singer_name, song, previous_singer_id) "
+                "VALUES (?, ?, ?, ?, ?)", changes)
+            conn.executemany(
+                "INSERT INTO rotation_snapshots (ts, singer_count, rotation) VALUES (?, ?, ?)", snapshots)
+        self.written += len(changes) + len(snapshots)
+
+    def close(self):
+        """Write out everything still queued and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._thread.is_alive():
+            return
+        try:
+            # A full queue means the writer is stuck; don't hang shutdown waiting for room
+            self._queue.put(None, timeout=CLOSE_TIMEOUT)
+        except queue.Full:
+            self._log(f"Rotation history writer not responding; {self._queue.qsize()} events not written")
+            return
+        self._thread.join(timeout=CLOSE_TIMEOUT)
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.warning(message)
+        else:
+            print(f"Warning: {message}")
+
+
+def connect_history(path):
+    """Read-only connection for analytics; safe to use while the display is writing"""
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def songs_per_hour(conn, since=0):
+    """[(hour, songs)] for each local clock hour with at least one singer change"""
+    return conn.execute(
+        "SELECT strftime('%Y-%m-%d %H:00', ts, 'unixepoch', 'localtime') AS hour, COUNT(*) "
+        "FROM singer_changes WHERE ts >= ? GROUP BY hour ORDER BY hour", (since,)).fetchall()
+
+
+def average_wait_per_singer(conn, since=0):
+    """[(singer_name, turns, average minutes between turns)], longest wait first"""
+    return conn.execute(
+        "SELECT singer_name, COUNT(*) + 1, AVG(gap) / 60.0 FROM ("
+        "  SELECT singer_name, ts - LAG(ts) OVER (PARTITION BY singer_name ORDER BY ts) AS gap"
+        "  FROM singer_changes WHERE ts >= ?"
+        ") WHERE gap IS NOT NULL AND gap <= ? "
+        "GROUP BY singer_name ORDER BY 3 DESC", (since, MAX_TURN_GAP_SECONDS)).fetchall()
+
+
+def busiest_periods(conn, since=0, limit=10):
+    """[(weekday, hour, average songs)] over the nights in the log, busiest first
+
+    weekday is 0 for Sunday, as in SQLite's strftime('%w').
+    """
+    return conn.execute(
+        "SELECT weekday, hour, CAST(SUM(songs) AS REAL) / COUNT(*) FROM ("
+        "  SELECT CAST(strftime('%w', ts, 'unixepoch', 'localtime') AS INTEGER) AS weekday,"
+        "         CAST(strftime('%H', ts, 'unixepoch', 'localtime') AS INTEGER) AS hour,"
+        "         strftime('%Y-%m-%d', ts, 'unixepoch', 'localtime') AS day, COUNT(*) AS songs"
+        "  FROM singer_changes WHERE ts >= ? GROUP BY day, hour"
+        ") GROUP BY weekday, hour ORDER BY 3 DESC LIMIT ?", (since, limit)).fetchall()
+
+
+if __name__ == '__main__':
+    # Nightly report: python history_store.py [path/to/history.sqlite] [days]
+    path = sys.argv[1] if len(sys.argv) > 1 else get_app_data_dir() / HISTORY_FILE_NAME
+    days = float(sys.argv[2]) if len(sys.argv) > 2 else 1
+    since = time.time() - days * 86400
+    conn = connect_history(path)
+
+    print("Songs per hour:")
+    for hour, songs in songs_per_hour(conn, since):
+        print(f"  {hour}  {songs}")
+    print("Average wait between turns:")
+    for singer_name, turns, minutes in average_wait_per_singer(conn, since):
+        print(f"  {singer_name}: {minutes:.0f} min over {turns} turns")
+    print("Busiest periods:")
+    weekdays = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+    for weekday, hour, songs in busiest_periods(conn, since):
+        print(f"  {weekdays[weekday]} {hour:02d}:00  {songs:.1f} songs")
+    conn.close()
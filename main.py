@@ -1,44 +1,52 @@
 import sys
 import os
-import json
-import sqlite3
 import datetime
+import time
 import platform
-import shutil
-from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget,
     QFileDialog, QMessageBox, QSpinBox, QHBoxLayout, QPushButton,
     QSizePolicy, QFrame, QLineEdit, QStatusBar, QGraphicsDropShadowEffect, QMenu,
     QFormLayout, QCheckBox, QComboBox, QGroupBox, QFontComboBox, QColorDialog,
-    QScrollArea, QGridLayout, QTabWidget, QDialog, QDialogButtonBox
+    QScrollArea, QGridLayout, QTabWidget, QDialog, QDialogButtonBox, QGraphicsScene, QGraphicsPixmapItem
 )
-from PyQt6.QtCore import Qt, QFileSystemWatcher, QTimer, pyqtSignal, QTime, QEvent
-from PyQt6.QtGui import QFont, QPixmap, QColor, QAction, QCursor, QMovie
-
-def get_app_data_dir():
-    """Get the OS-specific application data directory"""
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        app_dir = Path.home() / "Library" / "Application Support" / "OpenKJ-Next-Singer-Display"
-    elif system == "Windows":
-        app_dir = Path(os.environ.get('APPDATA', Path.home())) / "OpenKJ-Next-Singer-Display"
-    else:  # Linux and others
-        app_dir = Path.home() / ".local" / "share" / "OpenKJ-Next-Singer-Display"
-    
-    # Create directory if it doesn't exist
-    app_dir.mkdir(parents=True, exist_ok=True)
-    return app_dir
+from PyQt6.QtCore import (
+    Qt, QFileSystemWatcher, QTimer, pyqtSignal, QTime, QEvent, QObject, QRect, QRectF, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QFont, QPixmap, QColor, QAction, QCursor, QMovie, QImage, QPainter, QFontMetrics, QPalette
+from config_store import ConfigStore
+from song_cache import song_cache
+from animations import AnimationEngine, PixmapLayer
+from text_fit import FitLabel
+from font_registry import font_registry
+from theme_manager import theme_manager, DEFAULT_THEME
+from up_next_view import UpNextView
+from refresh_scheduler import scheduler_from_config
+from render_metrics import RepaintCounter
+from history_store import HistoryStore, HISTORY_FILE_NAME
+from wait_times import WaitEstimator, format_wait, DEFAULT_CHANGEOVER_SECONDS
+from media_import import MediaImportTask, largest_screen_size, THUMBNAIL_SIZE
+from rotation_source import open_rotation_source, format_song, RotationSourceError, FILE_DIALOG_FILTER
+from collector_link import CollectorSupervisor
+from rotation_stream import RemoteRotationSource, is_server_url
+from app_paths import get_app_data_dir
 
 # Get app data directory and config file path
 APP_DATA_DIR = get_app_data_dir()
 CONFIG_FILE = APP_DATA_DIR / 'config.json'
 MEDIA_DIR = APP_DATA_DIR / 'media'
+HISTORY_FILE = APP_DATA_DIR / HISTORY_FILE_NAME
+FONT_DIR = MEDIA_DIR / 'fonts'  # .ttf/.otf files here are loaded at startup
+font_registry.add_font_dir(FONT_DIR)
 
 # Create media directory if it doesn't exist
 MEDIA_DIR.mkdir(parents=True, exist_ok=True)
 
 DEFAULT_NUM_SINGERS = 5
+MAX_NUM_SINGERS = 500
+OVERLAY_FADE_MS = 400
+SLOT_TRANSITION_MS = 600
+WAIT_REFRESH_SECONDS = 30  # How often the wait texts count down; the web display uses the same
 DEFAULT_CONFIG = {
     'db_path': None,
     'num_singers': DEFAULT_NUM_SINGERS,
@@ -46,7 +54,17 @@ DEFAULT_CONFIG = {
     'logo_path': None,
     'venue_name': "Harry's Bar",
     'refresh_interval': 5,
+    'adaptive_refresh': True,  # Poll fast after changes, back off while idle
+    'refresh_min_interval': 1,
+    'refresh_max_interval': 30,
     'accepting_requests': True,
+    'db_mirror_enabled': False,  # Query an in-memory snapshot instead of the live OpenKJ database
+    'collector_enabled': False,  # Read the database in a separate, supervised process
+    'server_url': None,  # Follow a rotation server (main2.py), e.g. 'http://kj-booth:5000', instead of a database
+    'carousel_enabled': False,  # Page through the whole rotation instead of showing num_singers
+    'carousel_page_seconds': 8,
+    'show_wait_times': True,  # Estimated wait next to each up-next singer
+    'changeover_seconds': DEFAULT_CHANGEOVER_SECONDS,  # Allowance between singers for wait estimates
     # Background settings
     'background_color': '#161619',
     'background_image': None,
@@ -63,36 +81,24 @@ DEFAULT_CONFIG = {
     'font_up_next_song': {'family': 'Arial', 'size': 20, 'bold': False, 'italic': True},
     # Overlay settings
     'overlay_enabled': True,
-    'overlay_duration': 20  # seconds
+    'overlay_duration': 20,  # seconds
+    'animations_enabled': True,
+    # Look of the config dialog: 'default' (style.qss) or 'dark_teal' (dark_teal22.qss)
+    'theme': DEFAULT_THEME,
+    # Low-power rendering for fanless display PCs
+    'low_power_mode': False,
+    'repaint_counter_enabled': False,
+    # Log singer changes and rotation snapshots to history.sqlite for analytics
+    'history_enabled': True
 }
 
+config_store = ConfigStore(CONFIG_FILE, DEFAULT_CONFIG)
+
 def load_config():
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                config_with_defaults = DEFAULT_CONFIG.copy()
-                
-                # Deep merge for font configurations
-                for key in config:
-                    if key.startswith('font_') and isinstance(config[key], dict):
-                        # Merge font config with defaults
-                        default_font = DEFAULT_CONFIG.get(key, {}).copy()
-                        default_font.update(config[key])
-                        config_with_defaults[key] = default_font
-                    else:
-                        config_with_defaults[key] = config[key]
-                
-                return config_with_defaults
-        except (json.JSONDecodeError, Exception):
-            # Config is corrupted, return defaults
-            return DEFAULT_CONFIG.copy()
-    else:
-        return DEFAULT_CONFIG.copy()
+    return config_store.load()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    config_store.save(config)
 
 
 class ConfigWindow(QDialog):
@@ -112,7 +118,19 @@ class ConfigWindow(QDialog):
         self.logo_path = config.get('logo_path', DEFAULT_CONFIG['logo_path'])
         self.venue_name = config.get('venue_name', DEFAULT_CONFIG['venue_name'])
         self.refresh_interval = config.get('refresh_interval', DEFAULT_CONFIG['refresh_interval'])
+        self.adaptive_refresh = config.get('adaptive_refresh', DEFAULT_CONFIG['adaptive_refresh'])
+        self.refresh_min_interval = config.get('refresh_min_interval', DEFAULT_CONFIG['refresh_min_interval'])
+        self.refresh_max_interval = config.get('refresh_max_interval', DEFAULT_CONFIG['refresh_max_interval'])
+        self.low_power_mode = config.get('low_power_mode', DEFAULT_CONFIG['low_power_mode'])
         self.accepting_requests = config.get('accepting_requests', DEFAULT_CONFIG['accepting_requests'])
+        self.db_mirror_enabled = config.get('db_mirror_enabled', DEFAULT_CONFIG['db_mirror_enabled'])
+        self.collector_enabled = config.get('collector_enabled', DEFAULT_CONFIG['collector_enabled'])
+        self.server_url = config.get('server_url', DEFAULT_CONFIG['server_url'])
+        self.carousel_enabled = config.get('carousel_enabled', DEFAULT_CONFIG['carousel_enabled'])
+        self.carousel_page_seconds = config.get('carousel_page_seconds', DEFAULT_CONFIG['carousel_page_seconds'])
+        self.show_wait_times = config.get('show_wait_times', DEFAULT_CONFIG['show_wait_times'])
+        self.changeover_seconds = config.get('changeover_seconds', DEFAULT_CONFIG['changeover_seconds'])
+        self.theme = config.get('theme', DEFAULT_CONFIG['theme'])
         
         # Background settings
         self.background_color = config.get('background_color', DEFAULT_CONFIG['background_color'])
@@ -133,6 +151,15 @@ class ConfigWindow(QDialog):
         # Overlay settings
         self.overlay_enabled = config.get('overlay_enabled', DEFAULT_CONFIG['overlay_enabled'])
         self.overlay_duration = config.get('overlay_duration', DEFAULT_CONFIG['overlay_duration'])
+        self.animations_enabled = config.get('animations_enabled', DEFAULT_CONFIG['animations_enabled'])
+
+        # Image imports and previews run on the thread pool; only the latest request per kind is applied
+        self.media_tasks = {}
+        self.media_pending = {}
+        self.media_request_count = 0
+
+        # Set when the config file changes on disk after this dialog read it (see save_config)
+        self.changed_on_disk = None
 
         self.initUI()
 
@@ -192,15 +219,8 @@ class ConfigWindow(QDialog):
         
         main_layout.addWidget(button_box)
         
-        # Load and apply the style.qss stylesheet to this dialog only
-        try:
-            qss_path = Path(__file__).parent / 'style.qss'
-            if qss_path.exists():
-                with open(qss_path, 'r') as f:
-                    stylesheet = f.read()
-                    self.setStyleSheet(stylesheet)
-        except Exception as e:
-            print(f"Warning: Could not load style.qss: {e}")
+        # Styled by the current theme (see ThemeManager), which is only parsed once
+        theme_manager.themed(self)
     
     def create_general_tab(self):
         """Create the general settings tab"""
@@ -225,25 +245,101 @@ class ConfigWindow(QDialog):
         
         # Number of Up Next Configuration
         self.num_singers_spinbox = QSpinBox()
-        self.num_singers_spinbox.setValue(self.num_singers)
         self.num_singers_spinbox.setMinimum(1)
-        self.num_singers_spinbox.setMaximum(6)
+        self.num_singers_spinbox.setMaximum(MAX_NUM_SINGERS)
+        self.num_singers_spinbox.setValue(self.num_singers)
         self.num_singers_spinbox.setMinimumWidth(100)
         basic_layout.addRow("Number of Up Next:", self.num_singers_spinbox)
         
+        # Rotation Carousel Configuration
+        self.carousel_enabled_checkbox = QCheckBox()
+        self.carousel_enabled_checkbox.setChecked(self.carousel_enabled)
+        self.carousel_enabled_checkbox.setToolTip("Page through the whole rotation when it doesn't fit on screen")
+        basic_layout.addRow("Page Through Full Rotation:", self.carousel_enabled_checkbox)
+        
+        self.carousel_page_spinbox = QSpinBox()
+        self.carousel_page_spinbox.setMinimum(3)
+        self.carousel_page_spinbox.setMaximum(60)
+        self.carousel_page_spinbox.setValue(self.carousel_page_seconds)
+        self.carousel_page_spinbox.setSuffix(" seconds")
+        self.carousel_page_spinbox.setMinimumWidth(100)
+        basic_layout.addRow("Page Interval:", self.carousel_page_spinbox)
+        
+        # Wait Time Configuration
+        self.show_wait_times_checkbox = QCheckBox()
+        self.show_wait_times_checkbox.setChecked(self.show_wait_times)
+        self.show_wait_times_checkbox.setToolTip("Estimate each up-next singer's wait from their queued song lengths")
+        basic_layout.addRow("Show Wait Times:", self.show_wait_times_checkbox)
+        
+        self.changeover_spinbox = QSpinBox()
+        self.changeover_spinbox.setMinimum(0)
+        self.changeover_spinbox.setMaximum(600)
+        self.changeover_spinbox.setValue(self.changeover_seconds)
+        self.changeover_spinbox.setSuffix(" seconds")
+        self.changeover_spinbox.setMinimumWidth(100)
+        self.changeover_spinbox.setToolTip("Time allowed between singers for the mic handoff and song load")
+        basic_layout.addRow("Changeover Allowance:", self.changeover_spinbox)
+        
         # Refresh Interval Configuration
         self.refresh_interval_spinbox = QSpinBox()
         self.refresh_interval_spinbox.setValue(self.refresh_interval)
         self.refresh_interval_spinbox.setMinimum(5)
         self.refresh_interval_spinbox.setMaximum(20)
         self.refresh_interval_spinbox.setMinimumWidth(100)
+        self.refresh_interval_spinbox.setToolTip("Used when Adaptive Refresh is off")
         basic_layout.addRow("Refresh Interval (seconds):", self.refresh_interval_spinbox)
         
+        # Adaptive Refresh Configuration
+        self.adaptive_refresh_checkbox = QCheckBox()
+        self.adaptive_refresh_checkbox.setChecked(self.adaptive_refresh)
+        self.adaptive_refresh_checkbox.setToolTip(
+            "Check quickly right after the rotation changes and back off while nothing happens,\n"
+            "instead of checking at the fixed refresh interval."
+        )
+        basic_layout.addRow("Adaptive Refresh:", self.adaptive_refresh_checkbox)
+
+        # Adaptive refresh bounds
+        self.refresh_min_spinbox = QSpinBox()
+        self.refresh_min_spinbox.setRange(1, 60)
+        self.refresh_min_spinbox.setValue(self.refresh_min_interval)
+        self.refresh_min_spinbox.setSuffix(" seconds")
+        self.refresh_min_spinbox.setMinimumWidth(100)
+        self.refresh_min_spinbox.setToolTip("How often Adaptive Refresh checks right after the rotation changed")
+        basic_layout.addRow("Fastest Refresh:", self.refresh_min_spinbox)
+
+        self.refresh_max_spinbox = QSpinBox()
+        self.refresh_max_spinbox.setRange(self.refresh_min_interval, 300)
+        self.refresh_max_spinbox.setValue(self.refresh_max_interval)
+        self.refresh_max_spinbox.setSuffix(" seconds")
+        self.refresh_max_spinbox.setMinimumWidth(100)
+        self.refresh_max_spinbox.setToolTip("The longest Adaptive Refresh waits between checks while nothing happens")
+        basic_layout.addRow("Slowest Refresh:", self.refresh_max_spinbox)
+        self.refresh_min_spinbox.valueChanged.connect(self.refresh_max_spinbox.setMinimum)
+
+        self.adaptive_refresh_checkbox.toggled.connect(self.update_refresh_controls)
+        self.update_refresh_controls()
+
+        # Low-Power Mode Configuration
+        self.low_power_checkbox = QCheckBox()
+        self.low_power_checkbox.setChecked(self.low_power_mode)
+        self.low_power_checkbox.setToolTip(
+            "Repaint as little as possible on fanless display PCs: the clock ticks once a minute\n"
+            "and the logo shadow is drawn once instead of on every repaint."
+        )
+        basic_layout.addRow("Low-Power Mode:", self.low_power_checkbox)
+        
         # Accepting Requests Configuration
         self.accepting_requests_checkbox = QCheckBox()
         self.accepting_requests_checkbox.setChecked(self.accepting_requests)
         basic_layout.addRow("Accepting Requests:", self.accepting_requests_checkbox)
         
+        # Settings Theme Configuration
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(theme_manager.theme_names())
+        self.theme_combo.setCurrentText(self.theme)
+        self.theme_combo.setToolTip("Look of this settings window (the display isn't affected)")
+        basic_layout.addRow("Settings Theme:", self.theme_combo)
+        
         basic_group.setLayout(basic_layout)
         layout.addWidget(basic_group)
         
@@ -266,6 +362,32 @@ class ConfigWindow(QDialog):
         db_hlayout.addWidget(locate_db_button)
         db_layout.addRow("OpenKJ Database:", db_widget)
         
+        # Rotation Server Configuration
+        self.server_url_input = QLineEdit(self.server_url or "")
+        self.server_url_input.setPlaceholderText("http://kj-booth:5000")
+        self.server_url_input.setToolTip(
+            "Show the rotation from the rotation server (main2.py) on another PC instead of\n"
+            "reading the database. Leave empty to read the database."
+        )
+        db_layout.addRow("Rotation Server URL:", self.server_url_input)
+        
+        # Snapshot Mirror Configuration
+        self.db_mirror_checkbox = QCheckBox()
+        self.db_mirror_checkbox.setChecked(self.db_mirror_enabled)
+        self.db_mirror_checkbox.setToolTip(
+            "Copy the rotation into memory when OpenKJ changes it and read from the copy,\n"
+            "so the display never holds locks on OpenKJ's database."
+        )
+        db_layout.addRow("Read From Snapshot Mirror:", self.db_mirror_checkbox)
+
+        self.collector_checkbox = QCheckBox()
+        self.collector_checkbox.setChecked(self.collector_enabled)
+        self.collector_checkbox.setToolTip(
+            "Read the database in a separate process. If it stalls or crashes, the display keeps\n"
+            "showing the last rotation while the reader is restarted."
+        )
+        db_layout.addRow("Read In Separate Process:", self.collector_checkbox)
+        
         db_group.setLayout(db_layout)
         layout.addWidget(db_group)
         
@@ -279,13 +401,16 @@ class ConfigWindow(QDialog):
         logo_widget = QWidget()
         logo_hlayout = QHBoxLayout(logo_widget)
         logo_hlayout.setContentsMargins(0, 0, 0, 0)
+        self.logo_thumbnail = self.create_thumbnail_label()
         self.logo_path_label_display = QLabel(os.path.basename(self.logo_path) if self.logo_path else "No logo selected")
         self.logo_path_label_display.setMinimumWidth(200)
         logo_button = QPushButton("Browse")
         logo_button.clicked.connect(self.browse_logo)
+        logo_hlayout.addWidget(self.logo_thumbnail)
         logo_hlayout.addWidget(self.logo_path_label_display, 1)
         logo_hlayout.addWidget(logo_button)
         logo_layout.addRow("Logo:", logo_widget)
+        self.start_media_task('logo', self.logo_path)
         
         logo_group.setLayout(logo_layout)
         layout.addWidget(logo_group)
@@ -329,14 +454,17 @@ class ConfigWindow(QDialog):
         self.bg_image_widget = QWidget()
         bg_image_layout = QHBoxLayout(self.bg_image_widget)
         bg_image_layout.setContentsMargins(0, 0, 0, 0)
+        self.bg_image_thumbnail = self.create_thumbnail_label()
         self.bg_image_display = QLabel(os.path.basename(self.background_image) if self.background_image else "No image selected")
         self.bg_image_display.setMinimumWidth(200)
         self.bg_image_display.setWordWrap(True)
         bg_image_button = QPushButton("Browse")
         bg_image_button.clicked.connect(self.browse_bg_image)
+        bg_image_layout.addWidget(self.bg_image_thumbnail)
         bg_image_layout.addWidget(self.bg_image_display, 1)
         bg_image_layout.addWidget(bg_image_button)
         bg_layout.addRow("Background Image:", self.bg_image_widget)
+        self.start_media_task('bg_image', self.background_image)
         
         # Gradient Settings
         self.gradient_widget = QWidget()
@@ -479,6 +607,11 @@ class ConfigWindow(QDialog):
         self.overlay_duration_spinbox.setSuffix(" seconds")
         overlay_layout.addRow("Overlay Duration:", self.overlay_duration_spinbox)
         
+        # Animate Transitions
+        self.animations_enabled_checkbox = QCheckBox()
+        self.animations_enabled_checkbox.setChecked(self.animations_enabled)
+        overlay_layout.addRow("Animate Transitions:", self.animations_enabled_checkbox)
+        
         # Description
         desc_label = QLabel(
             "When enabled, a full-screen overlay will be displayed when the current singer changes.\n"
@@ -515,7 +648,7 @@ class ConfigWindow(QDialog):
             self.bg_color_display.setStyleSheet(f"background-color: {self.background_color}; border: 1px solid #ccc;")
     
     def browse_bg_image(self):
-        """Browse for background image and copy it to app directory"""
+        """Browse for background image and import it into the app directory"""
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getOpenFileName(
             self, 
@@ -524,25 +657,9 @@ class ConfigWindow(QDialog):
             "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
         )
         if file_path:
-            try:
-                # Copy file to media directory
-                file_name = Path(file_path).name
-                dest_path = MEDIA_DIR / f"bg_image_{file_name}"
-                shutil.copy2(file_path, dest_path)
-                
-                self.background_image = str(dest_path)
-                self.bg_image_display.setText(os.path.basename(file_path))
-                QMessageBox.information(
-                    self, 
-                    "Success", 
-                    f"Background image copied to application directory."
-                )
-            except Exception as e:
-                QMessageBox.warning(
-                    self, 
-                    "Error", 
-                    f"Failed to copy image: {str(e)}"
-                )
+            # Backgrounds never need more pixels than the biggest screen can show
+            self.bg_image_display.setText(f"Importing {os.path.basename(file_path)}...")
+            self.start_media_task('bg_image', file_path, largest_screen_size())
     
     def choose_gradient_start(self):
         """Open color picker for gradient start color"""
@@ -560,7 +677,7 @@ class ConfigWindow(QDialog):
 
     def browse_db(self):
         file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(self, "Select openkj.sqlite Database", "", "SQLite Database (*.sqlite *.db)")
+        file_path, _ = file_dialog.getOpenFileName(self, "Select openkj.sqlite Database", "", FILE_DIALOG_FILTER)
         if file_path:
             self.db_path = file_path
             self.db_path_label_display.setText(self.db_path)
@@ -574,20 +691,63 @@ class ConfigWindow(QDialog):
             "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
         )
         if file_path:
-            try:
-                # Copy file to media directory
-                file_name = Path(file_path).name
-                dest_path = MEDIA_DIR / f"logo_{file_name}"
-                shutil.copy2(file_path, dest_path)
-                
-                self.logo_path = str(dest_path)
-                self.logo_path_label_display.setText(os.path.basename(file_path))
-            except Exception as e:
-                QMessageBox.warning(
-                    self, 
-                    "Error", 
-                    f"Failed to copy logo: {str(e)}"
-                )
+            # The logo shares the screen with the rotation, so half the screen is plenty
+            self.logo_path_label_display.setText(f"Importing {os.path.basename(file_path)}...")
+            self.start_media_task('logo', file_path, largest_screen_size() / 2)
+
+    def create_thumbnail_label(self):
+        label = QLabel()
+        label.setFixedSize(THUMBNAIL_SIZE)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("border: 1px solid #ccc;")
+        return label
+
+    def start_media_task(self, kind, path, max_size=None):
+        """Import an image (when max_size is given) and load its preview without blocking the dialog"""
+        thumbnail = self.logo_thumbnail if kind == 'logo' else self.bg_image_thumbnail
+        if not path or not os.path.exists(path):
+            thumbnail.clear()
+            return
+        self.media_request_count += 1
+        request_id = f"{kind}:{self.media_request_count}"
+        self.media_pending[kind] = request_id
+        task = MediaImportTask(request_id, path, MEDIA_DIR, kind, max_size)
+        task.signals.finished.connect(self.on_media_task_finished)
+        task.signals.failed.connect(self.on_media_task_failed)
+        # Keep the task (and its signals object) alive until the result is delivered
+        self.media_tasks[request_id] = (task, os.path.basename(path))
+        QThreadPool.globalInstance().start(task)
+
+    def on_media_task_finished(self, request_id, imported_path, image):
+        _, source_name = self.media_tasks.pop(request_id, (None, None))
+        kind = request_id.split(':')[0]
+        if self.media_pending.get(kind) != request_id:
+            return  # A newer pick replaced this one
+        del self.media_pending[kind]
+
+        if kind == 'logo':
+            thumbnail, name_label = self.logo_thumbnail, self.logo_path_label_display
+            if imported_path:
+                self.logo_path = imported_path
+        else:
+            thumbnail, name_label = self.bg_image_thumbnail, self.bg_image_display
+            if imported_path:
+                self.background_image = imported_path
+        if imported_path:
+            name_label.setText(source_name)
+        thumbnail.setPixmap(QPixmap.fromImage(image) if not image.isNull() else QPixmap())
+
+    def on_media_task_failed(self, request_id, message):
+        _, source_name = self.media_tasks.pop(request_id, (None, None))
+        kind = request_id.split(':')[0]
+        if self.media_pending.get(kind) != request_id:
+            return
+        del self.media_pending[kind]
+        if kind == 'logo':
+            self.logo_path_label_display.setText(os.path.basename(self.logo_path) if self.logo_path else "No logo selected")
+        else:
+            self.bg_image_display.setText(os.path.basename(self.background_image) if self.background_image else "No image selected")
+        QMessageBox.warning(self, "Error", f"Failed to import {source_name}: {message}")
 
     def locate_db(self):
         """Attempt to automatically locate the OpenKJ database based on OS"""
@@ -610,11 +770,18 @@ class ConfigWindow(QDialog):
                                   "Please select it manually.")
             file_dialog = QFileDialog()
             file_path, _ = file_dialog.getOpenFileName(self, "Select openkj.sqlite Database", "", 
-                                                       "SQLite Database (*.sqlite *.db)")
+                                                       FILE_DIALOG_FILTER)
             if file_path:
                 self.db_path = file_path
                 self.db_path_label_display.setText(self.db_path)
     
+    def update_refresh_controls(self):
+        """Enable the interval settings that apply in the chosen refresh mode"""
+        adaptive = self.adaptive_refresh_checkbox.isChecked()
+        self.refresh_interval_spinbox.setEnabled(not adaptive)
+        self.refresh_min_spinbox.setEnabled(adaptive)
+        self.refresh_max_spinbox.setEnabled(adaptive)
+
     def reset_to_default(self):
         """Reset all settings to default values"""
         reply = QMessageBox.question(
@@ -631,7 +798,18 @@ class ConfigWindow(QDialog):
             self.venue_name_input.setText(DEFAULT_CONFIG['venue_name'])
             self.num_singers_spinbox.setValue(DEFAULT_CONFIG['num_singers'])
             self.refresh_interval_spinbox.setValue(DEFAULT_CONFIG['refresh_interval'])
+            self.adaptive_refresh_checkbox.setChecked(DEFAULT_CONFIG['adaptive_refresh'])
+            self.refresh_min_spinbox.setValue(DEFAULT_CONFIG['refresh_min_interval'])
+            self.refresh_max_spinbox.setValue(DEFAULT_CONFIG['refresh_max_interval'])
+            self.low_power_checkbox.setChecked(DEFAULT_CONFIG['low_power_mode'])
             self.accepting_requests_checkbox.setChecked(DEFAULT_CONFIG['accepting_requests'])
+            self.db_mirror_checkbox.setChecked(DEFAULT_CONFIG['db_mirror_enabled'])
+            self.collector_checkbox.setChecked(DEFAULT_CONFIG['collector_enabled'])
+            self.carousel_enabled_checkbox.setChecked(DEFAULT_CONFIG['carousel_enabled'])
+            self.carousel_page_spinbox.setValue(DEFAULT_CONFIG['carousel_page_seconds'])
+            self.show_wait_times_checkbox.setChecked(DEFAULT_CONFIG['show_wait_times'])
+            self.changeover_spinbox.setValue(DEFAULT_CONFIG['changeover_seconds'])
+            self.theme_combo.setCurrentText(DEFAULT_CONFIG['theme'])
             
             # Reset background settings
             self.background_color = DEFAULT_CONFIG['background_color']
@@ -645,6 +823,8 @@ class ConfigWindow(QDialog):
             self.bg_type_combo.setCurrentIndex(type_map.get(self.background_type, 0))
             self.bg_color_display.setStyleSheet(f"background-color: {self.background_color}; border: 1px solid #ccc;")
             self.bg_image_display.setText("No image selected")
+            self.media_pending.pop('bg_image', None)
+            self.bg_image_thumbnail.clear()
             self.gradient_start_display.setStyleSheet(f"background-color: {self.gradient_start_color}; border: 1px solid #ccc;")
             self.gradient_end_display.setStyleSheet(f"background-color: {self.gradient_end_color}; border: 1px solid #ccc;")
             dir_map = {'vertical': 0, 'horizontal': 1, 'diagonal': 2}
@@ -663,19 +843,53 @@ class ConfigWindow(QDialog):
             # Reset overlay settings
             self.overlay_enabled_checkbox.setChecked(DEFAULT_CONFIG['overlay_enabled'])
             self.overlay_duration_spinbox.setValue(DEFAULT_CONFIG['overlay_duration'])
+            self.animations_enabled_checkbox.setChecked(DEFAULT_CONFIG['animations_enabled'])
             
             QMessageBox.information(self, "Success", "Settings have been reset to default values.")
 
+    def config_changed_on_disk(self, config):
+        """Another instance or a script rewrote the config file while this dialog holds an older copy"""
+        self.changed_on_disk = config
+
     def save_config(self):
-        if not self.db_path:
-            QMessageBox.warning(self, "Warning", "Please select a database file.")
+        if self.changed_on_disk is not None:
+            answer = QMessageBox.question(
+                self, "Configuration Changed",
+                "The configuration file was changed outside this window since it was opened.\n\n"
+                "Save anyway? The settings shown here will replace those changes.",
+                QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Cancel)
+            if answer != QMessageBox.StandardButton.Save:
+                return
+            # Keep the new values of settings this window doesn't show
+            self.config = dict(self.changed_on_disk)
+            self.changed_on_disk = None
+
+        server_url = self.server_url_input.text().strip()
+        if server_url and not is_server_url(server_url):
+            QMessageBox.warning(self, "Warning", "The rotation server URL must start with http:// or https://.")
             return
+        if not self.db_path and not server_url:
+            QMessageBox.warning(self, "Warning", "Please select a database file or enter a rotation server URL.")
+            return
+        self.server_url = server_url or None
 
         self.num_singers = self.num_singers_spinbox.value()
         self.display_title = self.title_input.text()
         self.venue_name = self.venue_name_input.text()
         self.refresh_interval = self.refresh_interval_spinbox.value()
+        self.adaptive_refresh = self.adaptive_refresh_checkbox.isChecked()
+        self.refresh_min_interval = self.refresh_min_spinbox.value()
+        self.refresh_max_interval = self.refresh_max_spinbox.value()
+        self.low_power_mode = self.low_power_checkbox.isChecked()
         self.accepting_requests = self.accepting_requests_checkbox.isChecked()
+        self.db_mirror_enabled = self.db_mirror_checkbox.isChecked()
+        self.collector_enabled = self.collector_checkbox.isChecked()
+        self.carousel_enabled = self.carousel_enabled_checkbox.isChecked()
+        self.carousel_page_seconds = self.carousel_page_spinbox.value()
+        self.show_wait_times = self.show_wait_times_checkbox.isChecked()
+        self.changeover_seconds = self.changeover_spinbox.value()
+        self.theme = self.theme_combo.currentText()
         
         # Background settings
         bg_type_map = {0: 'color', 1: 'image', 2: 'gradient'}
@@ -697,6 +911,7 @@ class ConfigWindow(QDialog):
         # Overlay settings
         self.overlay_enabled = self.overlay_enabled_checkbox.isChecked()
         self.overlay_duration = self.overlay_duration_spinbox.value()
+        self.animations_enabled = self.animations_enabled_checkbox.isChecked()
         
         # Update config dict
         self.config['db_path'] = self.db_path
@@ -705,7 +920,19 @@ class ConfigWindow(QDialog):
         self.config['logo_path'] = self.logo_path
         self.config['venue_name'] = self.venue_name
         self.config['refresh_interval'] = self.refresh_interval
+        self.config['adaptive_refresh'] = self.adaptive_refresh
+        self.config['refresh_min_interval'] = self.refresh_min_interval
+        self.config['refresh_max_interval'] = self.refresh_max_interval
+        self.config['low_power_mode'] = self.low_power_mode
         self.config['accepting_requests'] = self.accepting_requests
+        self.config['db_mirror_enabled'] = self.db_mirror_enabled
+        self.config['collector_enabled'] = self.collector_enabled
+        self.config['server_url'] = self.server_url
+        self.config['carousel_enabled'] = self.carousel_enabled
+        self.config['carousel_page_seconds'] = self.carousel_page_seconds
+        self.config['show_wait_times'] = self.show_wait_times
+        self.config['changeover_seconds'] = self.changeover_seconds
+        self.config['theme'] = self.theme
         self.config['background_color'] = self.background_color
         self.config['background_image'] = self.background_image
         self.config['background_type'] = self.background_type
@@ -720,6 +947,7 @@ class ConfigWindow(QDialog):
         self.config['font_up_next_song'] = self.font_up_next_song
         self.config['overlay_enabled'] = self.overlay_enabled
         self.config['overlay_duration'] = self.overlay_duration
+        self.config['animations_enabled'] = self.animations_enabled
 
         save_config(self.config)
         QMessageBox.information(self, "Success", "Configuration saved successfully.")
@@ -728,25 +956,138 @@ class ConfigWindow(QDialog):
 
 
 class Clock(QLabel):
-    def __init__(self):
+    def __init__(self, show_seconds=True):
         super().__init__()
         # font = QFont('Arial', 14)
         # self.setFont(font)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        timer = QTimer(self)
-        timer.timeout.connect(self.update_time)
-        timer.start(1000)
-
+        self.show_seconds = show_seconds
+        self.opaque_background = None
+
+        # Ticks are aligned to the next second (or minute) boundary so they never drift
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+        self.tick()
+
+    def set_opaque_background(self, color):
+        """Paint a solid background (or None for none) so repaints don't reach the widgets behind"""
+        self.opaque_background = color
+        # Qt skips stylesheet backgrounds for opaque widgets, so paintEvent fills it instead
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, color is not None)
+        self.update()
+
+    def paintEvent(self, event):
+        if self.opaque_background is not None:
+            painter = QPainter(self)
+            painter.fillRect(event.rect(), self.opaque_background)
+            painter.end()
+        super().paintEvent(event)
+
+    def set_show_seconds(self, show_seconds):
+        if show_seconds != self.show_seconds:
+            self.show_seconds = show_seconds
+            self.tick()
+
+    def tick(self):
         self.update_time()
+        now = QTime.currentTime()
+        if self.show_seconds:
+            self.timer.start(1000 - now.msec())
+        else:
+            # Without seconds the text only changes once a minute
+            self.timer.start((60 - now.second()) * 1000 - now.msec())
+
+    def time_format(self):
+        return "h:mm:ss AP" if self.show_seconds else "h:mm AP"
 
     def update_time(self):
         current_time = QTime.currentTime()
-        formatted_time = current_time.toString("h:mm:ss AP")
-        self.setText(formatted_time)
+        formatted_time = current_time.toString(self.time_format())
+        if formatted_time != self.text():
+            self.setText(formatted_time)
+
+    def widest_text(self):
+        return QTime(22, 58, 58).toString(self.time_format())
+
+
+def singer_change_overlay_text(singer_name, song_info):
+    """Build the text shown on the singer change overlay"""
+    overlay_text = f"The next performer is\n\n{singer_name}"
+    if song_info:
+        overlay_text += f"\n\nPerforming\n{song_info}"
+    return overlay_text
+
+
+def render_singer_change_overlay(width, height, singer_name, song_info):
+    """Paint the singer change overlay into an image (safe to call off the GUI thread)"""
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(0, 0, 0, 190))
+
+    font = QFont()
+    font.setPixelSize(72)
+    font.setBold(True)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor('#fff'))
+    painter.drawText(
+        QRect(0, 0, width, height),
+        Qt.AlignmentFlag.AlignCenter.value | Qt.TextFlag.TextWordWrap.value,
+        singer_change_overlay_text(singer_name, song_info)
+    )
+    painter.end()
+    return image
+
+
+class OverlayRenderSignals(QObject):
+    finished = pyqtSignal(object, QImage)
+
+
+class OverlayRenderTask(QRunnable):
+    """Renders a singer change overlay on the thread pool"""
+
+    def __init__(self, key, width, height, singer_name, song_info):
+        super().__init__()
+        self.key = key
+        self.width = width
+        self.height = height
+        self.singer_name = singer_name
+        self.song_info = song_info
+        self.signals = OverlayRenderSignals()
+
+    def run(self):
+        image = render_singer_change_overlay(self.width, self.height, self.singer_name, self.song_info)
+        self.signals.finished.emit(self.key, image)
+
+
+def bake_drop_shadow(pixmap, blur_radius=10, color=QColor(0, 0, 0, 150), offset=8):
+    """Render a pixmap with a drop shadow into a new pixmap, once, instead of every paint"""
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur_radius)
+    effect.setColor(color)
+    effect.setOffset(offset, offset)
+    item = QGraphicsPixmapItem(pixmap)
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    source_rect = effect.boundingRect()
+    image = QImage(source_rect.size().toSize(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(image.rect()), source_rect)
+    painter.end()
+    return QPixmap.fromImage(image)
 
 
 class DisplayWindow(QMainWindow):
+    # Emitted from the rotation stream's thread; queued to the GUI thread
+    remote_rotation_received = pyqtSignal()
+
     def __init__(self, config):
         super().__init__()
         self.config = config
@@ -756,12 +1097,17 @@ class DisplayWindow(QMainWindow):
         self.setWindowFlag(Qt.WindowType.WindowCloseButtonHint)
 
         self.db_path = self.config.get('db_path')
-        self.file_watcher = QFileSystemWatcher([self.db_path]) if self.db_path else None
+        self._rotation_source = None  # See rotation_source()
+        self._rotation_source_key = None
+        self.refresh_scheduler = scheduler_from_config(self.config)
+        self.wait_estimator = WaitEstimator(self.config.get('changeover_seconds', DEFAULT_CONFIG['changeover_seconds']))
+        self.wait_starts = {}  # singer_id -> estimated start (Unix seconds), from the last update_display
+        self.file_watcher = QFileSystemWatcher([self.db_path]) if self.db_path and not self.server_url() else None
         if self.file_watcher:
-            self.file_watcher.fileChanged.connect(self.update_display)
+            self.file_watcher.fileChanged.connect(self.on_db_file_changed)
+        self.remote_rotation_received.connect(self.on_remote_rotation_received)
 
-        self.singer_labels = []
-        self.song_labels = []
+        self.up_next_view = None
         self.current_singer_label = QLabel("")
         self.current_song_label = QLabel("")
         self.message_overlay_label = QLabel("")
@@ -775,6 +1121,35 @@ class DisplayWindow(QMainWindow):
         self.previous_singer_id = None
         self.previous_singer_name = None
         
+        # Pre-rendered singer change overlay for whoever is up next
+        self.singer_change_overlay = None
+        self.overlay_cache_key = None
+        self.overlay_cache_pixmap = None
+        self.overlay_pending_key = None
+        self.overlay_render_tasks = {}
+        self.up_next_overlay_args = None
+        
+        # Fades and slides are drawn from cached pixmaps by one frame timer
+        self.animation_engine = AnimationEngine(self)
+        self.up_next_frame = None
+        self.up_next_transition = None
+        
+        # One reusable timer per overlay, so back-to-back changes restart it instead of stacking
+        self.singer_overlay_timer = QTimer(self)
+        self.singer_overlay_timer.setSingleShot(True)
+        self.singer_overlay_timer.timeout.connect(self.hide_singer_change_overlay)
+        self.message_overlay_timer = QTimer(self)
+        self.message_overlay_timer.setSingleShot(True)
+        self.message_overlay_timer.timeout.connect(self.hide_message_overlay)
+        
+        # Carousel pages are rendered once per data change and flipped by blitting
+        self.carousel_layer = None
+        self.carousel_entries = None
+        self.carousel_pages = []
+        self.carousel_page_index = 0
+        self.carousel_timer = QTimer(self)
+        self.carousel_timer.timeout.connect(self.show_next_carousel_page)
+        
         # Fullscreen toggle button
         self.fullscreen_button = QPushButton("")
         self.fullscreen_button.setFixedSize(200, 50)
@@ -787,11 +1162,16 @@ class DisplayWindow(QMainWindow):
         self.initUI()
         self.update_display()
         
-        # Use refresh_interval from config (in milliseconds)
-        refresh_interval_ms = self.config.get('refresh_interval', 5) * 1000
+        # Adaptive polling starts fast and backs off while idle; otherwise use refresh_interval
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.check_db_modified)
-        self.refresh_timer.start(refresh_interval_ms)
+        self.refresh_timer.start(self.current_refresh_interval() * 1000)
+        self.update_metrics()
+
+        # Wait texts count down between rotation changes, as on the web display
+        self.wait_timer = QTimer(self)
+        self.wait_timer.timeout.connect(self.refresh_wait_texts)
+        self.wait_timer.start(WAIT_REFRESH_SECONDS * 1000)
 
     def initUI(self):
         central_widget = QWidget()
@@ -802,6 +1182,7 @@ class DisplayWindow(QMainWindow):
         # Left Section
         left_section = QFrame()
         left_section.setObjectName("leftSection")
+        self.left_section = left_section
         left_section_layout = QVBoxLayout(left_section)
         left_section_layout.setAlignment(Qt.AlignmentFlag.AlignCenter) # Align Center
 
@@ -818,11 +1199,9 @@ class DisplayWindow(QMainWindow):
         welcome_layout.addLayout(logo_layout)
         left_section_layout.addLayout(welcome_layout)
 
-        # Shadow Effect for the logo
-        shadow_effect = QGraphicsDropShadowEffect()
-        shadow_effect.setBlurRadius(10)
-        shadow_effect.setColor(QColor(0, 0, 0, 150))  # Semi-transparent black
-        self.logo_label.setGraphicsEffect(shadow_effect)
+        # Shadow for the logo; a live effect normally, baked into the pixmap in low-power mode
+        self.logo_cache_key = None
+        self.apply_logo_shadow_effect()
 
         left_section.setLayout(left_section_layout)
 
@@ -854,6 +1233,7 @@ class DisplayWindow(QMainWindow):
         # Current Performer Section
         current_performer_frame = QFrame()
         current_performer_frame.setObjectName("currentPerformerFrame")  # For styling purposes
+        self.current_performer_frame = current_performer_frame
         current_performer_layout = QVBoxLayout(current_performer_frame)
         current_performer_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
         current_performer_frame.setFrameShape(QFrame.Shape.StyledPanel)
@@ -869,17 +1249,19 @@ class DisplayWindow(QMainWindow):
         on_stage_layout.addWidget(QLabel(""), 1)  # Right Spacer
         current_performer_layout.addLayout(on_stage_layout)
 
-        self.current_singer_label = QLabel("")
+        self.current_singer_label = FitLabel("")
         self.current_singer_label.setObjectName("currentSingerName")
-        current_performer_layout.addWidget(self.current_singer_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.current_singer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        current_performer_layout.addWidget(self.current_singer_label)
 
         self.singing_label = QLabel("Performing")
         self.singing_label.setObjectName("singingLabel")
         current_performer_layout.addWidget(self.singing_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        self.current_song_label = QLabel("")
+        self.current_song_label = FitLabel("")
         self.current_song_label.setObjectName("currentSongName")
-        current_performer_layout.addWidget(self.current_song_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.current_song_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        current_performer_layout.addWidget(self.current_song_label)
 
         centralized_layout.addWidget(current_performer_frame) #Add the current performer frame to the centralized layout
 
@@ -889,6 +1271,7 @@ class DisplayWindow(QMainWindow):
         up_next_layout = QVBoxLayout(up_next_frame)
         up_next_frame.setFrameShape(QFrame.Shape.StyledPanel)
         up_next_frame.setFrameShadow(QFrame.Shadow.Raised)
+        self.up_next_frame = up_next_frame
 
         # "Coming Up" heading
         coming_up_layout = QHBoxLayout()
@@ -900,33 +1283,22 @@ class DisplayWindow(QMainWindow):
         coming_up_layout.addWidget(QLabel(""), 1)  # Right Spacer
         up_next_layout.addLayout(coming_up_layout)
 
-        # Uniform singer/song entries
-        for i in range(self.config.get('num_singers', DEFAULT_NUM_SINGERS)):
-            singer_song_widget = QWidget() #Container widget to apply a fixed layout to
-            singer_song_layout = QVBoxLayout(singer_song_widget)
-            singer_song_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)  # Align the name and song
-            singer_song_layout.setContentsMargins(0, 0, 0, 0)  # Remove extra margins
-
-            singer_label = QLabel("")
-            singer_label.setObjectName("upNextSingerName")
-            song_label = QLabel("")
-            song_label.setObjectName("upNextSongName")
-
-            self.singer_labels.append(singer_label)
-            self.song_labels.append(song_label)
-
-            singer_song_layout.addWidget(singer_label)
-            singer_song_layout.addWidget(song_label)
+        # Up-next entries: a virtualized model/view list, so long rotations stay cheap
+        self.up_next_view = UpNextView()
+        view_size_policy = self.up_next_view.sizePolicy()
+        view_size_policy.setRetainSizeWhenHidden(True)
+        self.up_next_view.setSizePolicy(view_size_policy)
+        up_next_layout.addWidget(self.up_next_view, 1)
+        centralized_layout.addWidget(up_next_frame)
 
-            up_next_layout.addWidget(singer_song_widget) #Add the layout to the main frame
+        # Slides the up-next entries up a slot when the rotation advances
+        self.up_next_transition = PixmapLayer(up_next_frame)
+        self.up_next_transition.hide()
 
-            if i < self.config.get('num_singers', DEFAULT_NUM_SINGERS) - 1: # Add separator line if not last entry
-                line = QFrame()
-                line.setFrameShape(QFrame.Shape.HLine)
-                line.setFrameShadow(QFrame.Shadow.Raised)
-                line.setObjectName("upNextSeparator")
-                up_next_layout.addWidget(line)
-        centralized_layout.addWidget(up_next_frame)
+        # Shows pre-rendered pages of the full rotation in carousel mode
+        self.carousel_layer = PixmapLayer(up_next_frame)
+        self.carousel_layer.hide()
+        self.up_next_view.resized.connect(self.on_up_next_resized)
         right_section_layout.addLayout(centralized_layout)
         right_section.setLayout(right_section_layout)
 
@@ -945,6 +1317,10 @@ class DisplayWindow(QMainWindow):
         self.message_overlay_label.raise_()
         self.message_overlay_label.hide()
 
+        # Singer change overlay, shown from a cached pixmap
+        self.singer_change_overlay = PixmapLayer(central_widget)
+        self.singer_change_overlay.setGeometry(central_widget.rect())
+        self.singer_change_overlay.hide()
 
         self.setCentralWidget(central_widget)
         
@@ -972,7 +1348,7 @@ class DisplayWindow(QMainWindow):
         self.status_bar.setObjectName("statusBar")
 
         # Initialize and add the clock to the status bar (left side)
-        self.clock = Clock()
+        self.clock = Clock(show_seconds=not self.low_power_mode())
         self.clock.setObjectName("clock")
         self.status_bar.addWidget(self.clock)  # Use addWidget to align it to the left
 
@@ -1036,14 +1412,6 @@ class DisplayWindow(QMainWindow):
         font_up_next_singer = self.config.get('font_up_next_singer', DEFAULT_CONFIG['font_up_next_singer'])
         font_up_next_song = self.config.get('font_up_next_song', DEFAULT_CONFIG['font_up_next_song'])
         
-        # Helper function to create font style string
-        def font_style(font_config):
-            family = font_config.get('family', 'Arial')
-            size = font_config.get('size', 24)
-            bold = 'bold' if font_config.get('bold', False) else 'normal'
-            italic = 'italic' if font_config.get('italic', False) else 'normal'
-            return f"font-family: '{family}'; font-size: {size}px; font-weight: {bold}; font-style: {italic};"
-        
         # Add semi-transparent overlay styling for sections when using image background
         section_background = "background: transparent;"
         if bg_type == 'image' and bg_image and os.path.exists(bg_image):
@@ -1058,7 +1426,6 @@ class DisplayWindow(QMainWindow):
             }}
             QLabel {{
                 color: #eee;
-                font-size: 24px;
             }}
             #leftSection {{
                 {section_background}
@@ -1067,12 +1434,10 @@ class DisplayWindow(QMainWindow):
                 {section_background}
             }}
             #venueLabel {{
-                {font_style(font_venue_name)}
                 margin-bottom: 10px;
                 text-align: center;
             }}
             #displayTitle {{
-                {font_style(font_display_title)}
                 margin-bottom: 10px;
                 text-align: center;
             }}
@@ -1088,7 +1453,6 @@ class DisplayWindow(QMainWindow):
                 text-align: center;
             }}
             #currentSingerName {{
-                {font_style(font_current_singer)}
                 text-align: center;
             }}
             #singingLabel {{
@@ -1097,26 +1461,13 @@ class DisplayWindow(QMainWindow):
                 font-style: italic;
             }}
             #currentSongName {{
-                {font_style(font_current_song)}
-                text-align: center;
-            }}
-            #upNextSingerName {{
-                {font_style(font_up_next_singer)}
-                margin-bottom: 5px;
                 text-align: center;
             }}
-            #upNextSongName {{
-                {font_style(font_up_next_song)}
-                margin-bottom: 10px;
-                text-align: center;
+            #upNextList {{
+                background: transparent;
+                color: #eee;
+                border: none;
             }}
-             #upNextSeparator {{
-                background-color: #3b3c3c;
-                color: 353738;
-                height: 1px;
-                margin-top: 10px;
-                margin-bottom: 10px;
-             }}
             #messageOverlay {{
                 background-color: rgba(0, 0, 0, 190);
                 color: #fff;
@@ -1148,9 +1499,26 @@ class DisplayWindow(QMainWindow):
         
         self.setStyleSheet(stylesheet)
 
+        # Fonts are set on the widgets rather than in the stylesheet, so they're resolved once
+        # (see FontRegistry); labels without a font of their own inherit the window's
+        base_font = QFont()
+        base_font.setPixelSize(24)
+        self.setFont(base_font)
+        self.display_title_label.setFont(font_registry.font(font_display_title))
+        self.venue_label.setFont(font_registry.font(font_venue_name))
+        self.current_singer_label.setFont(font_registry.font(font_current_singer))
+        self.current_song_label.setFont(font_registry.font(font_current_song))
+        self.up_next_view.set_fonts(font_registry.font(font_up_next_singer), font_registry.font(font_up_next_song))
+        self.apply_low_power_mode()
+
     def resizeEvent(self, event):
         if hasattr(self, 'message_overlay_label') and self.message_overlay_label.parentWidget():
             self.message_overlay_label.setGeometry(self.centralWidget().rect())
+        if getattr(self, 'singer_change_overlay', None) is not None and self.centralWidget():
+            self.singer_change_overlay.setGeometry(self.centralWidget().rect())
+            if self.up_next_overlay_args:
+                # The cached overlay is sized to the window; render a fresh one
+                self.prepare_singer_change_overlay(*self.up_next_overlay_args)
         if hasattr(self, 'fullscreen_button'):
             self.position_fullscreen_button()
         super().resizeEvent(event)
@@ -1204,6 +1572,11 @@ class DisplayWindow(QMainWindow):
         fullscreen_action.triggered.connect(self.toggle_fullscreen)
         context_menu.addAction(fullscreen_action)
         
+        # Reload Song Library
+        reload_library_action = QAction("Reload Song Library", self)
+        reload_library_action.triggered.connect(self.reload_song_library)
+        context_menu.addAction(reload_library_action)
+
         # Show Config
         config_action = QAction("Show Config", self)
         config_action.triggered.connect(self.show_config)
@@ -1222,13 +1595,45 @@ class DisplayWindow(QMainWindow):
             self.main_app.show_config_window()
 
     def check_db_modified(self):
-        if self.db_path and os.path.exists(self.db_path):
-            current_modified_time = os.path.getmtime(self.db_path)
-            if getattr(self, 'last_modified_time', None) is None:
-                self.last_modified_time = current_modified_time
-            elif current_modified_time > self.last_modified_time:
-                self.last_modified_time = current_modified_time
-                self.update_display()
+        if self.collector() is not None or self.server_url():
+            return  # The collector process or the rotation server pushes changes
+        changed = False
+        # Cheap: data_version for the database, size and mtime for a rotation file
+        if self.db_path and os.path.exists(self.db_path) and self.rotation_source().changed():
+            changed = True
+            self.update_display()
+        self.refresh_scheduler.record(changed)
+        self.reschedule_refresh()
+
+    def on_db_file_changed(self, path=None):
+        if self.collector() is not None or self.server_url():
+            return
+        # The watcher saw a write; poll fast again while the rotation is moving
+        self.refresh_scheduler.reset()
+        self.reschedule_refresh()
+        self.update_display()
+
+    def on_remote_rotation_received(self):
+        self.update_display()
+
+    def current_refresh_interval(self):
+        if self.config.get('adaptive_refresh', DEFAULT_CONFIG['adaptive_refresh']):
+            return self.refresh_scheduler.interval
+        return self.config.get('refresh_interval', DEFAULT_CONFIG['refresh_interval'])
+
+    def apply_refresh_settings(self):
+        """Pick up refresh interval changes from a reloaded config"""
+        self.refresh_scheduler.configure(
+            self.config.get('refresh_min_interval', DEFAULT_CONFIG['refresh_min_interval']),
+            self.config.get('refresh_max_interval', DEFAULT_CONFIG['refresh_max_interval']),
+        )
+        self.reschedule_refresh()
+
+    def reschedule_refresh(self):
+        interval_ms = int(self.current_refresh_interval() * 1000)
+        if self.refresh_timer.interval() != interval_ms:
+            self.refresh_timer.start(interval_ms)
+            self.update_metrics()
 
     def update_display(self):
         # Update Display Title, Logo, and Venue from config
@@ -1240,45 +1645,64 @@ class DisplayWindow(QMainWindow):
         requests_text = "Accepting Requests" if accepting_requests else "Not Accepting Requests"
         self.requests_label.setText(requests_text)
         
-        logo_path = self.config.get('logo_path', DEFAULT_CONFIG['logo_path'])
-        if logo_path and os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            scaled_pixmap = pixmap.scaled(self.logo_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.logo_label.setPixmap(scaled_pixmap)
-        else:
-            self.logo_label.clear()
+        self.update_logo()
 
         db_path = self.config.get('db_path')
         num_up_next_singers = self.config.get('num_singers', DEFAULT_NUM_SINGERS)
+        collector = self.collector()
 
-        if not db_path or not os.path.exists(db_path):
+        if collector is None and not self.server_url() and (not db_path or not os.path.exists(db_path)):
             self.clear_display("Database configuration error.")
             return
 
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            num_singers_to_fetch = num_up_next_singers + 1
-            cursor.execute("SELECT singerid, name, position FROM rotationSingers ORDER BY position ASC LIMIT ?", (num_singers_to_fetch,))
-            singers_data = cursor.fetchall()
-
-            if singers_data:
-                current_singer_id, current_singer_name, _ = singers_data[0]
+            carousel_enabled = self.carousel_enabled()
+            # LIMIT -1 reads the whole rotation for the carousel
+            limit = -1 if carousel_enabled else num_up_next_singers + 1
+            if collector is not None:
+                # The collector process reads the database; show its last good snapshot
+                if collector.latest_snapshot is None:
+                    self.clear_display(collector.last_error or "Waiting for rotation data...")
+                    return
+                entries = collector.latest_snapshot['rotation']
+                if limit >= 0:
+                    entries = entries[:limit]
+            else:
+                entries = self.rotation_source().read(limit)
+            rotation, durations = self.split_rotation(entries)
+            # Drop clear_display's error styling, which would also override the configured font
+            if self.current_song_label.styleSheet():
+                self.current_song_label.setStyleSheet("")
+            wait_texts = self.estimate_waits(rotation, durations)
+
+            overlay_enabled = self.config.get('overlay_enabled', DEFAULT_CONFIG['overlay_enabled'])
+            outgoing_up_next = None
+            if rotation:
+                current_singer_id, current_singer_name, current_song_info = rotation[0]
+                
+                # Snapshot the up-next list before it changes so it can slide up a slot
+                if (self.previous_singer_id is not None and self.previous_singer_id != current_singer_id
+                        and not carousel_enabled):
+                    outgoing_up_next = self.grab_up_next_frame()
                 
                 # Check if singer has changed and overlay is enabled
-                overlay_enabled = self.config.get('overlay_enabled', DEFAULT_CONFIG['overlay_enabled'])
                 if overlay_enabled and self.previous_singer_id is not None and self.previous_singer_id != current_singer_id:
                     # Singer has changed, show overlay
-                    current_song_info = self.get_next_song_for_singer(cursor, current_singer_id)
-                    self.show_singer_change_overlay(current_singer_name, current_song_info)
+                    self.show_singer_change_overlay(current_singer_name, current_song_info, current_singer_id)
                 
+                history_store = self.main_app.history_store if self.main_app else None
+                if history_store:
+                    if self.previous_singer_id is not None and self.previous_singer_id != current_singer_id:
+                        history_store.record_singer_change(current_singer_id, current_singer_name,
+                                                           current_song_info, self.previous_singer_id)
+                    # The visible part of the rotation (all of it in carousel mode)
+                    history_store.record_snapshot(rotation)
+
                 # Update previous singer tracking
                 self.previous_singer_id = current_singer_id
                 self.previous_singer_name = current_singer_name
                 
                 self.current_singer_label.setText(current_singer_name)
-                current_song_info = self.get_next_song_for_singer(cursor, current_singer_id)
                 if current_song_info:
                     self.current_song_label.setText(current_song_info)
                 else:
@@ -1287,95 +1711,426 @@ class DisplayWindow(QMainWindow):
                 self.current_singer_label.setText("")
                 self.current_song_label.setText("No singers in rotation.")
 
+            if len(rotation) >= 2 and overlay_enabled:
+                self.prepare_singer_change_overlay(*rotation[1])
+            else:
+                self.up_next_overlay_args = None
+
+            # The model only signals rows that changed, so only those repaint
+            up_next_entries = [
+                {'singer_id': singer_id, 'singer_name': singer_name, 'song': song_info, 'wait': wait_text}
+                for (singer_id, singer_name, song_info), wait_text in zip(rotation[1:], wait_texts[1:])
+            ]
+            if carousel_enabled:
+                self.update_carousel(up_next_entries)
+            else:
+                self.stop_carousel()
+                self.up_next_view.up_next_model.set_entries(up_next_entries)
 
-            for i in range(num_up_next_singers):
-                singer_index = i + 1
-                if singer_index < len(singers_data):
-                    singer_id, singer_name, _ = singers_data[singer_index]
-                    self.singer_labels[i].setText(singer_name)
-                    next_song_info = self.get_next_song_for_singer(cursor, singer_id)
-                    if next_song_info:
-                        self.song_labels[i].setText(f" - {next_song_info}")
-                    else:
-                        self.song_labels[i].setText("No song queued.")
-                else:
-                    self.singer_labels[i].setText("")
-                    self.song_labels[i].setText("")
+            if outgoing_up_next is not None:
+                self.start_up_next_transition(outgoing_up_next)
 
-            conn.close()
+            self.update_metrics()
+            # Editors that replace the file drop it from the watcher; re-add it (the connection survives)
             if self.file_watcher and self.db_path not in self.file_watcher.files():
                 self.file_watcher.addPath(self.db_path)
-                self.file_watcher.fileChanged.connect(self.update_display)
 
-        except sqlite3.Error as e:
-            self.clear_display(f"Database error: {e}")
+        except RotationSourceError as e:
+            self.clear_display(f"{'Rotation server' if self.server_url() else 'Database'} error: {e}")
             return
+
+    def rotation_source(self):
+        """The RotationSource for the configured server or path, reopened when the config changes"""
+        server_url = self.server_url()
+        use_mirror = self.config.get('db_mirror_enabled', DEFAULT_CONFIG['db_mirror_enabled'])
+        key = (server_url,) if server_url else (self.config.get('db_path'), use_mirror)
+        if self._rotation_source_key != key:
+            if self._rotation_source is not None:
+                self._rotation_source.close()
+            if server_url:
+                self._rotation_source = RemoteRotationSource(server_url, self.remote_rotation_received.emit)
+            else:
+                self._rotation_source = open_rotation_source(*key)
+            self._rotation_source_key = key
+        return self._rotation_source
+
+    def server_url(self):
+        return self.config.get('server_url', DEFAULT_CONFIG['server_url'])
+
+    def closeEvent(self, event):
+        # A rotation stream would otherwise keep reconnecting after the window is gone
+        if self._rotation_source is not None:
+            self._rotation_source.close()
+            self._rotation_source = None
+            self._rotation_source_key = None
+        super().closeEvent(event)
     
-    def show_singer_change_overlay(self, singer_name, song_info):
+    def carousel_enabled(self):
+        return self.config.get('carousel_enabled', DEFAULT_CONFIG['carousel_enabled'])
+
+    def update_carousel(self, entries):
+        """Re-paginate the rotation if it changed since the pages were rendered"""
+        if entries == self.carousel_entries:
+            return
+        self.carousel_entries = entries
+        self.build_carousel_pages()
+
+    def build_carousel_pages(self, keep_page=False):
+        entries = self.carousel_entries or []
+        pages = self.up_next_view.render_pages(entries)
+        if len(pages) <= 1:
+            # Everything fits on one screen; the regular list is enough
+            self.carousel_timer.stop()
+            self.carousel_pages = []
+            self.carousel_layer.hide()
+            self.up_next_view.up_next_model.set_entries(entries)
+            return
+
+        # The list stays in place (empty) so it keeps tracking its size for re-pagination
+        self.up_next_view.up_next_model.clear()
+        self.carousel_pages = pages
+        if not keep_page or self.carousel_page_index >= len(pages):
+            self.carousel_page_index = 0
+        self.carousel_layer.setGeometry(self.up_next_view.geometry())
+        self.carousel_layer.setPixmap(pages[self.carousel_page_index])
+        self.carousel_layer.opacity = 1.0
+        self.carousel_layer.raise_()
+        self.carousel_layer.show()
+        page_seconds = self.config.get('carousel_page_seconds', DEFAULT_CONFIG['carousel_page_seconds'])
+        if not (keep_page and self.carousel_timer.isActive()):
+            self.carousel_timer.start(page_seconds * 1000)
+
+    def show_next_carousel_page(self):
+        if not self.carousel_pages:
+            self.carousel_timer.stop()
+            return
+        self.carousel_page_index = (self.carousel_page_index + 1) % len(self.carousel_pages)
+        self.carousel_layer.setPixmap(self.carousel_pages[self.carousel_page_index])
+        if self.animations_enabled():
+            self.animation_engine.fade(self.carousel_layer, 0.0, 1.0, OVERLAY_FADE_MS)
+
+    def stop_carousel(self):
+        self.carousel_timer.stop()
+        self.carousel_pages = []
+        self.carousel_entries = None
+        if self.carousel_layer is not None:
+            self.animation_engine.cancel(self.carousel_layer)
+            self.carousel_layer.hide()
+
+    def on_up_next_resized(self):
+        # Page size depends on the list's height; re-render from the cached rotation
+        if self.carousel_entries is not None:
+            self.build_carousel_pages()
+
+    def low_power_mode(self):
+        return self.config.get('low_power_mode', DEFAULT_CONFIG['low_power_mode'])
+
+    def apply_logo_shadow_effect(self):
+        if self.low_power_mode():
+            self.logo_label.setGraphicsEffect(None)
+        elif self.logo_label.graphicsEffect() is None:
+            shadow_effect = QGraphicsDropShadowEffect()
+            shadow_effect.setBlurRadius(10)
+            shadow_effect.setColor(QColor(0, 0, 0, 150))  # Semi-transparent black
+            self.logo_label.setGraphicsEffect(shadow_effect)
+
+    def update_logo(self):
+        """Decode, scale (and in low-power mode shadow) the logo only when something changed"""
+        logo_path = self.config.get('logo_path', DEFAULT_CONFIG['logo_path'])
+        if not logo_path or not os.path.exists(logo_path):
+            self.logo_cache_key = None
+            self.logo_label.clear()
+            return
+
+        key = (logo_path, os.path.getmtime(logo_path), self.logo_label.size(), self.low_power_mode())
+        if key == self.logo_cache_key:
+            return
+        self.logo_cache_key = key
+        pixmap = QPixmap(logo_path)
+        scaled_pixmap = pixmap.scaled(self.logo_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        if self.low_power_mode():
+            scaled_pixmap = bake_drop_shadow(scaled_pixmap)
+        self.logo_label.setPixmap(scaled_pixmap)
+
+    def apply_low_power_mode(self):
+        """Trim repaints for fanless display PCs: minute clock ticks, an opaque clock, a baked logo shadow"""
+        low_power = self.low_power_mode()
+        self.clock.set_show_seconds(not low_power)
+        # A fixed width stops every tick from re-laying out the status bar. Measure with the
+        # stylesheet's font (#clock font-size), which Qt only applies when the widget is polished
+        self.clock.ensurePolished()
+        self.clock.setFixedWidth(QFontMetrics(self.clock.font()).horizontalAdvance(self.clock.widest_text()) + 20)
+        # Over a solid color the clock paints its own opaque background, so the window behind it isn't repainted
+        if low_power and self.config.get('background_type', 'color') == 'color':
+            opaque_color = QColor(self.config.get('background_color', DEFAULT_CONFIG['background_color']))
+        else:
+            opaque_color = None
+        self.clock.set_opaque_background(opaque_color)
+        self.set_opaque_panels(opaque_color)
+        self.apply_logo_shadow_effect()
+        self.logo_cache_key = None
+        self.update_logo()
+
+    def set_opaque_panels(self, color):
+        """Have the static panels fill their own background with color (None to stop)
+
+        An opaque widget is repainted on its own; otherwise Qt also repaints
+        the window, central widget and section behind it. Only right over a
+        solid background color, where the fill looks exactly the same.
+        """
+        for panel in (self.left_section, self.display_title_label, self.current_performer_frame):
+            # Polishing with the stylesheet resets autoFillBackground, so get that done first
+            panel.ensurePolished()
+            if color is not None:
+                palette = panel.palette()
+                palette.setColor(QPalette.ColorRole.Window, color)
+                panel.setPalette(palette)
+            panel.setAutoFillBackground(color is not None)
+
+    def update_metrics(self):
+        """Show refresh and song cache metrics as the status bar tooltip"""
+        stats = song_cache.stats()
+        adaptive = self.config.get('adaptive_refresh', DEFAULT_CONFIG['adaptive_refresh'])
+        self.status_bar.setToolTip(
+            f"Refresh interval: {self.current_refresh_interval():g}s ({'adaptive' if adaptive else 'fixed'})\n"
+            f"Song cache: {stats['size']}/{stats['maxsize']} songs, "
+            f"{stats['hit_rate']:.0%} hit rate ({stats['hits']} hits, {stats['misses']} misses)"
+            + self.repaint_metrics_text()
+            + self.collector_metrics_text()
+            + self.server_metrics_text()
+        )
+
+    def server_metrics_text(self):
+        source = self._rotation_source
+        if not isinstance(source, RemoteRotationSource):
+            return ""
+        state = "connected" if source.connected else f"offline ({source.last_error or 'connecting'})"
+        age = source.snapshot_age()
+        received = "no rotation yet" if age is None else f"rotation changed {age:.0f}s ago"
+        return f"\nServer {source.server_url}: {state}, {received}, {source.reconnects} reconnects"
+
+    def collector_metrics_text(self):
+        collector = self.collector()
+        if collector is None:
+            return ""
+        version = collector.latest_snapshot['version'] if collector.latest_snapshot else "-"
+        owner = "own" if collector.owns_collector() else "shared"
+        return (f"\nCollector ({owner}): snapshot {version}, last heard {collector.message_age():.0f}s ago, "
+                f"{collector.restarts} restarts")
+
+    def repaint_metrics_text(self):
+        counter = self.main_app.repaint_counter if self.main_app else None
+        if counter is None:
+            return ""
+        repaints = counter.stats()
+        return (f"\nRepaints: {repaints['paint_events']} events, "
+                f"{repaints['paint_events_per_second']:.1f}/s, "
+                f"{repaints['painted_pixels_per_second'] / 1000:.0f} kpx/s")
+
+    def reload_song_library(self):
+        """Forget cached song details after the KJ updates the song library"""
+        song_cache.invalidate()
+        self.update_display()
+
+    def overlay_key(self, singer_id, singer_name, song_info):
+        size = self.centralWidget().size() if self.centralWidget() else self.size()
+        return (singer_id, singer_name, song_info, size.width(), size.height())
+
+    def prepare_singer_change_overlay(self, singer_id, singer_name, song_info):
+        """Pre-render the overlay for the up-next singer in the background"""
+        self.up_next_overlay_args = (singer_id, singer_name, song_info)
+        key = self.overlay_key(singer_id, singer_name, song_info)
+        if key in (self.overlay_cache_key, self.overlay_pending_key):
+            return
+        self.overlay_pending_key = key
+        task = OverlayRenderTask(key, key[3], key[4], singer_name, song_info)
+        task.signals.finished.connect(self.on_overlay_rendered)
+        # Keep the task (and its signals object) alive until the result is delivered
+        self.overlay_render_tasks[key] = task
+        QThreadPool.globalInstance().start(task)
+
+    def on_overlay_rendered(self, key, image):
+        self.overlay_render_tasks.pop(key, None)
+        if key != self.overlay_pending_key:
+            return  # Up-next slot changed while this was rendering
+        self.overlay_pending_key = None
+        self.overlay_cache_key = key
+        self.overlay_cache_pixmap = QPixmap.fromImage(image)
+
+    def show_singer_change_overlay(self, singer_name, song_info, singer_id=None):
         """Show overlay when singer changes"""
         overlay_duration = self.config.get('overlay_duration', DEFAULT_CONFIG['overlay_duration'])
         
-        # Build overlay text
-        overlay_text = f"The next performer is\n\n{singer_name}"
-        if song_info:
-            overlay_text += f"\n\nPerforming\n{song_info}"
-        
-        self.message_overlay_label.setText(overlay_text)
-        self.message_overlay_label.show()
+        key = self.overlay_key(singer_id, singer_name, song_info)
+        if key == self.overlay_cache_key:
+            pixmap = self.overlay_cache_pixmap
+        else:
+            # Not pre-rendered (rotation was reordered, window resized); render it now
+            pixmap = QPixmap.fromImage(render_singer_change_overlay(key[3], key[4], singer_name, song_info))
+        
+        self.singer_change_overlay.setPixmap(pixmap)
+        self.singer_change_overlay.raise_()
+        self.singer_change_overlay.show()
+        if self.animations_enabled():
+            self.animation_engine.fade(self.singer_change_overlay, 0.0, 1.0, OVERLAY_FADE_MS)
+        else:
+            self.animation_engine.cancel(self.singer_change_overlay)
+            self.singer_change_overlay.opacity = 1.0
         
-        # Hide overlay after duration
-        QTimer.singleShot(overlay_duration * 1000, self.hide_message_overlay)
-
-    def get_next_song_for_singer(self, cursor, singer_id):
-        cursor.execute("""
-            SELECT qs.song
-            FROM queueSongs qs
-            WHERE qs.singer = ? AND qs.played = 0
-            ORDER BY qs.position ASC
-            LIMIT 1
-        """, (singer_id,))
-        next_song_queue_data = cursor.fetchone()
-
-        if next_song_queue_data:
-            song_id = next_song_queue_data[0]
-            cursor.execute("""
-                SELECT ds.Title, ds.Artist
-                FROM dbSongs ds
-                WHERE ds.songid = ?
-            """, (song_id,))
-            song_data = cursor.fetchone()
-            if song_data:
-                title, artist = song_data
-                return f"{title} by {artist}"
-        return None
+        # Hide overlay after duration; restarting cancels a pending hide from an earlier change
+        self.singer_overlay_timer.start(overlay_duration * 1000)
+
+    def hide_singer_change_overlay(self):
+        self.singer_overlay_timer.stop()
+        if self.animations_enabled() and self.singer_change_overlay.isVisible():
+            self.animation_engine.fade(self.singer_change_overlay, self.singer_change_overlay.opacity, 0.0,
+                                       OVERLAY_FADE_MS, on_finished=self.singer_change_overlay.hide)
+        else:
+            self.animation_engine.cancel(self.singer_change_overlay)
+            self.singer_change_overlay.hide()
+
+    def animations_enabled(self):
+        return self.config.get('animations_enabled', DEFAULT_CONFIG['animations_enabled'])
+
+    def grab_up_next_frame(self):
+        """Capture the up-next entries as a pixmap, or None if they shouldn't be animated"""
+        if not self.animations_enabled() or not self.up_next_frame.isVisible():
+            return None
+        self.animation_engine.cancel(self.up_next_transition, finish=True)
+        return self.up_next_view.grab()
+
+    def start_up_next_transition(self, outgoing):
+        """Slide the up-next entries up one slot from the old list to the new one"""
+        incoming = self.up_next_view.grab()
+        slot_height = self.up_next_view.row_height()
+        layer = self.up_next_transition
+        layer.setGeometry(self.up_next_view.geometry())
+        layer.setPixmap(incoming)
+        layer.raise_()
+        layer.show()
+        # The real labels stay hidden (keeping their space) while the pixmaps move
+        self.up_next_view.hide()
+        self.animation_engine.slide(layer, outgoing, slot_height, SLOT_TRANSITION_MS,
+                                    on_finished=self.finish_up_next_transition)
+
+    def finish_up_next_transition(self):
+        self.up_next_view.show()
+        self.up_next_transition.hide()
+
+    def split_rotation(self, entries):
+        """Return ([(singer_id, singer_name, song_info)], durations) from read_rotation() entries
+
+        durations holds each singer's next song length in seconds: 0 if unknown, None if nothing is queued.
+        """
+        rotation = [(entry['singer_id'], entry['singer_name'], format_song(entry)) for entry in entries]
+        durations = [None if entry['song_id'] is None else entry['duration'] for entry in entries]
+        return rotation, durations
+
+    def collector(self):
+        return self.main_app.collector if self.main_app else None
+
+    def estimate_waits(self, rotation, durations):
+        """Return a wait text (or None) for each singer in the rotation"""
+        if not self.config.get('show_wait_times', DEFAULT_CONFIG['show_wait_times']):
+            return [None] * len(rotation)
+        self.wait_estimator.configure(self.config.get('changeover_seconds', DEFAULT_CONFIG['changeover_seconds']))
+        starts = self.wait_estimator.update(
+            [(singer_id, duration) for (singer_id, _, _), duration in zip(rotation, durations)])
+        self.wait_starts = {singer_id: start for (singer_id, _, _), start, duration
+                            in zip(rotation, starts, durations) if duration is not None}
+        now = time.time()
+        return [format_wait(start, now) if duration is not None else None
+                for start, duration in zip(starts, durations)]
+
+    def refresh_wait_texts(self):
+        """Re-format the wait texts from the last estimates, without reading the rotation again"""
+        if not self.wait_starts or not self.config.get('show_wait_times', DEFAULT_CONFIG['show_wait_times']):
+            return
+        now = time.time()
+        waits = {singer_id: format_wait(start, now) for singer_id, start in self.wait_starts.items()}
+        if self.carousel_entries is not None:
+            entries = [dict(entry, wait=waits.get(entry['singer_id'], entry['wait'])) for entry in self.carousel_entries]
+            if entries != self.carousel_entries:
+                self.carousel_entries = entries
+                self.build_carousel_pages(keep_page=True)
+        else:
+            self.up_next_view.up_next_model.set_waits(waits)
 
     def clear_display(self, message):
         self.current_singer_label.setText("")
         self.current_song_label.setText(message)
         self.current_song_label.setStyleSheet("color: red; font-size: 20px;")
-        for i in range(len(self.singer_labels)):
-            self.singer_labels[i].setText("")
-            self.song_labels[i].setText("")
+        self.up_next_view.up_next_model.clear()
+        self.stop_carousel()
 
     def show_message_overlay(self, message):
         self.message_overlay_label.setText(message)
         self.message_overlay_label.show()
-        QTimer.singleShot(5000, self.hide_message_overlay)
+        self.message_overlay_timer.start(5000)
 
     def hide_message_overlay(self):
+        self.message_overlay_timer.stop()
         self.message_overlay_label.hide()
 
 
+class ConfigFileWatcher(QObject):
+    """Relays external config file edits from the store's watcher thread to the GUI thread"""
+    config_changed = pyqtSignal(dict)
+
+    def __init__(self, store):
+        super().__init__()
+        store.watch(self.config_changed.emit)
+
+
 class MainApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
+        # Before any window, so the config dialog's font lists include them
+        font_registry.load_fonts()
         self.config = load_config()
+        theme_manager.apply(self.config.get('theme', DEFAULT_CONFIG['theme']))
         self.config_window = None
         self.display_window = None
 
+        # Only queues events; a background thread does the writing
+        self.history_store = None
+        if self.config.get('history_enabled', DEFAULT_CONFIG['history_enabled']):
+            self.history_store = HistoryStore(HISTORY_FILE)
+
+        # Counts paint events app-wide so low-power savings can be measured
+        self.repaint_counter = None
+        if self.config.get('repaint_counter_enabled', DEFAULT_CONFIG['repaint_counter_enabled']):
+            self.repaint_counter = RepaintCounter()
+            self.app.installEventFilter(self.repaint_counter)
+
+        # Separate database reader process, when enabled (see update_collector)
+        self.collector = None
+
+        # Pick up edits made by another instance or a deployment script
+        self.config_file_watcher = ConfigFileWatcher(config_store)
+        self.config_file_watcher.config_changed.connect(self.on_config_file_changed)
+
+    def on_config_file_changed(self, config):
+        """Apply a config that was changed on disk outside this instance"""
+        self.config = config
+        if self.config_window:
+            self.config_window.config_changed_on_disk(config)
+            if self.config_window.isVisible():
+                # Don't yank settings out from under an open dialog; it warns before saving over them
+                return
+        theme_manager.apply(self.config.get('theme', DEFAULT_CONFIG['theme']))
+        self.update_collector()
+        if self.display_window:
+            self.display_window.config = self.config
+            self.display_window.apply_styles()
+            self.display_window.apply_refresh_settings()
+            self.display_window.update_display()
+
     def load_config_and_show_display(self):
         self.config = load_config()
-        if not self.config.get('db_path') or not os.path.exists(self.config['db_path']):
+        theme_manager.apply(self.config.get('theme', DEFAULT_CONFIG['theme']))
+        has_database = self.config.get('db_path') and os.path.exists(self.config['db_path'])
+        if not has_database and not self.config.get('server_url'):
             self.show_config_window()
         else:
             self.show_display_window()
@@ -1390,7 +2145,27 @@ class MainApp:
             self.display_window.close()
             self.display_window = None
 
+    def update_collector(self):
+        """Start, stop or restart the collector process to match the config"""
+        # A display following a rotation server has no database to read
+        enabled = (self.config.get('collector_enabled', DEFAULT_CONFIG['collector_enabled'])
+                   and not self.config.get('server_url'))
+        db_path = self.config.get('db_path')
+        use_mirror = self.config.get('db_mirror_enabled', DEFAULT_CONFIG['db_mirror_enabled'])
+        if self.collector and (not enabled or not self.collector.is_for(db_path, use_mirror)):
+            self.collector.stop()
+            self.collector = None
+        if enabled and db_path and not self.collector:
+            self.collector = CollectorSupervisor(db_path, use_mirror)
+            self.collector.snapshot_received.connect(self.on_collector_snapshot)
+            self.collector.start()
+
+    def on_collector_snapshot(self, snapshot):
+        if self.display_window:
+            self.display_window.update_display()
+
     def show_display_window(self):
+        self.update_collector()
         if not self.display_window:
             self.display_window = DisplayWindow(self.config)
             self.display_window.main_app = self  # Set reference to MainApp
@@ -1398,6 +2173,7 @@ class MainApp:
             # Reload config and apply new styles
             self.display_window.config = self.config
             self.display_window.apply_styles()
+            self.display_window.apply_refresh_settings()
         self.display_window.update_display()
         self.display_window.show()
 
@@ -1406,7 +2182,13 @@ class MainApp:
 
     def run(self):
         self.load_config_and_show_display()
-        sys.exit(self.app.exec())
+        exit_code = self.app.exec()
+        config_store.flush()
+        if self.history_store:
+            self.history_store.close()
+        if self.collector:
+            self.collector.stop()
+        sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -1,20 +1,29 @@
 import sys
 import os
 import json
-import sqlite3
 import logging
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, jsonify, render_template, request, url_for, abort
 from flask_socketio import SocketIO
 import time
-from threading import Thread
+from threading import Thread, Event, Condition, Lock
 import pystray
 from PIL import Image, ImageDraw
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget,
     QFileDialog, QMessageBox, QSpinBox, QHBoxLayout, QPushButton,
-    QLineEdit, QStatusBar, QDialog, QComboBox, QFormLayout
+    QLineEdit, QStatusBar, QDialog, QComboBox, QFormLayout, QCheckBox
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from config_store import ConfigStore
+from song_cache import song_cache
+from refresh_scheduler import scheduler_from_config
+from wait_times import WaitEstimator, DEFAULT_CHANGEOVER_SECONDS, format_wait
+from snapshot_bus import SnapshotSubscriber
+from server_logging import setup_logging
+from app_paths import get_app_data_dir
+from rotation_source import open_rotation_source, RotationSourceError, FILE_DIALOG_FILTER
+from rotation_stream import EVENTS_PATH, KEEPALIVE_SECONDS, KEEPALIVE_EVENT, format_event
+from web_assets import StaticAssets, PageCache, asset_response, IMMUTABLE_CACHE_CONTROL, PAGE_CACHE_CONTROL
 
 # Configuration
 CONFIG_FILE = 'config.json'
@@ -26,59 +35,48 @@ DEFAULT_CONFIG = {
     'display_title': 'Singer Rotation',
     'venue_name': "Harry's Bar",
     'refresh_interval': 5,  # Seconds between database refreshes
+    'adaptive_refresh': True,  # Poll fast after changes, back off while idle
+    'refresh_min_interval': 1,
+    'refresh_max_interval': 30,
     'log_file': 'rotation_server.log',
+    'db_mirror_enabled': False,  # Query an in-memory snapshot instead of the live OpenKJ database
+    'changeover_seconds': DEFAULT_CHANGEOVER_SECONDS,  # Allowance between singers for wait estimates
+    'bus_enabled': False,  # Take rotation snapshots from the local snapshot bus instead of reading the database
+    'html_fragments_enabled': False,  # Render the web display's rotation on the server, for weak TV browsers
 }
 
 # Logging Setup
-# Create a logger
+# Records go through a queue, so request threads never wait on the console or the log file
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+LOG_FILE = get_app_data_dir() / 'logs' / DEFAULT_CONFIG['log_file']
+# Werkzeug logs every request; with a handler already attached it doesn't add its own console one
+stop_logging = setup_logging(LOG_FILE, logger, logging.getLogger('werkzeug'))
 
-# Create a file handler and set the logging format
-log_file = DEFAULT_CONFIG['log_file']
-file_handler = logging.FileHandler(log_file)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
 
-# Add the file handler to the logger
-logger.addHandler(file_handler)
-
-# Create a stream handler for console output (optional)
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
+config_store = ConfigStore(CONFIG_FILE, DEFAULT_CONFIG, logger=logger)
 
 
 def load_config():
-    try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                # Ensure all keys from DEFAULT_CONFIG are present
-                full_config = DEFAULT_CONFIG.copy()
-                full_config.update(config)
-                return full_config
-        else:
-            return DEFAULT_CONFIG
-    except Exception as e:
-        logger.error(f"Error loading config: {e}, using defaults.")
-        return DEFAULT_CONFIG
+    return config_store.load()
 
 
 def save_config(config):
-    try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
-        logger.info("Configuration saved successfully.")
-    except Exception as e:
-        logger.error(f"Error saving config: {e}")
+    config_store.save(config)
 
 
 config = load_config()
+refresh_scheduler = scheduler_from_config(config)
+wait_estimator = WaitEstimator(config['changeover_seconds'])
+DB_WATCH_INTERVAL = 0.5  # Seconds between cheap RotationSource.changed() checks while waiting to refresh
+BUS_STALE_SECONDS = 10  # Fall back to reading the database after this long without word from the bus
+LONG_POLL_SECONDS = 25  # How long /api/rotation/html holds a request waiting for a change
 
 # Flask App
-app = Flask(__name__)
+app = Flask(__name__, static_folder=None)  # Static files are served fingerprinted; see static_asset
 app.config['SECRET_KEY'] = 'secret!'
+static_assets = StaticAssets(os.path.join(app.root_path, 'static'))
+app.jinja_env.globals['asset_url'] = lambda name: url_for('static_asset', filename=static_assets.fingerprinted(name))
+app.jinja_env.globals['format_wait'] = format_wait
 socketio = SocketIO(app, cors_allowed_origins="*", logger=False, engineio_logger=False)  # Disable SocketIO's default logger
 
 
@@ -87,168 +85,328 @@ logger.setLevel(config['log_level'].upper())
 app.logger.setLevel(config['log_level'].upper())
 
 
-# Database Helper Functions (Same as before, but using config)
-def get_db_connection():
-    try:
-        conn = sqlite3.connect(config['db_path'])
-        conn.row_factory = sqlite3.Row  # Access columns by name
-        return conn
-    except sqlite3.Error as e:
-        logger.error(f"Database connection error: {e}")
-        return None  # Critical:  Return None if the connection fails.
+def on_config_file_changed(new_config):
+    """Apply a config that was changed on disk outside this process"""
+    global config
+    config = new_config
+    refresh_scheduler.configure(config['refresh_min_interval'], config['refresh_max_interval'])
+    wait_estimator.configure(config['changeover_seconds'])
+    update_bus_subscriber()
+    logger.setLevel(config['log_level'].upper())
+    app.logger.setLevel(config['log_level'].upper())
 
 
-def get_current_singer_and_song():
-    conn = get_db_connection()
-    if not conn:
-        return None  # Handle connection failure
+config_store.watch(on_config_file_changed)
 
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT singerid, name, position FROM rotationSingers ORDER BY position ASC LIMIT 1")
-        current_singer_data = cursor.fetchone()
 
-        if current_singer_data:
-            singer_id = current_singer_data['singerid']  # Access by column name
-            singer_name = current_singer_data['name']
+# Snapshot Bus
+bus_snapshot = None  # Last snapshot published for our database
+bus_changed = Event()  # Set when a new snapshot arrives, to wake the updater thread
 
-            song_info = get_next_song_for_singer(conn, singer_id)
 
-            return {
-                'singer_id': singer_id,
-                'singer_name': singer_name,
-                'song': song_info
-            }
-        else:
-            return None
+def on_bus_message(message):
+    global bus_snapshot
+    if message['type'] != 'snapshot' or message.get('db_path') != os.path.abspath(config['db_path']):
+        return
+    bus_snapshot = message
+    bus_changed.set()
 
-    except sqlite3.Error as e:
-        logger.error(f"Database query error: {e}")
-        return None
 
-    finally:
-        conn.close()
+bus_subscriber = SnapshotSubscriber(on_bus_message)
 
 
-def get_up_next_singers_and_songs():
-    conn = get_db_connection()
-    if not conn:
-        return []  # Handle connection failure
+def update_bus_subscriber():
+    """Start or stop listening to the snapshot bus to match the config"""
+    global bus_snapshot
+    if config.get('bus_enabled', False) and not bus_subscriber.running():
+        logger.info("Subscribing to the rotation snapshot bus.")
+        bus_subscriber.start()
+    elif not config.get('bus_enabled', False) and bus_subscriber.running():
+        bus_subscriber.stop()
+        bus_snapshot = None
 
+
+def bus_rotation():
+    """Rotation entries from the bus, or None if it's off, silent, or serving another database"""
+    snapshot = bus_snapshot
+    if not config.get('bus_enabled', False) or snapshot is None:
+        return None
+    if snapshot.get('db_path') != os.path.abspath(config['db_path']):
+        return None
+    age = bus_subscriber.message_age()
+    if age is None or age > BUS_STALE_SECONDS:
+        return None
+    return snapshot['rotation']
+
+
+# Database Helper Functions
+rotation_source_key = None
+rotation_source_instance = None
+rotation_source_lock = Lock()
+
+
+def rotation_source():
+    """The RotationSource for the configured path, reopened when the config changes"""
+    global rotation_source_key, rotation_source_instance
+    key = (config['db_path'], config.get('db_mirror_enabled', False))
+    with rotation_source_lock:
+        if key != rotation_source_key:
+            if rotation_source_instance is not None:
+                rotation_source_instance.close()
+            rotation_source_instance = open_rotation_source(*key)
+            rotation_source_key = key
+        return rotation_source_instance
+
+
+def read_rotation_snapshot():
+    """Read the current singer and the up-next singers as of a single moment
+
+    The source reads everything inside one read transaction, and SQLite
+    gives a transaction a fixed view of the database until it ends: a
+    rotation change OpenKJ commits meanwhile is either entirely visible or
+    not at all, so a singer can't appear both on stage and up next, or be
+    skipped. Returns every rotation entry (the event stream sends them all),
+    [] on error.
+    """
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT singerid, name, position FROM rotationSingers ORDER BY position ASC LIMIT 1, ?",
-                       (config['num_up_next'],))  # Skip current singer
-        singers_data = cursor.fetchall()
-
-        up_next = []
-        for singer_data in singers_data:
-            singer_id = singer_data['singerid']  # Access by column name
-            singer_name = singer_data['name']
-            song_info = get_next_song_for_singer(conn, singer_id)
-
-            up_next.append({
-                'singer_id': singer_id,
-                'singer_name': singer_name,
-                'song': song_info
-            })
-
-        return up_next
-
-    except sqlite3.Error as e:
+        return rotation_source().read()
+    except RotationSourceError as e:
         logger.error(f"Database query error: {e}")
         return []
 
-    finally:
-        conn.close()
-
-
-def get_next_song_for_singer(conn, singer_id):
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT qs.song
-            FROM queueSongs qs
-            WHERE qs.singer = ? AND qs.played = 0
-            ORDER BY qs.position ASC
-            LIMIT 1
-        """, (singer_id,))
-        next_song_queue_data = cursor.fetchone()
-
-        if next_song_queue_data:
-            song_id = next_song_queue_data['song']  # Access by column name
-            return get_song_details(conn, song_id)
-        else:
-            return None
-
-    except sqlite3.Error as e:
-        logger.error(f"Database error in get_next_song_for_singer: {e}")
-        return None  # Return none in the event of a failure
-
-
-def get_song_details(conn, song_id):
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT ds.Title, ds.Artist
-            FROM dbSongs ds
-            WHERE ds.songid = ?
-        """, (song_id,))
-        song_data = cursor.fetchone()
-
-        if song_data:
-            return {
-                'title': song_data['Title'],  # Access by column name
-                'artist': song_data['Artist']  # Access by column name
-            }
-        else:
-            return None
-
-    except sqlite3.Error as e:
-        logger.error(f"Database error in get_song_details: {e}")
-        return None  # Return none in the event of a failure
-
 
 # API Endpoints (Same as before)
 @app.route('/')
 def index():
-    return render_template('index.html')  # Create a basic index.html
+    # Served from memory unless the rotation changed, or the minute the wait texts were rendered in passed
+    # (browsers without JavaScript only see waits count down by reloading)
+    payload = latest_payload or build_rotation_payload()
+    fragments = config.get('html_fragments_enabled', False)
+    wait_minute = int(time.time() // 60)
+    page = page_cache.get(json.dumps([payload, fragments, wait_minute], sort_keys=True), payload)
+    return asset_response(app.response_class, request, page, PAGE_CACHE_CONTROL)
+
+
+@app.route('/api/rotation/html')
+def get_rotation_html():
+    """The rendered rotation; with ?since=<version>, held until there's a newer one (long poll)"""
+    since = request.args.get('since')
+    deadline = time.monotonic() + LONG_POLL_SECONDS
+    while True:
+        generation = rotation_generation
+        fragment = rotation_fragment(latest_payload or build_rotation_payload())
+        remaining = deadline - time.monotonic()
+        if fragment.etag != since or remaining <= 0:
+            break
+        with rotation_changed:
+            rotation_changed.wait_for(lambda: rotation_generation != generation, remaining)
+    if fragment.etag == since:
+        return '', 204
+    return jsonify(fragment_message(fragment))
+
+
+@app.route(EVENTS_PATH)
+def rotation_events():
+    """The rotation as Server-Sent Events: the whole rotation, then again on every change
+
+    For Qt displays in client mode (see rotation_stream.py). Unlike the
+    page and /api/rotation it isn't cut to num_up_next, since a display
+    may show more singers or run a carousel through all of them. A comment
+    goes out when nothing changed for KEEPALIVE_SECONDS, so clients can
+    tell a quiet rotation from a dead connection.
+    """
+    def stream():
+        generation = None
+        while True:
+            with rotation_changed:
+                rotation_changed.wait_for(lambda: rotation_generation != generation, KEEPALIVE_SECONDS)
+                changed = rotation_generation != generation
+                generation = rotation_generation
+            if changed:
+                rotation = latest_rotation if latest_rotation is not None else current_rotation()
+                yield format_event('rotation', {'rotation': rotation}, generation)
+            else:
+                yield KEEPALIVE_EVENT
+
+    logger.info("Event stream client connected", extra={'event': 'stream_connect'})
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/static/<path:filename>')
+def static_asset(filename):
+    asset = static_assets.get(filename)
+    if asset is None:
+        abort(404)
+    return asset_response(app.response_class, request, asset, IMMUTABLE_CACHE_CONTROL)
 
 
 @app.route('/api/rotation')
 def get_rotation():
-    current = get_current_singer_and_song()
-    up_next = get_up_next_singers_and_songs()
+    payload = build_rotation_payload()
+    now = time.time()
+    for singer in payload['up_next']:
+        start = singer['estimated_start']
+        singer['wait_seconds'] = None if start is None else max(0, round(start - now))
+    return jsonify(payload)
+
 
+@app.route('/api/metrics')
+def get_metrics():
     return jsonify({
-        'display_title': config['display_title'],
-        'venue_name': config['venue_name'],
-        'current': current,
-        'up_next': up_next
+        'refresh_interval': current_refresh_interval(),
+        'adaptive_refresh': config.get('adaptive_refresh', True),
+        'song_cache': song_cache.stats()
     })
 
 
-@socketio.on('connect')
-def test_connect(auth):
-    print('Client connected')
-    emit_rotation_data()
+@app.route('/api/library/reload', methods=['POST'])
+def reload_library():
+    song_cache.invalidate()
+    logger.info("Song library cache invalidated.")
+    return jsonify({'status': 'ok'})
 
 
-def emit_rotation_data():
-    current = get_current_singer_and_song()
-    up_next = get_up_next_singers_and_songs()
-    socketio.emit('rotation_update', {
+@socketio.on('connect')
+def test_connect(auth):
+    # Sampled: a room of TVs reconnecting at once would otherwise flood the log
+    logger.info("Client connected", extra={'event': 'client_connect', 'sid': request.sid})
+    # Only the new client needs the current rotation; everyone else has it already
+    payload = latest_payload or build_rotation_payload()
+    emit_rotation_data(payload, to=request.sid)
+    if config.get('html_fragments_enabled', False):
+        emit_rotation_html(payload, to=request.sid)
+
+
+def add_wait_estimates(current, up_next):
+    """Set estimated_start (Unix seconds, or None with no song queued) on each up-next singer
+
+    Estimates are anchored to when the current singer took over, so they only
+    change when the rotation does and don't defeat the unchanged-payload check.
+    """
+    singers = ([current] if current else []) + up_next
+    starts = wait_estimator.update([
+        (singer['singer_id'], singer['song']['duration'] if singer['song'] else None)
+        for singer in singers
+    ])
+    for singer, start in zip(singers, starts):
+        if singer is not current:
+            singer['estimated_start'] = round(start) if singer['song'] else None
+
+
+def payload_singer(entry):
+    """A rotation entry in the shape the API and the page use"""
+    song = None
+    if entry['title'] is not None:
+        song = {'title': entry['title'], 'artist': entry['artist'], 'duration': entry['duration']}
+    return {'singer_id': entry['singer_id'], 'singer_name': entry['singer_name'], 'song': song}
+
+
+def current_rotation():
+    """Every rotation entry, from the bus when it's live, otherwise from the database"""
+    entries = bus_rotation()
+    return entries if entries is not None else read_rotation_snapshot()
+
+
+def build_rotation_payload(entries=None):
+    if entries is None:
+        entries = current_rotation()
+    current = payload_singer(entries[0]) if entries else None
+    up_next = [payload_singer(entry) for entry in entries[1:1 + config['num_up_next']]]
+    add_wait_estimates(current, up_next)
+    return {
         'display_title': config['display_title'],
         'venue_name': config['venue_name'],
         'current': current,
         'up_next': up_next
-    })
+    }
+
+
+def render_page(payload):
+    fragments = config.get('html_fragments_enabled', False)
+    return render_template('index.html', payload=payload, fragments=fragments,
+                           fragment_version=rotation_fragment(payload).etag if fragments else None,
+                           refresh_seconds=config['refresh_interval'])
+
+
+page_cache = PageCache(render_page)
+fragment_cache = PageCache(lambda payload: render_template('_rotation.html', payload=payload))
+latest_payload = None  # Last payload built by the updater thread
+latest_rotation = None  # The whole rotation that payload was built from, for the event stream
+rotation_generation = 0  # Bumped on every rotation change, to wake long polls
+rotation_changed = Condition()
+
+
+def rotation_fragment(payload):
+    """The rotation as HTML, rendered once per payload however many clients ask"""
+    return fragment_cache.get(json.dumps(payload, sort_keys=True), payload)
+
+
+def fragment_message(fragment):
+    return {'version': fragment.etag, 'html': fragment.body.decode('utf-8')}
+
+
+def emit_rotation_data(payload=None, to=None):
+    """Send the rotation to one client (to=its sid), or to every client"""
+    socketio.emit('rotation_update', payload or build_rotation_payload(), to=to)
+
+
+def emit_rotation_html(payload, to=None):
+    with app.app_context():
+        fragment = rotation_fragment(payload)
+    socketio.emit('rotation_html', fragment_message(fragment), to=to)
+
+
+def current_refresh_interval():
+    if config.get('adaptive_refresh', True):
+        return refresh_scheduler.interval
+    return config['refresh_interval']
+
+
+def wait_for_next_refresh():
+    """Sleep until the refresh interval passes or the rotation source changes
+
+    With the snapshot bus live, a published snapshot ends the wait instead
+    and the database isn't touched.
+    """
+    deadline = time.monotonic() + current_refresh_interval()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if bus_rotation() is not None:
+            if bus_changed.wait(min(DB_WATCH_INTERVAL, remaining)):
+                bus_changed.clear()
+                refresh_scheduler.reset()
+                return
+            continue
+        time.sleep(min(DB_WATCH_INTERVAL, remaining))
+        if rotation_source().changed():
+            # Written to since we last looked; refresh now and poll fast again
+            refresh_scheduler.reset()
+            return
 
 
 def update_rotation_data():
+    global latest_payload, latest_rotation, rotation_generation
     while True:
-        emit_rotation_data()
-        time.sleep(config['refresh_interval'])  # Use configured refresh interval
+        entries = current_rotation()
+        payload = build_rotation_payload(entries)
+        if payload != latest_payload:
+            emit_rotation_data(payload)
+            if config.get('html_fragments_enabled', False):
+                emit_rotation_html(payload)
+        # Singers past num_up_next can change without the payload changing; the event stream still sends them
+        changed = payload != latest_payload or entries != latest_rotation
+        if changed:
+            latest_payload, latest_rotation = payload, entries
+            with rotation_changed:
+                rotation_generation += 1
+                rotation_changed.notify_all()
+        refresh_scheduler.record(changed)
+        logger.debug("Next rotation refresh scheduled",
+                     extra={'event': 'refresh_scheduled', 'interval': current_refresh_interval()})
+        wait_for_next_refresh()
 
 
 # Configuration GUI (PyQt6)
@@ -267,6 +425,13 @@ class ConfigWindow(QMainWindow):
         self.display_title_input = None
         self.venue_name_input = None
         self.refresh_interval_spinbox = None
+        self.db_mirror_checkbox = None
+        self.adaptive_refresh_checkbox = None
+        self.refresh_min_spinbox = None
+        self.refresh_max_spinbox = None
+        self.changeover_spinbox = None
+        self.bus_checkbox = None
+        self.html_fragments_checkbox = None
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -302,6 +467,23 @@ class ConfigWindow(QMainWindow):
         db_layout.addWidget(db_button)
         form_layout.addRow("Database Path:", db_widget)
 
+        # Snapshot Mirror
+        self.db_mirror_checkbox = QCheckBox()
+        self.db_mirror_checkbox.setChecked(self.config.get('db_mirror_enabled', False))
+        form_layout.addRow("Read From Snapshot Mirror:", self.db_mirror_checkbox)
+
+        # Snapshot Bus
+        self.bus_checkbox = QCheckBox()
+        self.bus_checkbox.setChecked(self.config.get('bus_enabled', False))
+        self.bus_checkbox.setToolTip("Share the rotation reader of a display running on this machine")
+        form_layout.addRow("Use Snapshot Bus:", self.bus_checkbox)
+
+        # Server-Rendered Web Display
+        self.html_fragments_checkbox = QCheckBox()
+        self.html_fragments_checkbox.setChecked(self.config.get('html_fragments_enabled', False))
+        self.html_fragments_checkbox.setToolTip("Send ready-made HTML to the web display, for slow smart-TV browsers")
+        form_layout.addRow("Pre-render Web Display:", self.html_fragments_checkbox)
+
         # Number of Up Next Singers
         self.num_up_next_spinbox = QSpinBox()
         self.num_up_next_spinbox.setValue(self.config['num_up_next'])
@@ -323,8 +505,39 @@ class ConfigWindow(QMainWindow):
         self.refresh_interval_spinbox.setMinimum(1)
         self.refresh_interval_spinbox.setMaximum(60)
         self.refresh_interval_spinbox.setMinimumWidth(100)
+        self.refresh_interval_spinbox.setToolTip("Used when Adaptive Refresh is off")
         form_layout.addRow("Refresh Interval (seconds):", self.refresh_interval_spinbox)
 
+        # Adaptive Refresh, and how fast and slow it polls
+        self.adaptive_refresh_checkbox = QCheckBox()
+        self.adaptive_refresh_checkbox.setChecked(self.config.get('adaptive_refresh', True))
+        form_layout.addRow("Adaptive Refresh:", self.adaptive_refresh_checkbox)
+
+        self.refresh_min_spinbox = QSpinBox()
+        self.refresh_min_spinbox.setRange(1, 60)
+        self.refresh_min_spinbox.setValue(self.config['refresh_min_interval'])
+        self.refresh_min_spinbox.setMinimumWidth(100)
+        self.refresh_min_spinbox.setToolTip("How often Adaptive Refresh checks right after the rotation changed")
+        form_layout.addRow("Fastest Refresh (seconds):", self.refresh_min_spinbox)
+
+        self.refresh_max_spinbox = QSpinBox()
+        self.refresh_max_spinbox.setRange(self.config['refresh_min_interval'], 300)
+        self.refresh_max_spinbox.setValue(self.config['refresh_max_interval'])
+        self.refresh_max_spinbox.setMinimumWidth(100)
+        self.refresh_max_spinbox.setToolTip("The longest Adaptive Refresh waits between checks while nothing happens")
+        form_layout.addRow("Slowest Refresh (seconds):", self.refresh_max_spinbox)
+        self.refresh_min_spinbox.valueChanged.connect(self.refresh_max_spinbox.setMinimum)
+
+        self.adaptive_refresh_checkbox.toggled.connect(self.update_refresh_controls)
+        self.update_refresh_controls()
+
+        # Changeover Allowance
+        self.changeover_spinbox = QSpinBox()
+        self.changeover_spinbox.setMaximum(600)
+        self.changeover_spinbox.setValue(self.config.get('changeover_seconds', DEFAULT_CHANGEOVER_SECONDS))
+        self.changeover_spinbox.setMinimumWidth(100)
+        form_layout.addRow("Changeover Allowance (seconds):", self.changeover_spinbox)
+
         # Log Level
         self.log_level_combo = QComboBox()
         self.log_level_combo.addItems(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'])
@@ -342,10 +555,17 @@ class ConfigWindow(QMainWindow):
     def browse_db(self):
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getOpenFileName(self, "Select openkj.sqlite Database", "",
-                                                   "SQLite Database (*.sqlite *.db)")
+                                                   FILE_DIALOG_FILTER)
         if file_path:
             self.db_path_label_display.setText(file_path)
 
+    def update_refresh_controls(self):
+        """Enable the interval settings that apply in the chosen refresh mode"""
+        adaptive = self.adaptive_refresh_checkbox.isChecked()
+        self.refresh_interval_spinbox.setEnabled(not adaptive)
+        self.refresh_min_spinbox.setEnabled(adaptive)
+        self.refresh_max_spinbox.setEnabled(adaptive)
+
     def save_config(self):
         new_config = {
             'db_path': self.db_path_label_display.text(),
@@ -354,7 +574,14 @@ class ConfigWindow(QMainWindow):
             'log_level': self.log_level_combo.currentText(),
             'display_title': self.display_title_input.text(),
             'venue_name': self.venue_name_input.text(),
-            'refresh_interval': self.refresh_interval_spinbox.value()
+            'refresh_interval': self.refresh_interval_spinbox.value(),
+            'db_mirror_enabled': self.db_mirror_checkbox.isChecked(),
+            'bus_enabled': self.bus_checkbox.isChecked(),
+            'html_fragments_enabled': self.html_fragments_checkbox.isChecked(),
+            'adaptive_refresh': self.adaptive_refresh_checkbox.isChecked(),
+            'refresh_min_interval': self.refresh_min_spinbox.value(),
+            'refresh_max_interval': self.refresh_max_spinbox.value(),
+            'changeover_seconds': self.changeover_spinbox.value()
         }
 
         # Validate Configuration
@@ -375,6 +602,9 @@ class ConfigWindow(QMainWindow):
         save_config(new_config)
         global config
         config = load_config()  # Reload the config
+        refresh_scheduler.configure(config['refresh_min_interval'], config['refresh_max_interval'])
+        wait_estimator.configure(config['changeover_seconds'])
+        update_bus_subscriber()
 
         # Reconfigure Logging
         logger.setLevel(config['log_level'].upper())
@@ -397,6 +627,8 @@ def create_tray_icon(config_window):
         config_window.activateWindow()
 
     def exit_action(icon, item):
+        config_store.flush()
+        stop_logging()
         icon.stop()
         os._exit(0)
 
@@ -428,6 +660,7 @@ if __name__ == '__main__':
             socketio.run(app, debug=False, host='0.0.0.0', port=config['server_port'], allow_unsafe_werkzeug=True)
         except Exception as e:
             logger.error(f"Flask application error: {e}")
+            stop_logging()
             tray_icon.stop()
             os._exit(1)  # Exit if Flask fails to start
 
@@ -435,6 +668,8 @@ if __name__ == '__main__':
     flask_thread.daemon = True
     flask_thread.start()
 
+    update_bus_subscriber()
+
     # Start the data updater thread *after* Flask is running
     time.sleep(1)  # Give Flask a moment to start
     updater_thread = Thread(target=update_rotation_data)
@@ -443,5 +678,6 @@ if __name__ == '__main__':
 
     exit_code = app_pyqt.exec()
 
+    config_store.flush()
     tray_icon.stop()
     sys.exit(exit_code)
\ No newline at end of file
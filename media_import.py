@@ -0,0 +1,152 @@
+import os
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+from PyQt6.QtCore import Qt, QObject, QRunnable, QSize, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QImageReader, QImageWriter, QImageIOHandler
+
+FALLBACK_SCREEN_SIZE = QSize(1920, 1080)
+THUMBNAIL_SIZE = QSize(160, 90)
+ENCODE_QUALITY = 85
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def largest_screen_size():
+    """Largest attached screen in device pixels; call on the GUI thread"""
+    best = QSize()
+    for screen in QGuiApplication.screens():
+        ratio = screen.devicePixelRatio()
+        size = QSize(round(screen.geometry().width() * ratio), round(screen.geometry().height() * ratio))
+        if size.width() * size.height() > best.width() * best.height():
+            best = size
+    return best if best.isValid() and not best.isEmpty() else FALLBACK_SCREEN_SIZE
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def output_format(has_alpha):
+    """WebP when this Qt build can write it, otherwise PNG for transparency and JPEG for photos"""
+    if b'webp' in QImageWriter.supportedImageFormats():
+        return 'webp'
+    return 'png' if has_alpha else 'jpg'
+
+
+def _rotates(reader):
+    return bool(reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90)
+
+
+def shown_size(reader):
+    """The image's size once its EXIF rotation is applied (reader.size() is before it)"""
+    size = reader.size()
+    return size.transposed() if _rotates(reader) else size
+
+
+def set_scaled_shown_size(reader, size):
+    """Decode to size as shown; setScaledSize() applies before the EXIF rotation"""
+    reader.setScaledSize(size.transposed() if _rotates(reader) else size)
+
+
+def import_image(source_path, media_dir, prefix, max_size):
+    """Copy an image into media_dir, downscaled to fit max_size and re-encoded
+
+    Assets are named by the hash of the source file plus the target size, so
+    importing the same picture again returns the existing asset without
+    decoding anything. Animated images (GIF backgrounds) are stored as-is
+    so they keep animating. Safe to call off the GUI thread.
+    """
+    media_dir = Path(media_dir)
+    media_dir.mkdir(parents=True, exist_ok=True)
+    name = f"{prefix}_{file_digest(source_path)[:16]}_{max_size.width()}x{max_size.height()}"
+
+    # Same file imported for the same screen size before
+    for existing in media_dir.glob(f"{name}.*"):
+        return existing
+
+    reader = QImageReader(str(source_path))
+    reader.setAutoTransform(True)  # Apply EXIF rotation from phone and camera shots
+    if reader.supportsAnimation() and reader.imageCount() > 1:
+        dest = media_dir / f"{name}{Path(source_path).suffix.lower()}"
+        _atomic_copy(source_path, dest)
+        return dest
+
+    size = shown_size(reader)
+    if size.isValid() and (size.width() > max_size.width() or size.height() > max_size.height()):
+        # Decoders like JPEG can scale while decoding, so the full-size image is never in memory
+        set_scaled_shown_size(reader, size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(f"Could not read image: {reader.errorString()}")
+
+    fmt = output_format(image.hasAlphaChannel())
+    dest = media_dir / f"{name}.{fmt}"
+    fd, tmp_path = tempfile.mkstemp(dir=media_dir, suffix=f".{fmt}")
+    os.close(fd)
+    try:
+        writer = QImageWriter(tmp_path, fmt.encode())
+        writer.setQuality(ENCODE_QUALITY)
+        if not writer.write(image):
+            raise ValueError(f"Could not save image: {writer.errorString()}")
+        os.replace(tmp_path, dest)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return dest
+
+
+def _atomic_copy(source_path, dest):
+    fd, tmp_path = tempfile.mkstemp(dir=dest.parent, suffix=dest.suffix)
+    os.close(fd)
+    try:
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, dest)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_thumbnail(path, size=THUMBNAIL_SIZE):
+    """Decode just enough of an image for a preview; returns a null QImage on failure"""
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    source_size = shown_size(reader)
+    if source_size.isValid():
+        set_scaled_shown_size(reader, source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+class MediaImportSignals(QObject):
+    # request id, imported path ('' if only a preview was asked for), thumbnail
+    finished = pyqtSignal(str, str, QImage)
+    failed = pyqtSignal(str, str)
+
+
+class MediaImportTask(QRunnable):
+    """Imports an image (if max_size is given) and renders its thumbnail on the thread pool"""
+
+    def __init__(self, request_id, source_path, media_dir=None, prefix=None, max_size=None):
+        super().__init__()
+        self.request_id = request_id
+        self.source_path = source_path
+        self.media_dir = media_dir
+        self.prefix = prefix
+        self.max_size = max_size
+        self.signals = MediaImportSignals()
+
+    def run(self):
+        try:
+            path = self.source_path
+            imported = ''
+            if self.max_size is not None:
+                path = imported = str(import_image(self.source_path, self.media_dir, self.prefix, self.max_size))
+            self.signals.finished.emit(self.request_id, imported, load_thumbnail(path))
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
@@ -0,0 +1,45 @@
+DEFAULT_MIN_INTERVAL = 1
+DEFAULT_MAX_INTERVAL = 30
+DEFAULT_BACKOFF = 2.0
+
+
+class AdaptiveScheduler:
+    """Picks the next refresh interval from recent activity
+
+    Right after a change the rotation tends to keep moving (a shuffle, a run
+    of new signups), so polling drops to min_interval. Every refresh that
+    finds nothing new multiplies the interval by backoff, up to
+    max_interval, so long breaks cost almost nothing. reset() is for
+    external hints such as a file watcher firing.
+    """
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL,
+                 backoff=DEFAULT_BACKOFF):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.interval = min_interval
+
+    def record(self, changed):
+        """Update the interval after a refresh; returns the new interval in seconds"""
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return self.interval
+
+    def reset(self):
+        self.interval = self.min_interval
+        return self.interval
+
+    def configure(self, min_interval, max_interval):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+
+
+def scheduler_from_config(config):
+    return AdaptiveScheduler(
+        config.get('refresh_min_interval', DEFAULT_MIN_INTERVAL),
+        config.get('refresh_max_interval', DEFAULT_MAX_INTERVAL),
+    )
@@ -0,0 +1,38 @@
+import time
+from PyQt6.QtCore import QObject, QEvent
+
+
+class RepaintCounter(QObject):
+    """Application-wide event filter that counts paint events and painted pixels
+
+    Installed on the QApplication it sees every widget's paint event, so it
+    shows how much of the window each clock tick or refresh really repaints.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paint_events = 0
+        self.painted_pixels = 0
+        self.started = time.monotonic()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.paint_events += 1
+            # Bounding rect of the dirty region; slightly over-counts L-shaped updates
+            rect = event.rect()
+            self.painted_pixels += rect.width() * rect.height()
+        return False
+
+    def reset(self):
+        self.paint_events = 0
+        self.painted_pixels = 0
+        self.started = time.monotonic()
+
+    def stats(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return {
+            'paint_events': self.paint_events,
+            'painted_pixels': self.painted_pixels,
+            'paint_events_per_second': self.paint_events / elapsed,
+            'painted_pixels_per_second': self.painted_pixels / elapsed,
+        }
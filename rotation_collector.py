@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import argparse
+from snapshot_bus import SnapshotPublisher, BusInUseError
+from rotation_source import open_rotation_source, RotationSourceError
+
+POLL_INTERVAL = 0.25  # Seconds between RotationSource.changed() checks
+HEARTBEAT_INTERVAL = 1.0
+EXIT_BUS_IN_USE = 3  # Another collector is already publishing; not a failure
+
+
+class RotationCollector:
+    """The one database reader on the snapshot bus
+
+    Polls its rotation source (PRAGMA data_version for OpenKJ's database),
+    reads the whole rotation when it moved, and publishes a versioned
+    snapshot to every subscriber whenever the rotation changed. A heartbeat
+    goes out every second from the same loop, so a stalled read shows up on
+    the other end as silence. epoch is the collector's start time; snapshots
+    are ordered by (epoch, version) across collector restarts.
+    """
+
+    def __init__(self, db_path, use_mirror=False, address=None, family=None):
+        self.db_path = os.path.abspath(db_path)
+        self.use_mirror = use_mirror
+        self.source = open_rotation_source(self.db_path, use_mirror)
+        self.publisher = SnapshotPublisher(address, family)
+        self.epoch = time.time()
+        self.version = 0
+        self._rotation = None
+
+    def serve(self):
+        self.publisher.start()
+        last_heartbeat = 0
+        try:
+            while True:
+                message = self.poll()
+                if message is not None:
+                    self.publisher.publish(message)
+                elif time.monotonic() - last_heartbeat >= HEARTBEAT_INTERVAL:
+                    self.publisher.publish({'type': 'heartbeat', 'epoch': self.epoch, 'version': self.version,
+                                            'db_path': self.db_path})
+                else:
+                    time.sleep(POLL_INTERVAL)
+                    continue
+                last_heartbeat = time.monotonic()
+        finally:
+            self.publisher.close()
+            self.source.close()
+
+    def poll(self):
+        """Return a snapshot or error message if there's news, otherwise None"""
+        if not self.source.changed():
+            return None
+        try:
+            rotation = self.source.read()
+        except RotationSourceError as e:
+            return {'type': 'error', 'db_path': self.db_path, 'message': f"Database error: {e}"}
+
+        if rotation == self._rotation:
+            return None
+        self._rotation = rotation
+        self.version += 1
+        return self.snapshot()
+
+    def snapshot(self):
+        return {'type': 'snapshot', 'epoch': self.epoch, 'version': self.version, 'generated_at': time.time(),
+                'db_path': self.db_path, 'rotation': self._rotation}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish OpenKJ rotation snapshots on the local snapshot bus")
+    parser.add_argument('--db', required=True, help="OpenKJ database to read")
+    parser.add_argument('--address', help="Socket path or pipe name to listen on (default: the per-user bus)")
+    parser.add_argument('--family', choices=['AF_UNIX', 'AF_PIPE'])
+    parser.add_argument('--mirror', action='store_true', help="Read through the in-memory snapshot mirror")
+    args = parser.parse_args()
+
+    collector = RotationCollector(args.db, args.mirror, args.address, args.family)
+    try:
+        collector.serve()
+    except BusInUseError as e:
+        print(f"Rotation collector not started: {e}")
+        sys.exit(EXIT_BUS_IN_USE)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+import os
+import sys
+import gzip
+import json
+import time
+import sqlite3
+import argparse
+from db_mirror import MIRRORED_TABLES
+
+RECORDING_VERSION = 1
+DEFAULT_POLL_INTERVAL = 0.5
+MIN_SPEED = 1
+MAX_SPEED = 100
+# Created in every scratch database, so a later replay knows it may replace the file
+SCRATCH_MARKER_TABLE = 'rotationReplayScratch'
+
+
+class RotationRecorder:
+    """Records rotation snapshots from a live OpenKJ database into a gzipped NDJSON file
+
+    The first line holds the schema of the rotation tables. After that a
+    snapshot line is written only when PRAGMA data_version says another
+    connection committed and the rotation actually differs: the whole of
+    rotationSingers and the unplayed queueSongs, plus only the dbSongs rows
+    not already in the recording. Singer changes are also written as event
+    lines, so a night's recording stays small.
+    """
+
+    def __init__(self, db_path, out_path, poll_interval=DEFAULT_POLL_INTERVAL):
+        self.db_path = db_path
+        self.out_path = out_path
+        self.poll_interval = poll_interval
+        self.snapshots = 0
+        self.events = 0
+        self._conn = None
+        self._out = None
+        self._started = None
+        self._data_version = None
+        self._last_tables = None
+        self._current_singer = None
+        self._songs_written = set()
+
+    def start(self):
+        # Autocommit, so the read lock is only held inside our own BEGIN/COMMIT
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self._out = gzip.open(self.out_path, 'wt', encoding='utf-8')
+        self._started = time.monotonic()
+        placeholders = ','.join('?' * len(MIRRORED_TABLES))
+        schema = self._conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+            MIRRORED_TABLES
+        ).fetchall()
+        self._write({'type': 'header', 'version': RECORDING_VERSION, 'source': os.path.basename(self.db_path),
+                     'recorded_at': time.time(), 'schema': dict(schema)})
+
+    def poll(self):
+        """Record a snapshot if the database changed; returns True if one was written"""
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return False
+        self._data_version = data_version
+
+        self._conn.execute("BEGIN")
+        try:
+            singers = self._conn.execute("SELECT * FROM rotationSingers ORDER BY position").fetchall()
+            queue = self._conn.execute("SELECT * FROM queueSongs WHERE played = 0 ORDER BY singer, position").fetchall()
+            songs = self._conn.execute("""
+                SELECT * FROM dbSongs
+                WHERE songid IN (SELECT song FROM queueSongs WHERE played = 0)
+            """).fetchall()
+        finally:
+            self._conn.execute("COMMIT")
+
+        tables = (singers, queue)
+        if tables == self._last_tables:
+            return False
+        self._last_tables = tables
+
+        t = round(time.monotonic() - self._started, 3)
+        new_songs = [row for row in songs if row[0] not in self._songs_written]
+        self._songs_written.update(row[0] for row in new_songs)
+        self._write({'type': 'snapshot', 't': t, 'rotationSingers': singers, 'queueSongs': queue,
+                     'dbSongs': new_songs})
+        self.snapshots += 1
+
+        # rotationSingers is (singerid, name, position, ...); the first row is on stage
+        current = (singers[0][0], singers[0][1]) if singers else None
+        if current != self._current_singer:
+            if current is not None and self._current_singer is not None:
+                self._write({'type': 'singer_change', 't': t, 'singer_id': current[0], 'singer_name': current[1]})
+                self.events += 1
+            self._current_singer = current
+        return True
+
+    def run(self, duration=None):
+        """Poll until duration seconds pass (forever if None) or Ctrl+C"""
+        self.start()
+        try:
+            while duration is None or time.monotonic() - self._started < duration:
+                self.poll()
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def _write(self, record):
+        self._out.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def read_recording(path):
+    """Yield the records of a recording, header first"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RotationReplayer:
+    """Replays a recording into a scratch database at 1x-100x speed
+
+    The scratch database has OpenKJ's schema, so the display and the
+    rotation server can be pointed at it unchanged. Each snapshot replaces
+    the rotation in one transaction, the way OpenKJ commits; the file's
+    mtime and data_version move just as they would in a live show.
+    on_event(record) is called for every snapshot and singer change.
+    """
+
+    def __init__(self, recording_path, scratch_path, speed=1.0, on_event=None):
+        if not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValueError(f"Replay speed must be between {MIN_SPEED}x and {MAX_SPEED}x")
+        self.recording_path = recording_path
+        self.scratch_path = scratch_path
+        self.speed = speed
+        self.on_event = on_event
+        self.snapshots = 0
+
+    def _check_scratch_replaceable(self):
+        """Raise ValueError unless scratch_path is missing, empty or an earlier replay's database"""
+        if not os.path.exists(self.scratch_path) or os.path.getsize(self.scratch_path) == 0:
+            return
+        try:
+            conn = sqlite3.connect(f"file:{self.scratch_path}?mode=ro", uri=True)
+            try:
+                tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError:
+            raise ValueError(f"{self.scratch_path} exists and isn't a database; not replacing it")
+        if SCRATCH_MARKER_TABLE not in tables:
+            raise ValueError(f"{self.scratch_path} exists and wasn't made by a replay "
+                             f"(is it OpenKJ's database?); not replacing it")
+
+    def _create_scratch(self, schema):
+        self._check_scratch_replaceable()
+        for suffix in ('', '-wal', '-shm', '-journal'):
+            if os.path.exists(self.scratch_path + suffix):
+                os.remove(self.scratch_path + suffix)
+        conn = sqlite3.connect(self.scratch_path)
+        for sql in schema.values():
+            conn.execute(sql)
+        conn.execute(f"CREATE TABLE {SCRATCH_MARKER_TABLE} (created REAL)")
+        conn.execute(f"INSERT INTO {SCRATCH_MARKER_TABLE} VALUES (?)", (time.time(),))
+        conn.commit()
+        return conn
+
+    def run(self):
+        records = read_recording(self.recording_path)
+        header = next(records, None)
+        if not header or header.get('type') != 'header':
+            raise ValueError(f"{self.recording_path} is not a rotation recording")
+        if header['version'] != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version {header['version']}")
+
+        conn = self._create_scratch(header['schema'])
+        started = time.monotonic()
+        try:
+            for record in records:
+                # Sleep until this record is due at the chosen speed
+                delay = started + record['t'] / self.speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if record['type'] == 'snapshot':
+                    self._apply_snapshot(conn, record)
+                    self.snapshots += 1
+                if self.on_event:
+                    self.on_event(record)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _apply_snapshot(conn, record):
+        with conn:
+            for row in record['dbSongs']:
+                conn.execute(f"INSERT OR REPLACE INTO dbSongs VALUES ({','.join('?' * len(row))})", row)
+            for table in ('rotationSingers', 'queueSongs'):
+                conn.execute(f"DELETE FROM {table}")
+                rows = record[table]
+                if rows:
+                    conn.executemany(f"INSERT INTO {table} VALUES ({','.join('?' * len(rows[0]))})", rows)
+
+
+def replay_speed(value):
+    """argparse type for --speed"""
+    try:
+        speed = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid speed: {value!r}")
+    if not MIN_SPEED <= speed <= MAX_SPEED:
+        raise argparse.ArgumentTypeError(f"must be between {MIN_SPEED} and {MAX_SPEED}")
+    return speed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay OpenKJ rotation changes")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="Record a live database")
+    record_parser.add_argument('db_path', help="OpenKJ database to watch")
+    record_parser.add_argument('out_path', help="Recording to write (.ndjson.gz)")
+    record_parser.add_argument('--duration', type=float, help="Stop after this many seconds")
+    record_parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL)
+
+    replay_parser = subparsers.add_parser('replay', help="Replay a recording into a scratch database")
+    replay_parser.add_argument('recording_path', help="Recording to replay")
+    replay_parser.add_argument('scratch_path', help="Database to write (replaces an earlier replay's, never anything else)")
+    replay_parser.add_argument('--speed', type=replay_speed, default=1.0,
+                               help=f"{MIN_SPEED} to {MAX_SPEED} times real time")
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        recorder = RotationRecorder(args.db_path, args.out_path, args.poll_interval)
+        print(f"Recording {args.db_path} to {args.out_path} (Ctrl+C to stop)")
+        recorder.run(args.duration)
+        print(f"Recorded {recorder.snapshots} snapshots, {recorder.events} singer changes")
+    else:
+        def report(record):
+            if record['type'] == 'singer_change':
+                print(f"[{record['t']:9.1f}s] Singer change: {record['singer_name']}")
+
+        replayer = RotationReplayer(args.recording_path, args.scratch_path, args.speed, report)
+        try:
+            replayer.run()
+        except ValueError as e:
+            replay_parser.error(str(e))
+        print(f"Replayed {replayer.snapshots} snapshots into {args.scratch_path}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
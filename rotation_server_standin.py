@@ -0,0 +1,162 @@
+"""Stand-in for the rotation server's event stream, for trying a display in client mode
+
+Serves /api/rotation/events (and /api/rotation) like main2.py, without
+OpenKJ, Flask or a database. The rotation is synthetic and moves on to the
+next singer every --interval seconds, or comes from a rotation file
+(--file, see CONFIGURATION.md). --drop-every cuts all event streams now and
+then, to watch displays keep their last rotation and reconnect. Point the
+display's Rotation Server URL at http://localhost:<port>.
+
+    python rotation_server_standin.py --port 5055 --interval 10
+    python rotation_server_standin.py --file rotation.json --drop-every 60
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from rotation_source import FileRotationSource, RotationSourceError
+from rotation_stream import EVENTS_PATH, KEEPALIVE_SECONDS, KEEPALIVE_EVENT, format_event
+
+SONGS = [
+    ("Bohemian Rhapsody", "Queen", 355), ("Dancing Queen", "ABBA", 231),
+    ("Livin' on a Prayer", "Bon Jovi", 249), ("Wonderwall", "Oasis", 258),
+    ("I Will Survive", "Gloria Gaynor", 198), ("Sweet Caroline", "Neil Diamond", 203),
+]
+
+
+class StandinRotation:
+    """The rotation being served, and a generation number bumped on every change"""
+
+    def __init__(self, singers, file_path=None):
+        self.file_source = FileRotationSource(file_path) if file_path else None
+        self.entries = [
+            {'singer_id': i + 1, 'singer_name': f"Singer {i + 1}", 'song_id': i + 1,
+             'title': SONGS[i % len(SONGS)][0], 'artist': SONGS[i % len(SONGS)][1],
+             'duration': SONGS[i % len(SONGS)][2]}
+            for i in range(singers)
+        ]
+        self.generation = 0
+        self.dropped = 0  # Bumped to cut every open stream
+        self.changed = threading.Condition()
+
+    def advance(self):
+        """Next singer up, or the file's rotation if it changed"""
+        with self.changed:
+            if self.file_source:
+                if not self.file_source.changed():
+                    return
+                try:
+                    self.entries = self.file_source.read()
+                except RotationSourceError as e:
+                    print(f"Warning: {e}")
+                    return
+            elif self.entries:
+                self.entries.append(self.entries.pop(0))
+            self.generation += 1
+            self.changed.notify_all()
+
+    def drop_streams(self):
+        with self.changed:
+            self.dropped += 1
+            self.changed.notify_all()
+
+    def payload(self):
+        """The rotation in the shape main2.py's /api/rotation returns"""
+        singers = [
+            {'singer_id': entry['singer_id'], 'singer_name': entry['singer_name'],
+             'song': {'title': entry['title'], 'artist': entry['artist'], 'duration': entry['duration']}
+             if entry['title'] is not None else None}
+            for entry in self.entries
+        ]
+        return {'display_title': "Stand-in Rotation", 'venue_name': "Localhost",
+                'current': singers[0] if singers else None, 'up_next': singers[1:]}
+
+
+def make_handler(rotation):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            if self.path == EVENTS_PATH:
+                self.send_events()
+            elif self.path == '/api/rotation':
+                with rotation.changed:
+                    body = json.dumps(rotation.payload()).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                self.send_error(404)
+
+        def send_events(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.close_connection = True
+            generation = None
+            dropped = rotation.dropped
+            try:
+                while True:
+                    with rotation.changed:
+                        rotation.changed.wait_for(
+                            lambda: rotation.generation != generation or rotation.dropped != dropped,
+                            KEEPALIVE_SECONDS)
+                        if rotation.dropped != dropped:
+                            return
+                        changed = rotation.generation != generation
+                        generation = rotation.generation
+                        message = format_event('rotation', {'rotation': rotation.entries}, generation) if changed \
+                            else KEEPALIVE_EVENT
+                    self.wfile.write(message.encode('utf-8'))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            print(f"{self.address_string()} {format % args}")
+
+    return Handler
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--singers', type=int, default=8, help="Singers in the synthetic rotation")
+    parser.add_argument('--interval', type=float, default=10, help="Seconds between rotation changes")
+    parser.add_argument('--file', help="Serve this rotation file (.json/.ndjson) instead, re-read when it changes")
+    parser.add_argument('--drop-every', type=float, default=0, help="Cut all event streams every this many seconds")
+    args = parser.parse_args()
+
+    rotation = StandinRotation(args.singers, args.file)
+    rotation.advance()
+    server = ThreadingHTTPServer(('', args.port), make_handler(rotation))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving a stand-in rotation on http://localhost:{args.port}{EVENTS_PATH}")
+
+    next_change = time.monotonic() + args.interval
+    next_drop = time.monotonic() + args.drop_every if args.drop_every else None
+    try:
+        while True:
+            time.sleep(min(0.5, args.interval))
+            now = time.monotonic()
+            if args.file or now >= next_change:
+                rotation.advance()
+                next_change = now + args.interval
+            if next_drop is not None and now >= next_drop:
+                print("Dropping event streams")
+                rotation.drop_streams()
+                next_drop = now + args.drop_every
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main_cli())
@@ -0,0 +1,265 @@
+import os
+import json
+import sqlite3
+import threading
+from song_cache import song_cache
+from db_mirror import connect_rotation_db
+
+FILE_SOURCE_SUFFIXES = ('.json', '.ndjson', '.jsonl')
+FILE_DIALOG_FILTER = "SQLite Database (*.sqlite *.db);;Rotation File (*.json *.ndjson *.jsonl)"
+
+
+class RotationSourceError(Exception):
+    """The rotation couldn't be read; the message is shown to the user"""
+
+
+def read_rotation(conn, limit=-1):
+    """Return the first limit singers (all for -1) with their next song, in one query
+
+    Each entry is a dict with singer_id, singer_name, song_id, title, artist
+    and duration (seconds, 0 if unknown). song_id is None when the singer
+    has nothing queued; title and artist are None if the song isn't in dbSongs.
+    """
+    rows = conn.execute("""
+        SELECT rs.singerid, rs.name,
+               (SELECT qs.song
+                FROM queueSongs qs
+                WHERE qs.singer = rs.singerid AND qs.played = 0
+                ORDER BY qs.position ASC
+                LIMIT 1) AS song
+        FROM rotationSingers rs
+        ORDER BY rs.position ASC
+        LIMIT ?
+    """, (limit,)).fetchall()
+    songs = song_cache.get_many(conn, [song_id for _, _, song_id in rows if song_id is not None])
+
+    entries = []
+    for singer_id, singer_name, song_id in rows:
+        title, artist, duration_ms = songs.get(song_id, (None, None, 0))
+        entries.append({
+            'singer_id': singer_id,
+            'singer_name': singer_name,
+            'song_id': song_id,
+            'title': title,
+            'artist': artist,
+            'duration': (duration_ms or 0) / 1000,
+        })
+    return entries
+
+
+def format_song(entry):
+    """The display's "Title by Artist" line for a rotation entry, or None"""
+    if entry['title'] is None:
+        return None
+    return f"{entry['title']} by {entry['artist']}"
+
+
+def limit_entries(entries, limit):
+    return list(entries) if limit < 0 else list(entries[:limit])
+
+
+class RotationSource:
+    """Where the display and the rotation server get the rotation from
+
+    read(limit) returns rotation entries (see read_rotation), all from one
+    consistent moment, or raises RotationSourceError. changed() is a cheap
+    check for pollers: False means read() would return what it did last time.
+    """
+
+    def read(self, limit=-1):
+        raise NotImplementedError
+
+    def changed(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class SQLiteRotationSource(RotationSource):
+    """Reads OpenKJ's database (or its in-memory mirror) in one read transaction per call
+
+    changed() reads PRAGMA data_version on a connection kept open for the
+    purpose; it only moves when another connection commits, which catches
+    WAL commits that leave the file's mtime alone.
+    """
+
+    def __init__(self, db_path, use_mirror=False):
+        self.db_path = db_path
+        self.use_mirror = use_mirror
+        self._watch_conn = None
+        self._data_version = None  # Last version seen by changed()
+        self._read_version = None  # Version the last successful read() started from
+        self._lock = threading.Lock()
+
+    def read(self, limit=-1):
+        if not os.path.exists(self.db_path):
+            raise RotationSourceError("database file not found")
+        data_version = self._data_version
+        try:
+            conn = connect_rotation_db(self.db_path, self.use_mirror)
+            try:
+                # After connecting: with the mirror on, the cache reads the copy that just synced
+                song_cache.check_for_changes(self.db_path, self.use_mirror)
+                # One transaction: a change OpenKJ commits meanwhile is either all visible or not at all
+                conn.execute("BEGIN")
+                try:
+                    entries = read_rotation(conn, limit)
+                finally:
+                    conn.rollback()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            raise RotationSourceError(str(e)) from e
+        self._read_version = data_version
+        return entries
+
+    def changed(self):
+        with self._lock:
+            if not os.path.exists(self.db_path):
+                return True  # Let read() report it
+            try:
+                if self._watch_conn is None:
+                    self._watch_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._data_version = self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error:
+                self._close_watch()
+                return True
+            # Still True after a failed read, so it gets retried
+            return self._data_version != self._read_version
+
+    def _close_watch(self):
+        if self._watch_conn is not None:
+            self._watch_conn.close()
+            self._watch_conn = None
+        self._data_version = None
+
+    def close(self):
+        with self._lock:
+            self._close_watch()
+
+
+class MemoryRotationSource(RotationSource):
+    """A rotation held in memory, for tests and benchmarks; change it with set_rotation()"""
+
+    def __init__(self, entries=()):
+        self._entries = list(entries)
+        self._version = 0
+        self._read_version = None
+        self._lock = threading.Lock()
+
+    def set_rotation(self, entries):
+        with self._lock:
+            self._entries = list(entries)
+            self._version += 1
+
+    def read(self, limit=-1):
+        with self._lock:
+            self._read_version = self._version
+            return [dict(entry) for entry in limit_entries(self._entries, limit)]
+
+    def changed(self):
+        with self._lock:
+            return self._version != self._read_version
+
+
+def normalize_entry(entry):
+    """A rotation entry from a file, in read_rotation's shape
+
+    Accepts read_rotation entries as well as the rotation server's singers
+    ({'singer_id', 'singer_name', 'song': {'title', 'artist', 'duration'}}).
+    """
+    if not isinstance(entry, dict) or 'singer_name' not in entry:
+        raise RotationSourceError("rotation entries need at least a singer_name")
+    if 'song' in entry:
+        song = entry['song'] or {}
+        entry = dict(entry, title=song.get('title'), artist=song.get('artist'), duration=song.get('duration'))
+    return {
+        'singer_id': entry.get('singer_id', entry['singer_name']),
+        'singer_name': entry['singer_name'],
+        # Files and the server's payload carry no song ids; a title means a song is queued
+        'song_id': entry.get('song_id', entry.get('title')),
+        'title': entry.get('title'),
+        'artist': entry.get('artist'),
+        'duration': entry.get('duration') or 0,
+    }
+
+
+def rotation_from_document(document):
+    """Rotation entries from a parsed JSON document, or None if it holds no rotation
+
+    Understands a bare list of entries, a snapshot bus message ({'rotation':
+    [...]}) and the rotation server's /api/rotation payload.
+    """
+    if isinstance(document, list):
+        entries = document
+    elif isinstance(document, dict) and 'rotation' in document:
+        entries = document['rotation']
+    elif isinstance(document, dict) and 'up_next' in document:
+        entries = ([document['current']] if document.get('current') else []) + document['up_next']
+    else:
+        return None
+    return [normalize_entry(entry) for entry in entries]
+
+
+class FileRotationSource(RotationSource):
+    """Reads the rotation from a JSON or NDJSON file, for kiosks without database access
+
+    A .json file holds one rotation (see rotation_from_document). In an
+    .ndjson/.jsonl file, such as a log of snapshot bus messages, the last
+    line with a rotation wins. The file is parsed again only when its size
+    or mtime changes; write it atomically (write elsewhere, then rename).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._stat = None  # (mtime_ns, size) of the file as last parsed
+        self._entries = None
+        self._read_stat = None
+        self._lock = threading.Lock()
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            raise RotationSourceError(f"rotation file unavailable: {e}") from e
+        return stat.st_mtime_ns, stat.st_size
+
+    def read(self, limit=-1):
+        with self._lock:
+            stat = self._file_stat()
+            if stat != self._stat:
+                self._entries = self._parse()
+                self._stat = stat
+            self._read_stat = stat
+            return [dict(entry) for entry in limit_entries(self._entries, limit)]
+
+    def _parse(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                if self.path.lower().endswith('.json'):
+                    entries = rotation_from_document(json.load(f))
+                else:
+                    entries = None
+                    for line in f:
+                        if line.strip():
+                            entries = rotation_from_document(json.loads(line)) or entries
+        except (OSError, ValueError) as e:
+            raise RotationSourceError(f"couldn't read rotation file: {e}") from e
+        if entries is None:
+            raise RotationSourceError("rotation file holds no rotation")
+        return entries
+
+    def changed(self):
+        with self._lock:
+            try:
+                return self._file_stat() != self._read_stat
+            except RotationSourceError:
+                return True  # Let read() report it
+
+
+def open_rotation_source(path, use_mirror=False):
+    """The source for a configured path: a rotation file for .json/.ndjson, otherwise OpenKJ's database"""
+    if path.lower().endswith(FILE_SOURCE_SUFFIXES):
+        return FileRotationSource(path)
+    return SQLiteRotationSource(path, use_mirror)
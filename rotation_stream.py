@@ -0,0 +1,131 @@
+import json
+import time
+import random
+import threading
+import http.client
+import urllib.request
+from rotation_source import RotationSource, RotationSourceError, rotation_from_document, limit_entries
+
+EVENTS_PATH = '/api/rotation/events'
+KEEPALIVE_SECONDS = 15  # The server writes a comment line at least this often
+READ_TIMEOUT = 2 * KEEPALIVE_SECONDS + 5  # A connection silent for longer than this is dead
+BACKOFF_MIN = 1  # Seconds before the first reconnect; doubles after each failure
+BACKOFF_MAX = 30
+KEEPALIVE_EVENT = ': keepalive\n\n'
+
+
+def is_server_url(path):
+    return bool(path) and path.lower().startswith(('http://', 'https://'))
+
+
+def format_event(event, data, event_id=None):
+    """One Server-Sent Event carrying data as JSON"""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def iter_events(lines):
+    """(event, data) pairs from the byte lines of a Server-Sent Events stream"""
+    event, data = 'message', []
+    for raw in lines:
+        line = raw.decode('utf-8').rstrip('\r\n')
+        if not line:
+            if data:
+                yield event, '\n'.join(data)
+            event, data = 'message', []
+        elif not line.startswith(':'):
+            field, _, value = line.partition(':')
+            value = value[1:] if value.startswith(' ') else value
+            if field == 'event':
+                event = value
+            elif field == 'data':
+                data.append(value)
+
+
+class RemoteRotationSource(RotationSource):
+    """Follows a rotation server (main2.py) over the network, for display PCs away from the KJ booth
+
+    A background thread keeps a Server-Sent Events connection to the
+    server's /api/rotation/events open and holds on to the latest
+    rotation it sent, so read() never touches the network and keeps
+    returning the last rotation while the server is unreachable. A
+    dropped connection is retried after BACKOFF_MIN seconds, doubling
+    up to BACKOFF_MAX (with jitter, so a room of displays doesn't
+    reconnect in step). on_snapshot is called from that thread whenever
+    the rotation changes.
+    """
+
+    def __init__(self, server_url, on_snapshot=None):
+        self.server_url = server_url
+        self.events_url = server_url.rstrip('/') + EVENTS_PATH
+        self.on_snapshot = on_snapshot
+        self.connected = False
+        self.last_error = None
+        self.reconnects = 0
+        self._entries = None
+        self._received = None  # time.monotonic() of the latest rotation
+        self._version = 0
+        self._read_version = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='rotation-stream', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        backoff = BACKOFF_MIN
+        while not self._stop.is_set():
+            request = urllib.request.Request(self.events_url, headers={'Accept': 'text/event-stream'})
+            try:
+                with urllib.request.urlopen(request, timeout=READ_TIMEOUT) as response:
+                    self.connected = True
+                    self.last_error = None
+                    for event, data in iter_events(response):
+                        if self._stop.is_set():
+                            return
+                        if event == 'rotation':
+                            self._set_rotation(json.loads(data))
+                            backoff = BACKOFF_MIN
+                self.last_error = "server closed the connection"
+            except (OSError, ValueError, http.client.HTTPException, RotationSourceError) as e:
+                self.last_error = str(getattr(e, 'reason', None) or e) or type(e).__name__
+            self.connected = False
+            if self._stop.wait(backoff * random.uniform(0.5, 1)):
+                return
+            self.reconnects += 1
+            backoff = min(backoff * 2, BACKOFF_MAX)
+
+    def _set_rotation(self, document):
+        entries = rotation_from_document(document)
+        if entries is None:
+            raise RotationSourceError("server sent something other than a rotation")
+        with self._lock:
+            self._received = time.monotonic()
+            if entries == self._entries:
+                return
+            self._entries = entries
+            self._version += 1
+        if self.on_snapshot:
+            self.on_snapshot()
+
+    def read(self, limit=-1):
+        with self._lock:
+            if self._entries is None:
+                raise RotationSourceError(f"no rotation from {self.server_url} yet "
+                                          f"({self.last_error or 'connecting'})")
+            self._read_version = self._version
+            return [dict(entry) for entry in limit_entries(self._entries, limit)]
+
+    def changed(self):
+        with self._lock:
+            return self._version != self._read_version
+
+    def snapshot_age(self):
+        """Seconds since the server last sent a rotation, or None if it never has"""
+        received = self._received
+        return None if received is None else time.monotonic() - received
+
+    def close(self):
+        # The thread notices within READ_TIMEOUT at worst; it's a daemon, so it never holds up exit
+        self._stop.set()
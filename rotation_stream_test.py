@@ -0,0 +1,115 @@
+"""Tests RemoteRotationSource against rotation_server_standin.py on an ephemeral port
+
+Checks that a display following a rotation server gets the rotation,
+keeps showing the last one while the stream is cut or the server is down,
+and reconnects after its backoff. Needs no Qt, Flask or database.
+
+    python rotation_stream_test.py
+"""
+import time
+import unittest
+import threading
+from http.server import ThreadingHTTPServer
+import rotation_stream
+from rotation_stream import RemoteRotationSource
+from rotation_server_standin import StandinRotation, make_handler
+
+TEST_BACKOFF = 0.2  # Seconds; the real BACKOFF_MIN would make the test slow
+WAIT_TIMEOUT = 5
+
+
+def wait_until(predicate, timeout=WAIT_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class RemoteRotationSourceTest(unittest.TestCase):
+    def setUp(self):
+        self._backoff = rotation_stream.BACKOFF_MIN
+        rotation_stream.BACKOFF_MIN = TEST_BACKOFF
+        self.rotation = StandinRotation(3)
+        self.rotation.advance()
+        self.server = self.start_server(0)
+        self.port = self.server.server_address[1]
+        self.source = RemoteRotationSource(f"http://127.0.0.1:{self.port}")
+
+    def tearDown(self):
+        self.source.close()
+        self.rotation.drop_streams()
+        if self.server is not None:
+            self.stop_server()
+        rotation_stream.BACKOFF_MIN = self._backoff
+
+    def start_server(self, port):
+        class QuietHandler(make_handler(self.rotation)):
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), QuietHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def stop_server(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+
+    def served_names(self):
+        return [entry['singer_name'] for entry in self.rotation.entries]
+
+    def read_names(self):
+        return [entry['singer_name'] for entry in self.source.read()]
+
+    def wait_for_rotation(self, names):
+        self.assertTrue(wait_until(lambda: self.source.snapshot_age() is not None and self.read_names() == names),
+                        f"rotation never arrived: {self.source.last_error}")
+
+    def test_receives_snapshot(self):
+        self.wait_for_rotation(self.served_names())
+        self.assertTrue(self.source.connected)
+        self.assertFalse(self.source.changed())
+
+        self.rotation.advance()
+        self.assertTrue(wait_until(self.source.changed))
+        self.assertEqual(self.read_names(), self.served_names())
+
+    def test_keeps_last_rotation_and_reconnects_after_cut(self):
+        self.wait_for_rotation(self.served_names())
+        before = self.served_names()
+
+        self.rotation.drop_streams()
+        self.assertTrue(wait_until(lambda: not self.source.connected))
+        cut = time.monotonic()
+        self.assertEqual(self.read_names(), before)
+
+        self.assertTrue(wait_until(lambda: self.source.reconnects >= 1 and self.source.connected))
+        # Jitter waits between half and all of the backoff
+        self.assertGreaterEqual(time.monotonic() - cut, TEST_BACKOFF / 2 - 0.05)
+        self.rotation.advance()
+        self.assertTrue(wait_until(lambda: self.read_names() == self.served_names()))
+
+    def test_keeps_last_rotation_while_server_is_down(self):
+        self.wait_for_rotation(self.served_names())
+        before = self.served_names()
+
+        self.rotation.drop_streams()
+        self.stop_server()
+        self.assertTrue(wait_until(lambda: self.source.reconnects >= 2))
+        self.assertFalse(self.source.connected)
+        self.assertIsNotNone(self.source.last_error)
+        self.assertEqual(self.read_names(), before)
+
+        self.rotation.advance()
+        self.server = self.start_server(self.port)
+        # Backoff has grown to a few times TEST_BACKOFF by now
+        self.assertTrue(wait_until(lambda: self.source.connected, timeout=WAIT_TIMEOUT + 2))
+        self.assertTrue(wait_until(lambda: self.read_names() == self.served_names()))
+
+
+if __name__ == '__main__':
+    unittest.main()
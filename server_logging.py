@@ -0,0 +1,100 @@
+import json
+import queue
+import atexit
+import logging
+import threading
+from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+SAMPLE_INTERVAL = 10.0  # Seconds; at most one record per sampled event in each window
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# LogRecord attributes that aren't caller-supplied extra fields
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'taskName'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with any extra={...} fields as top-level keys"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Lets through one record per event per interval and counts the rest
+
+    Only records logged with extra={'event': ...} are sampled. The next
+    record let through for an event carries suppressed=<count> of the ones
+    dropped since, so totals can still be read off the log.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__()
+        self.interval = interval
+        self._windows = {}  # event -> (window start, records dropped in it)
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        event = getattr(record, 'event', None)
+        if event is None:
+            return True
+        with self._lock:
+            started, dropped = self._windows.get(event, (None, 0))
+            if started is not None and record.created - started < self.interval:
+                self._windows[event] = (started, dropped + 1)
+                return False
+            self._windows[event] = (record.created, 0)
+        if dropped:
+            record.suppressed = dropped
+        return True
+
+
+def setup_logging(log_path, *loggers, level=logging.INFO, sample_interval=SAMPLE_INTERVAL):
+    """Send the loggers' records through a queue to a rotating JSON file and the console
+
+    The calling thread only puts the record on a queue; formatting and I/O
+    happen on the listener's thread. Sampling runs before the queue, so a
+    flood of sampled events costs next to nothing. Returns a function that
+    drains the queue and stops the listener; it's safe to call more than
+    once and also runs at interpreter exit.
+    """
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_handler = RotatingFileHandler(log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                       encoding='utf-8')
+    file_handler.setFormatter(JsonFormatter())
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_interval))
+    for logger in loggers:
+        logger.addHandler(queue_handler)
+        logger.setLevel(level)
+        logger.propagate = False
+
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    stopped = threading.Lock()
+
+    def stop():
+        if stopped.acquire(blocking=False):
+            listener.stop()
+
+    atexit.register(stop)
+    return stop
@@ -0,0 +1,337 @@
+import os
+import sys
+import json
+import time
+import queue
+import getpass
+import tempfile
+import threading
+from pathlib import Path
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client, deliver_challenge, answer_challenge
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+CONNECT_RETRY_INTERVAL = 0.5
+AUTHKEY_SIZE = 16
+HANDSHAKE_TIMEOUT = 5.0  # Seconds a new subscriber gets to authenticate
+SUBSCRIBER_QUEUE_SIZE = 16  # Messages waiting for one subscriber before it's dropped (heartbeats come every second)
+
+
+def bus_dir():
+    """Per-user directory for the bus socket and key, readable only by that user"""
+    path = Path(tempfile.gettempdir()) / f"openkj-{getpass.getuser()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    return path
+
+
+def bus_address():
+    """Return (address, family): a Unix domain socket, or a named pipe on Windows"""
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\openkj-rotation-{getpass.getuser()}', 'AF_PIPE'
+    return str(bus_dir() / 'rotation.sock'), 'AF_UNIX'
+
+
+def bus_authkey(create=False):
+    """The shared secret subscribers must present; created by the publisher on first use"""
+    key_path = bus_dir() / 'bus.key'
+    try:
+        return bytes.fromhex(key_path.read_text().strip())
+    except (OSError, ValueError):
+        if not create:
+            raise
+    key = os.urandom(AUTHKEY_SIZE)
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(key.hex())
+    return key
+
+
+class BusInUseError(Exception):
+    """Another publisher is already serving the bus"""
+
+
+def lock_publisher(lock_path):
+    """Take the publisher lock; returns the open lock file, which holds it until closed
+
+    The operating system drops the lock when its holder dies, so unlike a
+    socket file it can't be left behind by a killed publisher. Raises
+    BusInUseError if another process holds it.
+    """
+    lock_file = open(lock_path, 'a+')
+    try:
+        if sys.platform == 'win32':
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        raise BusInUseError(f"another publisher holds {lock_path}")
+    return lock_file
+
+
+class _HandshakeConnection:
+    """Lets the authentication handshake give up on a client that stays silent"""
+
+    def __init__(self, conn, timeout):
+        self._conn = conn
+        self._deadline = time.monotonic() + timeout
+
+    def send_bytes(self, data):
+        self._conn.send_bytes(data)
+
+    def recv_bytes(self, maxlength=None):
+        if not self._conn.poll(max(0, self._deadline - time.monotonic())):
+            raise AuthenticationError("subscriber didn't answer the handshake in time")
+        return self._conn.recv_bytes(maxlength)
+
+
+class _Subscriber:
+    """One connected subscriber: a bounded queue drained by its own writer thread"""
+
+    def __init__(self, conn, on_closed):
+        self.conn = conn
+        self._queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._on_closed = on_closed
+        threading.Thread(target=self._write, name="bus-writer", daemon=True).start()
+
+    def offer(self, data):
+        """Queue data without waiting; False if the subscriber is too far behind"""
+        try:
+            self._queue.put_nowait(data)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self):
+        """Stop after the message being written now; the writer closes the connection"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put_nowait(None)
+
+    def _write(self):
+        try:
+            while True:
+                data = self._queue.get()
+                if data is None:
+                    break
+                self.conn.send_bytes(data)
+        except OSError:
+            pass  # Hung up
+        finally:
+            self.conn.close()
+            self._on_closed(self)
+
+
+class SnapshotPublisher:
+    """Sends messages to every subscriber on the local snapshot bus
+
+    Messages are JSON objects, so consumers don't have to be written in
+    Python. The latest snapshot is replayed to each new subscriber as soon
+    as it connects, so nobody has to wait for the next change. publish()
+    never waits on a subscriber: each one has a bounded queue and its own
+    writer thread, and a subscriber that can't keep up or hangs up is
+    dropped; it gets the latest snapshot again when it reconnects. New
+    connections authenticate on their own threads, so a client that never
+    finishes the handshake can't keep others out.
+    """
+
+    def __init__(self, address=None, family=None, authkey=None):
+        if address is None:
+            address, family = bus_address()
+        self.address = address
+        self.family = family
+        self.authkey = authkey if authkey is not None else bus_authkey(create=True)
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._latest_snapshot = None
+        self._listener = None
+        self._lock_file = None
+
+    def start(self):
+        """Start accepting subscribers; raises BusInUseError if another publisher beat us to it"""
+        lock_path = f"{self.address}.lock" if self.family == 'AF_UNIX' else bus_dir() / 'publisher.lock'
+        self._lock_file = lock_publisher(lock_path)
+        try:
+            if self.family == 'AF_UNIX' and os.path.exists(self.address):
+                # Nobody holds the lock, so this was left behind by a publisher that was killed
+                os.remove(self.address)
+            # Authentication happens in _handshake, off the accept loop
+            self._listener = Listener(self.address, self.family)
+        except OSError:
+            self._lock_file.close()
+            self._lock_file = None
+            raise
+        threading.Thread(target=self._accept, name="bus-accept", daemon=True).start()
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, message):
+        data = json.dumps(message).encode('utf-8')
+        with self._lock:
+            if message.get('type') == 'snapshot':
+                self._latest_snapshot = data
+            for subscriber in list(self._subscribers):
+                if not subscriber.offer(data):
+                    self._drop(subscriber)
+
+    def _accept(self):
+        while True:
+            listener = self._listener
+            if listener is None:
+                return  # Closed
+            try:
+                conn = listener.accept()
+            except OSError:
+                if self._listener is None:
+                    return
+                continue  # A client that hung up before we got to it
+            threading.Thread(target=self._handshake, args=(conn,), name="bus-handshake", daemon=True).start()
+
+    def _handshake(self, conn):
+        try:
+            # The same challenge-response Listener(authkey=...) does, with a deadline
+            handshake = _HandshakeConnection(conn, HANDSHAKE_TIMEOUT)
+            deliver_challenge(handshake, self.authkey)
+            answer_challenge(handshake, self.authkey)
+        except (OSError, EOFError, AuthenticationError):
+            conn.close()  # Wrong key, too slow, or hung up mid-handshake
+            return
+        with self._lock:
+            if self._listener is None:
+                conn.close()
+                return
+            subscriber = _Subscriber(conn, self._on_subscriber_closed)
+            self._subscribers.append(subscriber)
+            if self._latest_snapshot is not None:
+                subscriber.offer(self._latest_snapshot)
+
+    def _drop(self, subscriber):
+        """Call with _lock held"""
+        self._subscribers.remove(subscriber)
+        subscriber.close()
+
+    def _on_subscriber_closed(self, subscriber):
+        """Runs on the subscriber's writer thread once its connection is closed"""
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def close(self):
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.close()
+        with self._lock:
+            for subscriber in list(self._subscribers):
+                self._drop(subscriber)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class SnapshotSubscriber:
+    """Receives bus messages on a background thread and passes them to on_message
+
+    Reconnects on its own whenever the publisher goes away, so it can be
+    started before the publisher exists. on_message runs on the subscriber
+    thread; Qt code should hand messages over with a signal.
+    """
+
+    def __init__(self, on_message, address=None, family=None, authkey=None):
+        if address is None:
+            address, family = bus_address()
+        self.on_message = on_message
+        self.address = address
+        self.family = family
+        self.authkey = authkey
+        self.connected = False
+        self.last_message = None  # time.monotonic() of the last message, None before the first
+        self._stopping = None
+
+    def start(self):
+        # Each run gets its own stop flag, so a restart can't revive a thread that's winding down
+        self._stopping = threading.Event()
+        threading.Thread(target=self._run, args=(self._stopping,), name="bus-subscriber", daemon=True).start()
+
+    def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
+            self._stopping = None
+            self.connected = False
+
+    def running(self):
+        return self._stopping is not None
+
+    def message_age(self):
+        if self.last_message is None:
+            return None
+        return time.monotonic() - self.last_message
+
+    def _run(self, stopping):
+        while not stopping.is_set():
+            try:
+                # Read the key each time; a restarted publisher may have created it
+                authkey = self.authkey if self.authkey is not None else bus_authkey()
+                conn = Client(self.address, self.family, authkey=authkey)
+            except (OSError, EOFError, ValueError):
+                time.sleep(CONNECT_RETRY_INTERVAL)
+                continue
+            self.connected = True
+            try:
+                while not stopping.is_set():
+                    message = json.loads(conn.recv_bytes())
+                    self.last_message = time.monotonic()
+                    self.on_message(message)
+            except (OSError, EOFError):
+                pass  # Publisher went away; reconnect to its replacement
+            finally:
+                if not stopping.is_set():
+                    self.connected = False
+                conn.close()
+
+
+def bus_is_running(timeout=1.0):
+    """True if a publisher is accepting subscribers on the bus"""
+    address, family = bus_address()
+    if family == 'AF_UNIX' and not os.path.exists(address):
+        return False
+    result = []
+
+    def probe():
+        try:
+            Client(address, family, authkey=bus_authkey()).close()
+            result.append(True)
+        except (OSError, EOFError, ValueError):
+            pass
+
+    # A hung publisher never finishes the handshake, so don't wait on it forever
+    thread = threading.Thread(target=probe, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return bool(result)
+
+
+if __name__ == '__main__':
+    # Example consumer: print each rotation snapshot published on the bus
+    def show(message):
+        if message['type'] != 'snapshot':
+            return
+        names = ', '.join(entry['singer_name'] for entry in message['rotation'][:6])
+        print(f"[{message['version']}] {names}")
+
+    subscriber = SnapshotSubscriber(show)
+    subscriber.start()
+    print(f"Listening on {subscriber.address} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,271 @@
+"""Soak test for the display: hours of simulated rotation changes under the offscreen platform
+
+Drives a DisplayWindow against a scratch OpenKJ database with synthetic
+signups, singer changes and departures, sampling RSS, Python objects, live
+QObjects, pixmaps and signal receivers as it goes. Exits with status 1 if
+anything keeps growing after the warm-up.
+
+    python soak_test.py --hours 8
+    python soak_test.py --hours 2 --carousel --low-power --csv soak.csv
+"""
+import os
+import gc
+import sys
+import csv
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QObject, QCoreApplication, QEvent, QEventLoop
+from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtWidgets import QApplication
+import main
+
+OPENKJ_SCHEMA = """
+CREATE TABLE dbSongs (songid INTEGER PRIMARY KEY AUTOINCREMENT, Artist TEXT, Title TEXT, DiscId TEXT,
+                      Duration INTEGER, path TEXT, filename TEXT, searchstring TEXT, plays INT DEFAULT 0,
+                      lastplay TIMESTAMP);
+CREATE TABLE rotationSingers (singerid INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, position INT,
+                              regular LOGICAL DEFAULT 0, regularid INT, addts TIMESTAMP);
+CREATE TABLE queueSongs (qsongid INTEGER PRIMARY KEY AUTOINCREMENT, singer INT, song INT, artist INT, title INT,
+                         discid INT, path INT, keychg INT, played LOGICAL DEFAULT 0, position INT);
+"""
+LIBRARY_SIZE = 5000
+
+# Allowed growth between the first and last quarter of the post-warm-up samples
+DEFAULT_TOLERANCES = {
+    'rss_mb': 15.0,
+    'py_objects': 2000,
+    'qobjects': 5,
+    'pixmaps': 5,
+    'receivers': 0,
+}
+
+
+class SyntheticRotation:
+    """A scratch OpenKJ database whose rotation changes the way a busy night does"""
+
+    def __init__(self, path, singers, seed):
+        self.path = path
+        self.random = random.Random(seed)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(OPENKJ_SCHEMA)
+        self.conn.executemany(
+            "INSERT INTO dbSongs (songid, Artist, Title, Duration) VALUES (?, ?, ?, ?)",
+            [(i, f"Artist {i}", f"Song Title Number {i}", self.random.randint(150, 330) * 1000)
+             for i in range(1, LIBRARY_SIZE + 1)])
+        self.next_singer = 1
+        for _ in range(singers):
+            self._add_singer()
+        self.conn.commit()
+
+    def _add_singer(self):
+        count = self.conn.execute("SELECT COUNT(*) FROM rotationSingers").fetchone()[0]
+        cursor = self.conn.execute("INSERT INTO rotationSingers (name, position) VALUES (?, ?)",
+                                   (f"Singer {self.next_singer} {'X' * self.random.randint(0, 20)}", count))
+        self.next_singer += 1
+        for position in range(self.random.randint(1, 3)):
+            self._queue_song(cursor.lastrowid, position)
+
+    def _queue_song(self, singer_id, position):
+        self.conn.execute("INSERT INTO queueSongs (singer, song, played, position) VALUES (?, ?, 0, ?)",
+                          (singer_id, self.random.randint(1, LIBRARY_SIZE), position))
+
+    def next_singer_up(self):
+        """The singer on stage finishes: mark their song played and move them to the back"""
+        row = self.conn.execute("SELECT singerid FROM rotationSingers ORDER BY position LIMIT 1").fetchone()
+        if row is None:
+            return
+        singer_id = row[0]
+        self.conn.execute("""
+            UPDATE queueSongs SET played = 1 WHERE qsongid = (
+                SELECT qsongid FROM queueSongs WHERE singer = ? AND played = 0 ORDER BY position LIMIT 1)
+        """, (singer_id,))
+        self._queue_song(singer_id, self.random.randint(3, 1000))
+        self.conn.execute("UPDATE rotationSingers SET position = position - 1")
+        self.conn.execute("UPDATE rotationSingers SET position = (SELECT COUNT(*) FROM rotationSingers) - 1 "
+                          "WHERE singerid = ?", (singer_id,))
+        self.conn.commit()
+
+    def signup(self):
+        self._add_singer()
+        self.conn.commit()
+
+    def leave(self):
+        row = self.conn.execute("SELECT singerid, position FROM rotationSingers "
+                                "ORDER BY RANDOM() LIMIT 1").fetchone()
+        if row is None:
+            return
+        singer_id, position = row
+        self.conn.execute("DELETE FROM rotationSingers WHERE singerid = ?", (singer_id,))
+        self.conn.execute("DELETE FROM queueSongs WHERE singer = ?", (singer_id,))
+        self.conn.execute("UPDATE rotationSingers SET position = position - 1 WHERE position > ?", (position,))
+        self.conn.commit()
+
+    def singer_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM rotationSingers").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def rss_mb():
+    """Resident set size in MB, or None where it can't be read"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def receiver_count(obj, signal):
+    """Connections on one of the window's signals; a count that climbs means reconnect-on-refresh"""
+    try:
+        return obj.receivers(signal)
+    except (RuntimeError, TypeError):
+        return 0
+
+
+def sample(app, window, simulated_hours):
+    gc.collect()
+    objects = gc.get_objects()
+    receivers = sum(receiver_count(obj, signal) for obj, signal in (
+        (window.file_watcher, window.file_watcher.fileChanged) if window.file_watcher else (None, None),
+        (window.refresh_timer, window.refresh_timer.timeout),
+        (window.singer_overlay_timer, window.singer_overlay_timer.timeout),
+        (window.message_overlay_timer, window.message_overlay_timer.timeout),
+        (window.carousel_timer, window.carousel_timer.timeout),
+        (window.up_next_view, window.up_next_view.resized),
+    ) if obj is not None)
+    return {
+        'hours': round(simulated_hours, 2),
+        'rss_mb': round(rss_mb() or 0, 1),
+        'py_objects': len(objects),
+        'qobjects': len(window.findChildren(QObject)) + len(app.topLevelWidgets()),
+        'pixmaps': sum(1 for obj in objects if isinstance(obj, (QPixmap, QImage))),
+        'receivers': receivers,
+    }
+
+
+def pump_events(app, ms):
+    """Run the event loop for ms of real time so timers, fades and worker results are delivered"""
+    deadline = time.monotonic() + ms / 1000
+    while time.monotonic() < deadline:
+        app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 5)
+        time.sleep(0.001)
+    # deleteLater() is only honoured by a running loop; flush it explicitly
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def find_growth(samples, tolerances):
+    """Return [(metric, start, end)] for metrics that grew past tolerance after the warm-up"""
+    steady = samples[len(samples) // 4:]
+    if len(steady) < 4:
+        return []
+    quarter = max(1, len(steady) // 4)
+    leaks = []
+    for metric, tolerance in tolerances.items():
+        start = sorted(s[metric] for s in steady[:quarter])[quarter // 2]
+        end = sorted(s[metric] for s in steady[-quarter:])[quarter // 2]
+        if end - start > tolerance:
+            leaks.append((metric, start, end))
+    return leaks
+
+
+def run(args):
+    app = QApplication.instance() or QApplication(sys.argv)
+    workdir = tempfile.mkdtemp(prefix='kj-soak-')
+    db_path = os.path.join(workdir, 'openkj.sqlite')
+    rotation = SyntheticRotation(db_path, args.singers, args.seed)
+
+    config = dict(main.DEFAULT_CONFIG)
+    config.update({
+        'db_path': db_path,
+        'overlay_enabled': True,
+        'overlay_duration': 1,
+        'carousel_enabled': args.carousel,
+        'carousel_page_seconds': 3,
+        'low_power_mode': args.low_power,
+    })
+    window = main.DisplayWindow(config)
+    window.resize(1920, 1080)
+    window.show()
+    pump_events(app, 200)
+
+    steps = int(args.hours * 3600 / args.step_seconds)
+    song_steps = max(1, int(args.song_minutes * 60 / args.step_seconds))
+    sample_steps = max(1, int(args.sample_minutes * 60 / args.step_seconds))
+    samples = []
+    started = time.monotonic()
+
+    for step in range(steps + 1):
+        if step and step % song_steps == 0:
+            rotation.next_singer_up()
+        # Signups and departures keep the rotation size wandering around its starting size
+        if rotation.random.random() < args.churn:
+            if rotation.singer_count() < args.singers * 1.5 and rotation.random.random() < 0.5:
+                rotation.signup()
+            elif rotation.singer_count() > args.singers // 2:
+                rotation.leave()
+
+        window.update_display()
+        pump_events(app, args.pump_ms)
+
+        if step % sample_steps == 0:
+            samples.append(sample(app, window, step * args.step_seconds / 3600))
+            if args.verbose:
+                print(samples[-1])
+
+    elapsed = time.monotonic() - started
+    window.close()
+    rotation.close()
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(samples[0]))
+            writer.writeheader()
+            writer.writerows(samples)
+
+    first, last = samples[0], samples[-1]
+    print(f"Simulated {args.hours:g}h ({steps} refreshes) in {elapsed:.0f}s")
+    for metric in DEFAULT_TOLERANCES:
+        print(f"  {metric:>10}: {first[metric]} -> {last[metric]}")
+
+    leaks = find_growth(samples, DEFAULT_TOLERANCES)
+    for metric, start, end in leaks:
+        print(f"FAIL: {metric} grew from {start} to {end} after warm-up")
+    if not leaks:
+        print("PASS: no unbounded growth")
+    return 1 if leaks else 0
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hours', type=float, default=8, help="Simulated hours to run")
+    parser.add_argument('--step-seconds', type=float, default=5, help="Simulated seconds per refresh")
+    parser.add_argument('--song-minutes', type=float, default=4, help="Simulated minutes per singer")
+    parser.add_argument('--sample-minutes', type=float, default=10, help="Simulated minutes between samples")
+    parser.add_argument('--pump-ms', type=float, default=30, help="Real event-loop time per refresh")
+    parser.add_argument('--singers', type=int, default=40)
+    parser.add_argument('--churn', type=float, default=0.02, help="Chance of a signup or departure per refresh")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--carousel', action='store_true')
+    parser.add_argument('--low-power', action='store_true')
+    parser.add_argument('--csv', help="Write every sample to this CSV file")
+    parser.add_argument('--verbose', action='store_true')
+    return run(parser.parse_args())
+
+
+if __name__ == '__main__':
+    sys.exit(main_cli())
@@ -0,0 +1,170 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from db_mirror import get_mirror
+
+DEFAULT_CACHE_SIZE = 4096
+QUERY_CHUNK_SIZE = 500  # Ids per IN (...) query, well under SQLite's limit on bound variables
+
+# The songs the rotation can show: one primary-key lookup per unplayed queue entry, not a library scan
+QUEUED_SONGS_SQL = """
+    SELECT q.song, s.songid, s.Title, s.Artist, s.Duration
+    FROM queueSongs q LEFT JOIN dbSongs s ON s.songid = q.song
+    WHERE q.played = 0
+"""
+
+# Marks a songid that isn't in dbSongs, so misses for it aren't re-queried
+_MISSING = object()
+
+
+class SongCache:
+    """Size-bounded LRU cache of songid -> (title, artist, duration)
+
+    Song metadata almost never changes during a show, so the display and the
+    rotation server look songs up here instead of hitting dbSongs on every
+    refresh. check_for_changes() runs after OpenKJ commits: MAX(rowid) of
+    dbSongs (a single index seek) tells whether songs were added or the
+    library was rebuilt, and the rows of the songs still queued are read
+    again by primary key, so a song edited in place is picked up as soon as
+    it matters. Neither scans the library. With the snapshot mirror on,
+    both come from the mirror's last sync and the cache never opens
+    OpenKJ's file itself. Call invalidate() to drop everything.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._songs = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._source = None  # (db_path, use_mirror) last checked
+        self._watch_conn = None
+        self._data_version = None  # ('live', PRAGMA data_version) or ('mirror', sync count) last applied
+        self._library_signature = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def invalidate(self):
+        """Drop every cached song (library-update signal)"""
+        with self._lock:
+            self._songs.clear()
+            self.invalidations += 1
+
+    def check_for_changes(self, db_path, use_mirror=False):
+        """Bring the cache up to date if OpenKJ committed since the last check
+
+        With use_mirror, call it after the mirror synced; it reads the
+        mirror's copy instead of the database.
+        """
+        with self._lock:
+            if (db_path, use_mirror) != self._source:
+                self._close_watch_connection()
+                self._source = (db_path, use_mirror)
+                self._songs.clear()
+            try:
+                if use_mirror:
+                    syncs, signature, queued = get_mirror(db_path).library_state(QUEUED_SONGS_SQL)
+                    version = ('mirror', syncs)
+                    if version == self._data_version:
+                        return
+                else:
+                    if self._watch_conn is None:
+                        self._watch_conn = sqlite3.connect(db_path, check_same_thread=False)
+                    version = ('live', self._watch_conn.execute("PRAGMA data_version").fetchone()[0])
+                    if version == self._data_version:
+                        return
+                    signature = self._watch_conn.execute("SELECT MAX(rowid) FROM dbSongs").fetchone()[0]
+                    queued = self._watch_conn.execute(QUEUED_SONGS_SQL).fetchall()
+            except sqlite3.Error:
+                # Can't tell whether anything changed, so trust nothing
+                self._close_watch_connection()
+                self._songs.clear()
+                return
+            self._data_version = version
+            if signature != self._library_signature:
+                if self._library_signature is not None:
+                    self.invalidations += 1
+                self._library_signature = signature
+                self._songs.clear()
+            # Fresh rows for the queued songs replace whatever was cached for them
+            for song_id, found_id, title, artist, duration in queued:
+                if song_id is not None:
+                    self._songs[song_id] = _MISSING if found_id is None else (title, artist, duration)
+                    self._songs.move_to_end(song_id)
+            self._evict()
+
+    def _close_watch_connection(self):
+        if self._watch_conn is not None:
+            self._watch_conn.close()
+        self._watch_conn = None
+        self._data_version = None
+        self._library_signature = None
+
+    def _evict(self):
+        while len(self._songs) > self.maxsize:
+            self._songs.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, conn, song_id):
+        """Return (title, artist, duration) for song_id, or None if it doesn't exist"""
+        return self.get_many(conn, [song_id]).get(song_id)
+
+    def get_many(self, conn, song_ids):
+        """Return {songid: (title, artist, duration)}, fetching misses QUERY_CHUNK_SIZE ids per query"""
+        found = {}
+        missing = []
+        with self._lock:
+            for song_id in song_ids:
+                entry = self._songs.get(song_id)
+                if entry is None:
+                    missing.append(song_id)
+                    continue
+                self._songs.move_to_end(song_id)
+                self.hits += 1
+                if entry is not _MISSING:
+                    found[song_id] = entry
+
+        if not missing:
+            return found
+
+        missing = list(dict.fromkeys(missing))
+        fetched = {}
+        for start in range(0, len(missing), QUERY_CHUNK_SIZE):
+            chunk = missing[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(
+                f"SELECT songid, Title, Artist, Duration FROM dbSongs WHERE songid IN ({placeholders})",
+                chunk
+            ).fetchall()
+            fetched.update((row[0], (row[1], row[2], row[3])) for row in rows)
+
+        with self._lock:
+            self.misses += len(missing)
+            for song_id in missing:
+                entry = fetched.get(song_id, _MISSING)
+                self._songs[song_id] = entry
+                self._songs.move_to_end(song_id)
+                if entry is not _MISSING:
+                    found[song_id] = entry
+            self._evict()
+        return found
+
+    def stats(self):
+        """Return hit/miss counters and the hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._songs),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+# Shared by the display and rotation server data paths
+song_cache = SongCache()
@@ -0,0 +1,81 @@
+(function () {
+    'use strict';
+
+    var POLL_INTERVAL_MS = 5000;  // Used only when the Socket.IO client couldn't be loaded
+    var rotation = JSON.parse(document.getElementById('initial-rotation').textContent);
+
+    function songText(song) {
+        return song ? song.title + ' by ' + song.artist : '';
+    }
+
+    function waitText(estimatedStart) {
+        if (estimatedStart === null || estimatedStart === undefined) {
+            return '';
+        }
+        // Same wording as wait_times.format_wait
+        var minutes = Math.round((estimatedStart * 1000 - Date.now()) / 60000);
+        if (minutes <= 1) {
+            return '< 1 min';
+        }
+        if (minutes < 60) {
+            return '~' + minutes + ' min';
+        }
+        return '~' + Math.floor(minutes / 60) + 'h ' + ('0' + minutes % 60).slice(-2) + 'm';
+    }
+
+    function element(tag, className, text) {
+        var node = document.createElement(tag);
+        node.className = className;
+        node.textContent = text;
+        return node;
+    }
+
+    function render() {
+        document.title = rotation.display_title;
+        document.getElementById('display-title').textContent = rotation.display_title;
+        document.getElementById('venue-name').textContent = rotation.venue_name;
+
+        var current = rotation.current;
+        var singer = document.getElementById('current-singer');
+        singer.textContent = current ? current.singer_name : 'No singers in rotation';
+        singer.classList.toggle('empty', !current);
+        document.getElementById('current-song').textContent = current ? songText(current.song) : '';
+
+        var list = document.getElementById('up-next-list');
+        var items = document.createDocumentFragment();
+        rotation.up_next.forEach(function (entry) {
+            var item = document.createElement('li');
+            item.appendChild(element('span', 'singer', entry.singer_name));
+            item.appendChild(element('span', 'song', songText(entry.song)));
+            item.appendChild(element('span', 'wait', waitText(entry.estimated_start)));
+            items.appendChild(item);
+        });
+        while (list.firstChild) {
+            list.removeChild(list.firstChild);
+        }
+        list.appendChild(items);
+    }
+
+    function update(payload) {
+        rotation = payload;
+        render();
+    }
+
+    function poll() {
+        fetch('/api/rotation', {cache: 'no-store'})
+            .then(function (response) { return response.json(); })
+            .then(update)
+            .catch(function () {})  // Keep showing the last rotation until the server is back
+            .then(function () { setTimeout(poll, POLL_INTERVAL_MS); });
+    }
+
+    render();
+    // Waits count down between rotation changes
+    setInterval(render, 30000);
+
+    if (window.io) {
+        window.io().on('rotation_update', update);
+    } else {
+        setTimeout(poll, POLL_INTERVAL_MS);
+    }
+})();
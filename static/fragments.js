@@ -0,0 +1,53 @@
+(function () {
+    'use strict';
+
+    // Deliberately tiny for weak smart-TV browsers: the server renders the
+    // rotation once per change and this script only swaps the markup in.
+    var LONG_POLL_RETRY_MS = 5000;
+    var WAIT_REFRESH_MS = 30000;
+    var version = JSON.parse(document.getElementById('initial-version').textContent);
+    var rotation = document.getElementById('rotation');
+
+    function swap(fragment) {
+        if (fragment.version !== version) {
+            version = fragment.version;
+            rotation.innerHTML = fragment.html;
+            refreshWaits();  // The server's copy was rendered when the rotation last changed
+        }
+    }
+
+    // Same wording as wait_times.format_wait
+    function refreshWaits() {
+        var waits = rotation.querySelectorAll('.wait[data-start]');
+        for (var i = 0; i < waits.length; i++) {
+            var minutes = Math.round((waits[i].getAttribute('data-start') * 1000 - Date.now()) / 60000);
+            waits[i].textContent = minutes <= 1 ? '< 1 min' : minutes < 60 ? '~' + minutes + ' min' :
+                '~' + Math.floor(minutes / 60) + 'h ' + ('0' + minutes % 60).slice(-2) + 'm';
+        }
+    }
+
+    // Without Socket.IO, ask the server to hold the request until the rotation changes
+    function longPoll() {
+        var xhr = new XMLHttpRequest();
+        xhr.open('GET', '/api/rotation/html?since=' + encodeURIComponent(version));
+        xhr.onload = function () {
+            if (xhr.status === 200) {
+                swap(JSON.parse(xhr.responseText));
+            }
+            setTimeout(longPoll, xhr.status === 200 || xhr.status === 204 ? 0 : LONG_POLL_RETRY_MS);
+        };
+        xhr.onerror = function () {
+            setTimeout(longPoll, LONG_POLL_RETRY_MS);
+        };
+        xhr.send();
+    }
+
+    refreshWaits();
+    setInterval(refreshWaits, WAIT_REFRESH_MS);
+
+    if (window.io) {
+        window.io().on('rotation_html', swap);
+    } else {
+        longPoll();
+    }
+})();
@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QFontMetrics, QPainter
+from PyQt6.QtWidgets import QLabel, QSizePolicy
+
+MIN_FONT_PIXEL_SIZE = 10
+DEFAULT_FIT_CACHE_SIZE = 1024
+
+
+def font_pixel_size(font):
+    """Return the font's size in pixels, converting point sizes at 96 DPI"""
+    if font.pixelSize() > 0:
+        return font.pixelSize()
+    return max(1, round(font.pointSizeF() * 96 / 72))
+
+
+class TextFitter:
+    """Finds the largest font size at which a string fits a box
+
+    Sizes are found with a binary search over font metrics, between
+    MIN_FONT_PIXEL_SIZE and the configured size. If the text doesn't fit even
+    at the minimum size it is elided. Results are memoized per (text, font,
+    box size), so repainting unchanged labels costs no measurement at all.
+    """
+
+    def __init__(self, maxsize=DEFAULT_FIT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._fits = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def fit(self, text, font, width, height):
+        """Return (font, text) to draw text in a width x height box"""
+        key = (text, font.key(), width, height)
+        result = self._fits.get(key)
+        if result is not None:
+            self._fits.move_to_end(key)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self._measure(text, font, width, height)
+        self._fits[key] = result
+        if len(self._fits) > self.maxsize:
+            self._fits.popitem(last=False)
+        return result
+
+    def _measure(self, text, font, width, height):
+        max_size = font_pixel_size(font)
+        if not text or width <= 0 or self._fits_at(text, font, max_size, width, height):
+            return font, text
+
+        low, high = MIN_FONT_PIXEL_SIZE, max_size - 1
+        best = None
+        while low <= high:
+            size = (low + high) // 2
+            if self._fits_at(text, font, size, width, height):
+                best = size
+                low = size + 1
+            else:
+                high = size - 1
+
+        if best is not None:
+            return self._sized(font, best), text
+
+        # Too long even at the minimum size; keep the minimum and elide the rest
+        smallest = self._sized(font, min(MIN_FONT_PIXEL_SIZE, max_size))
+        elided = QFontMetrics(smallest).elidedText(text, Qt.TextElideMode.ElideRight, width)
+        return smallest, elided
+
+    def _fits_at(self, text, font, size, width, height):
+        metrics = QFontMetrics(self._sized(font, size))
+        return metrics.horizontalAdvance(text) <= width and (height <= 0 or metrics.height() <= height)
+
+    @staticmethod
+    def _sized(font, size):
+        sized = QFont(font)
+        sized.setPixelSize(size)
+        return sized
+
+    def clear(self):
+        self._fits.clear()
+
+
+# Shared so identical strings in different labels are only measured once
+text_fitter = TextFitter()
+
+
+class FitLabel(QLabel):
+    """Single-line QLabel that shrinks its font (then elides) to fit its box
+
+    The label's font is the largest size used. The label
+    takes whatever width the layout gives it instead of growing to fit
+    the text.
+    """
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+
+    def minimumSizeHint(self):
+        hint = super().minimumSizeHint()
+        hint.setWidth(0)
+        return hint
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.drawFrame(painter)
+        rect = self.contentsRect()
+        font, text = text_fitter.fit(self.text(), self.font(), rect.width(), rect.height())
+        painter.setFont(font)
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawText(rect, self.alignment().value, text)
+        painter.end()
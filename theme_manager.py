@@ -0,0 +1,170 @@
+import os
+import re
+from pathlib import Path
+from PyQt6.QtCore import QFileSystemWatcher
+
+THEME_DIR = Path(__file__).parent
+THEMES = {
+    'default': 'style.qss',
+    'dark_teal': 'dark_teal22.qss',
+}
+DEFAULT_THEME = 'default'
+
+_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_PLACEHOLDER = re.compile(r'\{\{.*?\}\}|\{%.*?%\}', re.DOTALL)
+_PLACEHOLDER_MARK = '\x00'
+_URL = re.compile(r'url\(\s*["\']?([^"\')]+?)["\']?\s*\)')
+
+
+class ThemeError(Exception):
+    """A theme file couldn't be read or isn't a valid style sheet"""
+
+
+def parse_qss(text):
+    """Split a style sheet into (selectors, declarations) rules; raises ThemeError if it's malformed
+
+    Used to check a theme before it's applied: a stray brace makes Qt
+    drop every rule after it without a word. Unrendered template
+    placeholders ({{ ... }}, as left in style.qss by the theme it was
+    taken from) don't count as braces, and the declarations and
+    selectors holding them are left out; Qt skips those itself.
+    """
+    text = _PLACEHOLDER.sub(_PLACEHOLDER_MARK, _COMMENT.sub('', text))
+    rules = []
+    pos = 0
+    while True:
+        start = text.find('{', pos)
+        if start < 0:
+            if text[pos:].strip():
+                raise ThemeError(f"text after the last rule: {text[pos:].strip()[:40]!r}")
+            return rules
+        end = text.find('}', start)
+        if end < 0 or '{' in text[start + 1:end]:
+            line = text.count('\n', 0, start) + 1
+            raise ThemeError(f"unbalanced braces in the rule starting on line {line}")
+        if '}' in text[pos:start]:
+            line = text.count('\n', 0, start) + 1
+            raise ThemeError(f"unexpected '}}' before line {line}")
+        selectors = []
+        for selector in text[pos:start].split(','):
+            selector = ' '.join(selector.split())
+            if selector and _PLACEHOLDER_MARK not in selector:
+                selectors.append(selector)
+        declarations = []
+        for declaration in text[start + 1:end].split(';'):
+            declaration = declaration.strip()
+            if ':' in declaration and _PLACEHOLDER_MARK not in declaration:
+                declarations.append(declaration)
+        if selectors and declarations:
+            rules.append((selectors, declarations))
+        pos = end + 1
+
+
+def resolve_urls(text, base_dir):
+    """Point relative url()s at base_dir; Qt would resolve them against the working directory"""
+    def resolve(match):
+        path = match.group(1)
+        if path.startswith(':') or Path(path).is_absolute():  # Qt resource or already absolute
+            return match.group(0)
+        return f'url({Path(base_dir, path).as_posix()})'
+
+    return _URL.sub(resolve, text)
+
+
+class ThemeManager:
+    """Named QSS themes, each read and checked once, for the settings windows
+
+    A theme file is read and checked the first time it's needed, and the
+    result is kept until the file changes, so opening the config dialog
+    again doesn't read it again. The sheet is set on the windows passed
+    to themed() rather than on the QApplication: an application-wide
+    sheet makes Qt re-polish every widget as it's created (opening the
+    config dialog took over twice as long) and its font rules would
+    override the fonts the display sets on its labels. The current
+    theme's file is watched and re-applied to the open windows when it
+    changes; an edit that doesn't parse leaves the last good version.
+    """
+
+    def __init__(self, themes=THEMES, theme_dir=THEME_DIR):
+        self.themes = dict(themes)
+        self.theme_dir = Path(theme_dir)
+        self.current = None
+        self._sheets = {}  # theme name -> (file stat, style sheet)
+        self._sheet = ''  # Current theme's style sheet
+        self._widgets = []  # Open windows styled by the theme
+        self._watcher = None
+
+    def theme_names(self):
+        return list(self.themes)
+
+    def theme_path(self, name):
+        return self.theme_dir / self.themes[name]
+
+    def stylesheet(self, name):
+        """The theme's style sheet, read and checked again only when its file changed"""
+        path = self.theme_path(name)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise ThemeError(f"theme file unavailable: {e}") from e
+        stat = (stat.st_mtime_ns, stat.st_size)
+        cached = self._sheets.get(name)
+        if cached and cached[0] == stat:
+            return cached[1]
+        try:
+            text = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            raise ThemeError(f"couldn't read theme file: {e}") from e
+        if not parse_qss(text):
+            raise ThemeError("theme file holds no style rules")
+        sheet = resolve_urls(text, path.parent)
+        self._sheets[name] = (stat, sheet)
+        return sheet
+
+    def apply(self, name):
+        """Make name the current theme; an unknown or broken theme falls back to the default"""
+        if name not in self.themes:
+            print(f"Warning: Unknown theme '{name}'; using '{DEFAULT_THEME}' instead.")
+            name = DEFAULT_THEME
+        try:
+            sheet = self.stylesheet(name)
+        except ThemeError as e:
+            print(f"Warning: Could not load theme '{name}': {e}")
+            if name == DEFAULT_THEME or self.current is not None:
+                return
+            return self.apply(DEFAULT_THEME)
+        self.current = name
+        if sheet != self._sheet:
+            self._sheet = sheet
+            for widget in self._widgets:
+                widget.setStyleSheet(sheet)
+        self._watch(self.theme_path(name))
+
+    def themed(self, widget):
+        """Style widget and everything inside it (including its dialogs) with the current theme"""
+        if self.current is None:
+            self.apply(DEFAULT_THEME)
+        widget.setStyleSheet(self._sheet)
+        self._widgets.append(widget)
+        widget.destroyed.connect(lambda: self._widgets.remove(widget))
+
+    def _watch(self, path):
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher()
+            self._watcher.fileChanged.connect(self._on_file_changed)
+        for watched in self._watcher.files():
+            if watched != str(path):
+                self._watcher.removePath(watched)
+        if str(path) not in self._watcher.files() and path.exists():
+            self._watcher.addPath(str(path))
+
+    def _on_file_changed(self, path):
+        if self.current is None or str(self.theme_path(self.current)) != path:
+            return
+        # Editors that save by replacing the file drop it from the watch list; apply() re-adds it
+        if os.path.exists(path):
+            self.apply(self.current)
+
+
+# Shared by every settings window; MainApp applies the configured theme
+theme_manager = ThemeManager()
@@ -0,0 +1,208 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPalette, QPixmap, QPainter
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView, QFrame, QStyleOptionViewItem
+from text_fit import text_fitter
+
+SongRole = Qt.ItemDataRole.UserRole + 1
+SingerIdRole = Qt.ItemDataRole.UserRole + 2
+WaitRole = Qt.ItemDataRole.UserRole + 3
+
+ROW_PADDING = 10
+SEPARATOR_COLOR = '#3b3c3c'
+
+
+class UpNextModel(QAbstractListModel):
+    """Up-next rotation entries: dicts with singer_id, singer_name, song and (optionally) wait
+
+    set_entries() diffs against the current rows and only signals the rows
+    that actually changed, so the view only repaints those.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry['singer_name']
+        if role == SongRole:
+            return entry['song']
+        if role == SingerIdRole:
+            return entry['singer_id']
+        if role == WaitRole:
+            return entry.get('wait')
+        return None
+
+    def entries(self):
+        return list(self._entries)
+
+    def set_entries(self, entries):
+        old_count = len(self._entries)
+        new_count = len(entries)
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._entries[new_count:]
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._entries.extend(entries[old_count:])
+            self.endInsertRows()
+
+        # Signal each run of changed rows once
+        run_start = None
+        for row in range(min(old_count, new_count)):
+            changed = self._entries[row] != entries[row]
+            if changed:
+                self._entries[row] = entries[row]
+                if run_start is None:
+                    run_start = row
+            elif run_start is not None:
+                self.dataChanged.emit(self.index(run_start), self.index(row - 1))
+                run_start = None
+        if run_start is not None:
+            self.dataChanged.emit(self.index(run_start), self.index(min(old_count, new_count) - 1))
+
+    def set_waits(self, waits):
+        """Replace only the wait texts, from {singer_id: text}; signals just the rows whose text changed"""
+        for row, entry in enumerate(self._entries):
+            wait = waits.get(entry['singer_id'], entry.get('wait'))
+            if wait != entry.get('wait'):
+                self._entries[row] = dict(entry, wait=wait)
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [WaitRole])
+
+    def clear(self):
+        self.set_entries([])
+
+
+class UpNextDelegate(QStyledItemDelegate):
+    """Paints an up-next row: singer name with its wait estimate, song line and a separator"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.singer_font = QFont()
+        self.song_font = QFont()
+        self._row_height = None
+
+    def set_fonts(self, singer_font, song_font):
+        self.singer_font = singer_font
+        self.song_font = song_font
+        self._row_height = None
+
+    def row_height(self):
+        if self._row_height is None:
+            self._row_height = (QFontMetrics(self.singer_font).height() +
+                                QFontMetrics(self.song_font).height() + ROW_PADDING * 2 + 1)
+        return self._row_height
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.row_height())
+
+    def paint(self, painter, option, index):
+        rect = option.rect
+        song = index.data(SongRole)
+        singer_name = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        song_text = f" - {song}" if song else "No song queued."
+
+        singer_height = QFontMetrics(self.singer_font).height()
+        song_height = QFontMetrics(self.song_font).height()
+        singer_rect = QRect(rect.left(), rect.top() + ROW_PADDING, rect.width(), singer_height)
+        song_rect = QRect(rect.left(), singer_rect.bottom() + 1, rect.width(), song_height)
+
+        painter.save()
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        align = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter).value
+
+        wait = index.data(WaitRole)
+        if wait:
+            # Right-aligned on the singer line, which gives up the space it takes
+            wait_width = QFontMetrics(self.song_font).horizontalAdvance(wait)
+            painter.setFont(self.song_font)
+            painter.drawText(singer_rect, (Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter).value, wait)
+            singer_rect.setRight(singer_rect.right() - wait_width - ROW_PADDING)
+
+        font, text = text_fitter.fit(singer_name, self.singer_font, singer_rect.width(), singer_rect.height())
+        painter.setFont(font)
+        painter.drawText(singer_rect, align, text)
+
+        font, text = text_fitter.fit(song_text, self.song_font, song_rect.width(), song_rect.height())
+        painter.setFont(font)
+        painter.drawText(song_rect, align, text)
+
+        if index.row() < index.model().rowCount() - 1:
+            painter.setPen(QColor(SEPARATOR_COLOR))
+            painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
+        painter.restore()
+
+
+class UpNextView(QListView):
+    """Virtualized up-next list; only visible rows are laid out and painted"""
+    resized = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("upNextList")
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(50)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
+        self.up_next_model = UpNextModel(self)
+        self.up_next_delegate = UpNextDelegate(self)
+        self.setModel(self.up_next_model)
+        self.setItemDelegate(self.up_next_delegate)
+
+    def set_fonts(self, singer_font, song_font):
+        self.up_next_delegate.set_fonts(singer_font, song_font)
+        # Uniform item sizes are cached by the view; make it re-ask the delegate
+        self.scheduleDelayedItemsLayout()
+        self.viewport().update()
+
+    def row_height(self):
+        return self.up_next_delegate.row_height()
+
+    def rows_per_page(self):
+        return max(1, self.viewport().height() // self.row_height())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
+    def render_pages(self, entries):
+        """Paint entries offscreen into one pixmap per page of rows"""
+        rows_per_page = self.rows_per_page()
+        width = self.viewport().width()
+        row_height = self.row_height()
+        page_model = UpNextModel()
+        option = QStyleOptionViewItem()
+        option.initFrom(self)
+        option.palette = self.palette()
+
+        pages = []
+        for start in range(0, len(entries), rows_per_page):
+            page_entries = entries[start:start + rows_per_page]
+            page_model.set_entries(page_entries)
+            pixmap = QPixmap(width, rows_per_page * row_height)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            for row in range(len(page_entries)):
+                option.rect = QRect(0, row * row_height, width, row_height)
+                self.up_next_delegate.paint(painter, option, page_model.index(row))
+            painter.end()
+            pages.append(pixmap)
+        return pages
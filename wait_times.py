@@ -0,0 +1,89 @@
+import time
+import threading
+
+DEFAULT_CHANGEOVER_SECONDS = 60
+# Used for songs whose duration OpenKJ doesn't know
+DEFAULT_SONG_SECONDS = 240
+
+
+class WaitEstimator:
+    """Estimated start times for every singer in the rotation
+
+    Each singer starts after everyone ahead of them has sung their next song
+    plus a changeover allowance; singers with nothing queued are skipped.
+    Times are anchored to the moment the current singer took over, so they
+    stay put between refreshes instead of drifting with the clock. Offsets
+    are cumulative, so after a change only the rows from the first changed
+    position onward are recomputed; a new signup at the end of a 100-singer
+    rotation costs one row.
+    """
+
+    def __init__(self, changeover_seconds=DEFAULT_CHANGEOVER_SECONDS):
+        self.changeover_seconds = changeover_seconds
+        self._keys = []
+        self._offsets = [0.0]
+        self._anchor = None
+        self._lock = threading.Lock()
+        self.rows_recomputed = 0
+
+    def configure(self, changeover_seconds):
+        with self._lock:
+            if changeover_seconds != self.changeover_seconds:
+                self.changeover_seconds = changeover_seconds
+                self._keys = []
+                self._offsets = [0.0]
+
+    def update(self, rotation, now=None):
+        """Return estimated start times (Unix seconds) for [(singer_id, duration_seconds)]
+
+        duration_seconds is None for a singer with no song queued. The first
+        entry is the current singer, whose start is when they took over.
+        """
+        now = time.time() if now is None else now
+        keys = [(singer_id, duration) for singer_id, duration in rotation]
+        with self._lock:
+            return self._update(keys, now)
+
+    def _update(self, keys, now):
+        if not keys:
+            self._keys = []
+            self._offsets = [0.0]
+            self._anchor = None
+            return []
+
+        if self._anchor is None or not self._keys or self._keys[0][0] != keys[0][0]:
+            self._anchor = now
+            self._keys = []
+            self._offsets = [0.0]
+
+        # Offsets up to and including the first changed row are still valid
+        first_changed = 0
+        while (first_changed < len(keys) and first_changed < len(self._keys)
+               and keys[first_changed] == self._keys[first_changed]):
+            first_changed += 1
+        del self._offsets[first_changed + 1:]
+        for singer_id, duration in keys[first_changed:]:
+            turn = 0.0
+            if duration is not None:
+                turn = (duration or DEFAULT_SONG_SECONDS) + self.changeover_seconds
+            self._offsets.append(self._offsets[-1] + turn)
+        self.rows_recomputed += len(keys) - first_changed
+        self._keys = keys
+
+        starts = [self._anchor + offset for offset in self._offsets[:len(keys)]]
+        # If the current singer runs long, everyone after them slides back too
+        overrun = now - starts[1] if len(starts) > 1 and keys[0][1] is not None else 0
+        if overrun > 0:
+            starts = starts[:1] + [start + overrun for start in starts[1:]]
+        return starts
+
+
+def format_wait(start, now=None):
+    """Short guest-facing wait text such as "~12 min" """
+    now = time.time() if now is None else now
+    minutes = round((start - now) / 60)
+    if minutes <= 1:
+        return "< 1 min"
+    if minutes < 60:
+        return f"~{minutes} min"
+    return f"~{minutes // 60}h {minutes % 60:02d}m"
@@ -0,0 +1,88 @@
+import gzip
+import hashlib
+import mimetypes
+import threading
+from pathlib import Path
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+PAGE_CACHE_CONTROL = 'no-cache'  # Always revalidate; the ETag turns an unchanged page into a 304
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESS_SIZE = 512
+
+
+class Asset:
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha256(body).hexdigest()[:16]
+        self.gzipped = None
+        if mimetype.startswith(COMPRESSIBLE_TYPES) and len(body) >= MIN_COMPRESS_SIZE:
+            self.gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+
+
+class StaticAssets:
+    """The web display's static files, served under content-hashed names
+
+    display.css is served as display.<hash>.css, so a changed file gets a new
+    URL and browsers may cache every URL forever. Files are read and
+    gzipped once, when the server starts.
+    """
+
+    def __init__(self, static_dir):
+        self.static_dir = Path(static_dir)
+        self._names = {}  # display.css -> display.3f2a9c1b0d4e5f60.css
+        self._assets = {}  # display.3f2a9c1b0d4e5f60.css -> Asset
+        self.load()
+
+    def load(self):
+        names, assets = {}, {}
+        for path in sorted(self.static_dir.rglob('*')):
+            if not path.is_file():
+                continue
+            mimetype = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+            asset = Asset(path.read_bytes(), mimetype)
+            name = path.relative_to(self.static_dir).as_posix()
+            stem, dot, suffix = name.rpartition('.')
+            fingerprinted = f"{stem}.{asset.etag}.{suffix}" if dot else f"{name}.{asset.etag}"
+            names[name] = fingerprinted
+            assets[fingerprinted] = asset
+        self._names, self._assets = names, assets
+
+    def fingerprinted(self, name):
+        return self._names[name]
+
+    def get(self, fingerprinted):
+        return self._assets.get(fingerprinted)
+
+
+class PageCache:
+    """The rendered display page for the latest payload, kept compressed in memory
+
+    Rendering and compressing happen once per rotation change; every other
+    page load is served from memory.
+    """
+
+    def __init__(self, render):
+        self.render = render  # render(payload) -> HTML
+        self._key = None
+        self._page = None
+        self._lock = threading.Lock()
+
+    def get(self, key, payload):
+        with self._lock:
+            if self._page is None or key != self._key:
+                self._page = Asset(self.render(payload).encode('utf-8'), 'text/html')
+                self._key = key
+            return self._page
+
+
+def asset_response(response_class, request, asset, cache_control):
+    """Build the response for an Asset: a 304 if the client has it, gzipped if it accepts that"""
+    headers = {'Cache-Control': cache_control, 'ETag': f'"{asset.etag}"', 'Vary': 'Accept-Encoding'}
+    if asset.etag in request.if_none_match:
+        return response_class(status=304, headers=headers)
+    body = asset.body
+    if asset.gzipped is not None and 'gzip' in request.accept_encodings:
+        body = asset.gzipped
+        headers['Content-Encoding'] = 'gzip'
+    return response_class(body, mimetype=asset.mimetype, headers=headers)